@@ -0,0 +1,53 @@
+"""Benchmark the evaplib evaporation equations.
+
+Times Penman open water, Penman-Monteith reference, Makkink, Priestley-Taylor,
+and Penman-Monteith evaporation for `n` random days.  The kernels run as
+parallel numba ufuncs when numba is installed; pass ``--numpy`` to hide numba
+and time the pure numpy fallback instead.  The first call of each function,
+which includes the numba compilation, is not timed.
+
+Run with::
+
+    python benchmarks/bench_evaplib.py [n] [--numpy]
+"""
+
+import sys
+import timeit
+
+import numpy as np
+
+if "--numpy" in sys.argv:
+    sys.modules["numba"] = None
+
+from mettoolbox import _jit, evaplib  # noqa: E402
+
+
+def main(n=1_000_000, repeat=5):
+    rng = np.random.default_rng(42)
+    airtemp = rng.uniform(-20.0, 40.0, n)
+    rh = rng.uniform(10.0, 100.0, n)
+    airpress = rng.uniform(95000.0, 103000.0, n)
+    Rs = rng.uniform(1e6, 3e7, n)
+    Rext = rng.uniform(3e7, 4.5e7, n)
+    u = rng.uniform(0.5, 8.0, n)
+
+    funcs = {
+        "E0": lambda: evaplib.E0(airtemp, rh, airpress, Rs, Rext, u),
+        "ET0pm": lambda: evaplib.ET0pm(airtemp, rh, airpress, Rs, Rext, u),
+        "Em": lambda: evaplib.Em(airtemp, rh, airpress, Rs),
+        "Ept": lambda: evaplib.Ept(airtemp, rh, airpress, Rs, Rs / 20),
+        "Epm": lambda: evaplib.Epm(
+            airtemp, rh, airpress / 100, Rs, Rs / 20, 100.0, 70.0
+        ),
+    }
+
+    backend = "numpy" if _jit.numba is None else "numba"
+    print(f"{n} values, {backend}, best of {repeat}")
+    for name, func in funcs.items():
+        func()
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        print(f"{name:>10}: {best * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:] if arg.isdigit()))
@@ -0,0 +1,93 @@
+"""Benchmark the peak memory of the PET and disaggregation commands.
+
+Writes `n` stations of seventy years of daily minimum and maximum
+temperatures to a temporary CSV file and runs each command on it in a fresh
+subprocess, so that the reported peak resident set size of every command is
+independent of the others.  Run it in two checkouts to compare the memory
+use before and after a change.
+
+Run with::
+
+    python benchmarks/bench_memory.py [n]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+COMMANDS = {
+    "read only": """
+tsutils.common_kwds("{path}")
+""",
+    "pet hargreaves": """
+pet.hargreaves(29.65, "{path},1", "{path},2", "degC")
+""",
+    "pet allen": """
+pet.allen(29.65, "{path},1", "{path},2", "degC")
+""",
+    "disaggregate temperature": """
+disaggregate.temperature("sine_min_max", "degC", temp_min_col=[{mins}],
+                         temp_max_col=[{maxs}], input_ts="{path}")
+""",
+}
+
+PRELUDE = """
+import resource
+from mettoolbox import disaggregate, pet
+from mettoolbox.toolbox_utils.src.toolbox_utils import tsutils
+start = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+"""
+
+EPILOGUE = """
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(start, peak)
+"""
+
+
+def peak_rss(code):
+    """Run `code` in a new interpreter and return its peak RSS in MiB.
+
+    Returns the peak after the imports and the peak at the end of the
+    command, so that the memory used by the command itself is the
+    difference of the two.
+    """
+    out = subprocess.run(
+        [sys.executable, "-c", PRELUDE + code + EPILOGUE],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    start, peak = (int(value) / 1024 for value in out.split()[-2:])
+    return start, peak
+
+
+def main(n=20):
+    rng = np.random.default_rng(42)
+    index = pd.date_range("1950-01-01", "2019-12-31", freq="D")
+    tmin = rng.uniform(-10.0, 20.0, (len(index), n))
+    tmax = tmin + rng.uniform(1.0, 15.0, (len(index), n))
+    data = np.empty((len(index), 2 * n))
+    data[:, 0::2] = tmin
+    data[:, 1::2] = tmax
+    columns = [f"station{i}_{name}:degC" for i in range(n) for name in ("tmin", "tmax")]
+    mins = ", ".join(str(2 * i + 1) for i in range(n))
+    maxs = ", ".join(str(2 * i + 2) for i in range(n))
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "temperature.csv")
+        pd.DataFrame(data, index=index, columns=columns).to_csv(
+            path, index_label="Datetime"
+        )
+        print(f"{n} stations, {len(index)} days, peak RSS in MiB")
+        print(f"{'':>26}  {'imports':>8}  {'peak':>8}  {'command':>8}")
+        for name, code in COMMANDS.items():
+            start, peak = peak_rss(code.format(path=path, mins=mins, maxs=maxs))
+            print(f"{name:>26}: {start:8.1f}  {peak:8.1f}  {peak - start:8.1f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,44 @@
+"""Benchmark the unit conversion of many station columns.
+
+Converts `n` stations of ten years of daily temperatures from degF to degC
+with `tsutils.common_kwds`, which resolves the pint units of every column
+on every call, and with `utils._convert_units`, which looks up cached
+conversion factors and converts the whole table in one pass.
+
+Run with::
+
+    python benchmarks/bench_units.py [n]
+"""
+
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from mettoolbox import utils
+from mettoolbox.toolbox_utils.src.toolbox_utils import tsutils
+
+
+def main(n=200, repeat=5):
+    rng = np.random.default_rng(42)
+    index = pd.date_range("2000-01-01", periods=3650, freq="D")
+    tsd = pd.DataFrame(
+        rng.uniform(0.0, 100.0, (len(index), n)),
+        index=index,
+        columns=[f"station{i}:degF" for i in range(n)],
+    )
+
+    funcs = {
+        "common_kwds": lambda: tsutils.common_kwds(tsd, target_units=["degC"] * n),
+        "cached": lambda: utils._convert_units(tsd, None, "degC"),
+    }
+
+    print(f"{n} stations, {len(index)} days, best of {repeat}")
+    for name, func in funcs.items():
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        print(f"{name:>12}: {best * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
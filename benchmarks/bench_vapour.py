@@ -0,0 +1,56 @@
+"""Benchmark the fused vapour pressure kernel against the separate functions.
+
+Times the saturation vapour pressure, its slope, the psychrometric constant,
+the actual vapour pressure, and the vapour pressure deficit for `n` random
+temperatures, calculated with the separate functions and with one call to
+`calc_vapour` writing into preallocated arrays, and reports the peak memory
+allocated by each.
+
+Run with::
+
+    python benchmarks/bench_vapour.py [n]
+"""
+
+import sys
+import timeit
+import tracemalloc
+
+import numpy as np
+
+from mettoolbox import meteo_utils
+
+
+def _peak_memory(func):
+    """Peak memory in MB allocated while calling `func`."""
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def main(n=1_000_000, repeat=5):
+    rng = np.random.default_rng(42)
+    tmean = rng.uniform(-20.0, 40.0, n)
+    rh = rng.uniform(10.0, 100.0, n)
+    pressure = 101.3
+    out = tuple(np.empty(n) for _ in range(5))
+
+    def separate():
+        es = meteo_utils.calc_e0(tmean)
+        vpc = meteo_utils.calc_vpc(tmean)
+        psy = meteo_utils.calc_psy(pressure, tmean)
+        ea = meteo_utils.calc_ea(tmean=tmean, rh=rh)
+        return es, vpc, psy, ea, es - ea
+
+    def fused():
+        return meteo_utils.calc_vapour(tmean, pressure, rh=rh, out=out)
+
+    print(f"{n} values, best of {repeat}")
+    for name, func in (("separate", separate), ("fused", fused)):
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        print(f"{name:>10}: {best * 1e3:8.1f} ms {_peak_memory(func):8.1f} MB peak")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -1,8 +1,13 @@
 __all__ = [
+    "core",
     "disaggregate",
+    "get_dtype",
     "indices",
+    "interception",
     "pet",
     "ret",
+    "set_dtype",
 ]
 
-from . import disaggregate, indices, pet, ret
+from . import core, disaggregate, indices, interception, pet, ret
+from .utils import get_dtype, set_dtype
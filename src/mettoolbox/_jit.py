@@ -0,0 +1,52 @@
+"""Optional numba compilation of element-wise numerical kernels.
+
+Kernels are written as plain arithmetic on floats, without branches, so that
+the same function body works on numpy arrays and pandas objects and, when
+numba is installed, compiles to a parallel numpy ufunc.  Without numba the
+decorators return the function unchanged and the kernels run as ordinary
+numpy array expressions.
+"""
+
+import functools
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+__all__ = ["jit", "vectorize"]
+
+
+def jit(func):
+    """Compile an element-wise helper that is called from kernels."""
+    if numba is None:
+        return func
+    return numba.njit(cache=True)(func)
+
+
+def vectorize(nargs):
+    """Compile an element-wise kernel of `nargs` floats to a parallel ufunc.
+
+    The ufunc is compiled on the first call, so importing a module of
+    kernels stays cheap, and is cached on disk by numba between sessions.
+    Like any numpy ufunc it broadcasts its arguments and returns a pandas
+    object when given one.
+    """
+
+    def decorator(func):
+        if numba is None:
+            return func
+        compiled = []
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            if not compiled:
+                signature = f"float64({', '.join(['float64'] * nargs)})"
+                compiled.append(
+                    numba.vectorize([signature], target="parallel", cache=True)(func)
+                )
+            return compiled[0](*args)
+
+        return wrapper
+
+    return decorator
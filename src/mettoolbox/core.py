@@ -0,0 +1,248 @@
+"""Temperature based potential evaporation on plain arrays.
+
+The functions of this module are the formulas beneath the `pet` functions
+of the same names, without the file reading, unit conversion, and pandas
+index alignment.  Temperatures are in °C, latitudes in degrees, and the
+potential evaporation is returned in mm/day.  All of the arguments are
+numpy arrays, or scalars, that broadcast against each other, so for
+example a (days, 1) day of the year array and (stations,) latitudes
+calculate a (days, stations) table in one call::
+
+    import numpy as np
+    from mettoolbox import core
+
+    pet = core.hargreaves(tmin, tmax, doy[:, np.newaxis], lats)
+
+The solar terms are always calculated in float64.
+"""
+
+import numpy as np
+
+from mettoolbox.meteo_utils import calc_e0, solar_declination, sunset_angle
+
+__all__ = [
+    "allen",
+    "extraterrestrial_radiation",
+    "hamon",
+    "hargreaves",
+    "linacre",
+    "oudin_form",
+    "romanenko",
+]
+
+
+def _tmean(tmin, tmax, tmean):
+    """The mean temperature, estimated as the average of tmin and tmax."""
+    if tmean is None:
+        return (np.asarray(tmin) + np.asarray(tmax)) / 2
+    return np.asarray(tmean)
+
+
+def extraterrestrial_radiation(doy, lat):
+    """Daily extraterrestrial radiation [MJ m-2 day-1].
+
+    Uses the declination of [spencer_1971]_ and equation 21 of
+    [allen_1998]_.
+
+    Parameters
+    ----------
+    doy : array_like
+        day of the year (1-366)
+    lat : array_like
+        latitude [deg]
+
+    Returns
+    -------
+    numpy.ndarray
+        The extraterrestrial radiation in the broadcast shape of `doy` and
+        `lat`.
+
+    References
+    ----------
+    .. [spencer_1971] Spencer, J. W. (1971). Fourier series representation
+       of the position of the sun. Search, 2(5), 172.
+    """
+    doy = np.asarray(doy, dtype=np.float64)
+    lrad = np.deg2rad(np.asarray(lat, dtype=np.float64))
+    b = np.deg2rad((doy - 1) * (360 / 365))
+    dec = (
+        0.006918
+        - 0.399912 * np.cos(b)
+        + 0.070257 * np.sin(b)
+        - 0.006758 * np.cos(2 * b)
+        + 0.000907 * np.sin(2 * b)
+        - 0.002679 * np.cos(3 * b)
+        + 0.00148 * np.sin(3 * b)
+    )
+    ws = np.arccos(-np.tan(dec) * np.tan(lrad))
+    dr = 1.0 + 0.033 * np.cos(2 * np.pi * doy / 365)
+    return (
+        118.08
+        / np.pi
+        * dr
+        * (ws * np.sin(lrad) * np.sin(dec) + np.cos(lrad) * np.cos(dec) * np.sin(ws))
+    )
+
+
+def hamon(tmean, doy, lat, k=1.0):
+    """Potential evaporation of [hamon_1961]_ [mm day-1].
+
+    Parameters
+    ----------
+    tmean : array_like
+        daily mean temperature [°C]
+    doy : array_like
+        day of the year (1-366)
+    lat : array_like
+        latitude [deg]
+    k : float
+        scaling factor for local conditions
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+    sol_dec = solar_declination(np.asarray(doy, dtype=np.float64))
+    daylh = 24 / np.pi * sunset_angle(sol_dec, np.deg2rad(lat))
+    return k * (daylh / 12) ** 2 * np.exp(np.asarray(tmean) / 16)
+
+
+def romanenko(tmean, rh, k=4.5):
+    """Potential evaporation of [romanenko_1961]_ [mm day-1].
+
+    Parameters
+    ----------
+    tmean : array_like
+        daily mean temperature [°C]
+    rh : array_like
+        daily mean relative humidity [%]
+    k : float
+        scaling factor for local conditions
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+    tmean = np.asarray(tmean)
+    es = calc_e0(tmean)
+    ea = np.asarray(rh) / 100 * es
+    return k * (1 + tmean / 25) ** 2 * (1 - ea / es)
+
+
+def linacre(tmin, tmax, lat, elevation, tmean=None, tdew=None):
+    """Potential evaporation of [linacre_1977]_ [mm day-1].
+
+    Parameters
+    ----------
+    tmin : array_like
+        daily minimum temperature [°C]
+    tmax : array_like
+        daily maximum temperature [°C]
+    lat : array_like
+        latitude [deg]
+    elevation : array_like
+        elevation [m]
+    tmean : array_like, optional
+        daily mean temperature [°C], the average of `tmin` and `tmax` if
+        None
+    tdew : array_like, optional
+        daily mean dewpoint temperature [°C], estimated from `tmin` and
+        `tmax` if None
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+    tmin = np.asarray(tmin)
+    tmax = np.asarray(tmax)
+    tmean = _tmean(tmin, tmax, tmean)
+    if tdew is None:
+        tdew = 0.52 * tmin + 0.6 * tmax - 0.009 * tmax**2 - 2
+    tm = tmean + 0.006 * np.asarray(elevation)
+    return (500 * tm / (100 - np.asarray(lat)) + 15 * (tmean - tdew)) / (80 - tmean)
+
+
+def hargreaves(tmin, tmax, doy, lat, tmean=None):
+    """Hargreaves potential evaporation [mm day-1].
+
+    Parameters
+    ----------
+    tmin : array_like
+        daily minimum temperature [°C]
+    tmax : array_like
+        daily maximum temperature [°C]
+    doy : array_like
+        day of the year (1-366)
+    lat : array_like
+        latitude [deg]
+    tmean : array_like, optional
+        daily mean temperature [°C], the average of `tmin` and `tmax` if
+        None
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+    tmin = np.asarray(tmin)
+    tmax = np.asarray(tmax)
+    tmean = _tmean(tmin, tmax, tmean)
+    ra = extraterrestrial_radiation(doy, lat)
+    return 0.408 * 0.0023 * ra * (tmax - tmin) ** 0.5 * (tmean + 17.8)
+
+
+def oudin_form(tmean, doy, lat, k1=100, k2=5):
+    """Potential evaporation of [oudin_2005]_ [mm day-1].
+
+    Zero where `tmean` + `k2` is below zero.
+
+    Parameters
+    ----------
+    tmean : array_like
+        daily mean temperature [°C]
+    doy : array_like
+        day of the year (1-366)
+    lat : array_like
+        latitude [deg]
+    k1 : float
+        scaling parameter
+    k2 : float
+        the negative of the temperature [°C] at which the potential
+        evaporation is zero
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+    tmean = np.asarray(tmean)
+    ra = extraterrestrial_radiation(doy, lat)
+    gamma = 2.45  # the latent heat flux (MJ kg−1)
+    rho = 1000.0  # density of water (kg m-3)
+    return ra / (gamma * rho) * np.maximum(tmean + k2, 0.0) / k1 * 1000
+
+
+def allen(tmin, tmax, doy, lat, tmean=None):
+    """Allen potential evaporation [mm day-1].
+
+    Parameters
+    ----------
+    tmin : array_like
+        daily minimum temperature [°C]
+    tmax : array_like
+        daily maximum temperature [°C]
+    doy : array_like
+        day of the year (1-366)
+    lat : array_like
+        latitude [deg]
+    tmean : array_like, optional
+        daily mean temperature [°C], the average of `tmin` and `tmax` if
+        None
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+    tmin = np.asarray(tmin)
+    tmax = np.asarray(tmax)
+    tmean = _tmean(tmin, tmax, tmean)
+    ra = extraterrestrial_radiation(doy, lat)
+    return 0.408 * 0.0029 * ra * (tmax - tmin) ** 0.4 * (tmean + 20)
@@ -0,0 +1,144 @@
+"""Sub-daily data held as a (days, slots) matrix.
+
+The disaggregation methods mostly broadcast daily values to each hour, shape
+them with a diurnal course, and correct them back to the daily mean.  With
+the time slots of a day as a row of a contiguous (days, slots) array, or
+(days, slots, columns) for several columns, these become numpy broadcasts
+and reductions along axis 1.  There are 24 slots for hourly data and more
+for a sub-hourly `target_freq`, for example 96 for 15 minutes.  Days are
+always a complete daily range so that the matrix reshapes to and from a
+regular index, and DataFrames are only built at the output with `to_frame`.
+"""
+
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from .toolbox_utils.src.toolbox_utils import tsutils
+
+__all__ = [
+    "slots_per_day",
+    "slot_hours",
+    "slot_weights",
+    "daily_range",
+    "hourly_index",
+    "to_day_matrix",
+    "broadcast_daily",
+    "correct_daily_mean",
+    "next_day",
+    "to_frame",
+]
+
+
+def slots_per_day(target_freq=None):
+    """Number of time slots in a day for the pandas offset `target_freq`.
+
+    None is hourly, 24 slots.
+    """
+    if target_freq is None:
+        return 24
+    try:
+        step = pd.Timedelta(pd.tseries.frequencies.to_offset(target_freq))
+    except ValueError:
+        step = None
+    if step is None or step <= pd.Timedelta(0) or pd.Timedelta(days=1) % step:
+        raise ValueError(
+            tsutils.error_wrapper(
+                f"""
+                The `target_freq` must be a fixed time step that divides a
+                day evenly, for example "h", "30min", "15min", or "5min".  You
+                gave "{target_freq}".
+                """
+            )
+        )
+    return int(pd.Timedelta(days=1) / step)
+
+
+def slot_hours(slots=24):
+    """Start of each of the `slots` time slots of a day in hours."""
+    return np.arange(slots) * (24.0 / slots)
+
+
+def slot_weights(nfrom, nto=24):
+    """Matrix that distributes `nfrom` equal parts of a day onto `nto` slots.
+
+    Entry [i, j] is the fraction of part i that falls in slot j, so each row
+    sums to 1 and a (days, nfrom) matrix of totals times this matrix is the
+    (days, nto) matrix of totals.
+    """
+    # In units of 1 / (nfrom * nto) of a day so the overlaps are exact.
+    from_start = np.arange(nfrom)[:, np.newaxis] * nto
+    to_start = np.arange(nto)[np.newaxis, :] * nfrom
+    overlap = np.minimum(from_start + nto, to_start + nfrom) - np.maximum(
+        from_start, to_start
+    )
+    return np.clip(overlap, 0, None) / nto
+
+
+def daily_range(index):
+    """Complete range of days that covers every value in `index`."""
+    return pd.date_range(start=index[0].floor("D"), end=index[-1].floor("D"), freq="D")
+
+
+def hourly_index(days, slots=24):
+    """Index of every time slot of the complete daily range `days`.
+
+    Hourly for the default of 24 slots a day.
+    """
+    return pd.date_range(
+        start=days[0],
+        periods=len(days) * slots,
+        freq=pd.tseries.frequencies.to_offset(pd.Timedelta(days=1) / slots),
+    )
+
+
+def to_day_matrix(hourly, days=None, slots=24):
+    """Sub-daily Series or DataFrame to a (days, slots[, columns]) array.
+
+    Slots missing from `hourly` are NaN.  If `days` is None the days cover
+    the index of `hourly`.
+    """
+    if days is None:
+        days = daily_range(hourly.index)
+    values = hourly.reindex(hourly_index(days, slots)).to_numpy(dtype=float)
+    return values.reshape((len(days), slots) + values.shape[1:])
+
+
+def broadcast_daily(daily, days=None, slots=24):
+    """Daily Series or DataFrame repeated to each time slot of the day.
+
+    Returns a writable (days, slots[, columns]) array.  Missing days are NaN.
+    """
+    if days is None:
+        days = daily_range(daily.index)
+    values = daily.reindex(days).to_numpy(dtype=float)
+    return np.repeat(values[:, np.newaxis], slots, axis=1)
+
+
+def correct_daily_mean(matrix, daily_mean):
+    """Shift each day of `matrix` so that its mean is `daily_mean`.
+
+    Days where either the hourly or the daily mean is missing are left
+    unchanged.
+    """
+    with warnings.catch_warnings():
+        # All NaN days.
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        bias = np.nanmean(matrix, axis=1) - daily_mean
+    return matrix - np.nan_to_num(bias)[:, np.newaxis]
+
+
+def next_day(matrix):
+    """The rows of `matrix` shifted up one day, repeating the last day."""
+    return np.concatenate([matrix[1:], matrix[-1:]])
+
+
+def to_frame(matrix, days, columns):
+    """A (days, slots[, columns]) array as a DataFrame with a sub-daily index."""
+    slots = matrix.shape[1]
+    return pd.DataFrame(
+        matrix.reshape(len(days) * slots, -1),
+        index=hourly_index(days, slots),
+        columns=columns,
+    )
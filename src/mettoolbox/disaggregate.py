@@ -1,7 +1,8 @@
-import datetime
+import os
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import suppress
-from typing import Literal, Optional, Union
+from typing import List, Literal, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -9,6 +10,18 @@ from pydantic import PositiveInt, confloat
 from tstoolbox import tstoolbox
 
 from mettoolbox import tdew as tdew_melo
+from mettoolbox import temperature as temperature_slots
+from mettoolbox.cascade import calculate_cascade_statistics, disaggregate_cascade
+from mettoolbox.daymatrix import (
+    broadcast_daily,
+    daily_range,
+    hourly_index,
+    slot_hours,
+    slot_weights,
+    slots_per_day,
+    to_day_matrix,
+    to_frame,
+)
 from mettoolbox.melodist.melodist.humidity import (
     calculate_month_hour_precip_mean,
     disaggregate_humidity,
@@ -18,14 +31,20 @@ from mettoolbox.melodist.melodist.temperature import (
     disaggregate_temperature,
     get_shift_by_data,
 )
-from mettoolbox.melodist.melodist.util.util import (
-    calculate_mean_daily_course_by_month,
-    get_sun_times,
-)
-from mettoolbox.melodist.melodist.wind import disaggregate_wind
+from mettoolbox.melodist.melodist.util.util import calculate_mean_daily_course_by_month
 from mettoolbox.mettoolbox_utils import _LOCAL_DOCSTRINGS
 from mettoolbox.toolbox_utils.src.toolbox_utils import tsutils
-from mettoolbox.toolbox_utils.src.toolbox_utils.utils import pandas_offset_by_version
+from mettoolbox.utils import (
+    _convert_units,
+    _daily_uniforms,
+    _float_frame,
+    _return_input,
+    cached_sun_times,
+    get_dtype,
+    load_sun_times,
+    potential_radiation,
+    save_sun_times,
+)
 
 try:
     from pydantic import validate_arguments as validate_call
@@ -40,6 +59,7 @@ __all__ = [
     "radiation",
     "precipitation",
     "evaporation",
+    "all_variables",
 ]
 
 
@@ -68,6 +88,141 @@ def single_target_units(source_units, target_units, default=None, cnt=1):
     return [target_units[0]] * len(source_units)
 
 
+def _column_list(cols):
+    """Column names or numbers as a list, with one entry for each station."""
+    if cols is None:
+        return []
+    if isinstance(cols, (pd.Series, pd.DataFrame)):
+        return [cols]
+    cols = tsutils.make_list(cols)
+    for index, col in enumerate(cols):
+        with suppress(TypeError, ValueError):
+            cols[index] = int(col)
+    return cols
+
+
+def _station_values(values, nstations, name, lower, upper):
+    """Broadcast a scalar, list, or comma separated string to each station."""
+    if values is None:
+        return [None] * nstations
+    values = [float(i) for i in tsutils.make_list(values)]
+    if len(values) == 1:
+        values = values * nstations
+    if len(values) != nstations:
+        raise ValueError(
+            tsutils.error_wrapper(
+                f"""
+                The keyword "{name}" needs either one value for all stations or
+                one value for each of the {nstations} stations.  You gave
+                {values}.
+                """
+            )
+        )
+    bad = [i for i in values if not lower <= i <= upper]
+    if bad:
+        raise ValueError(
+            tsutils.error_wrapper(
+                f"""
+                The keyword "{name}" must be between {lower} and {upper}.  You
+                gave {bad}.
+                """
+            )
+        )
+    return values
+
+
+def _long_to_wide(tsd, station_col, temp_min_col, temp_max_col, temp_mean_col):
+    """Pivot a long-format table to a pair of columns for each station.
+
+    Returns the wide table, the lists of minimum, maximum, and mean
+    temperature columns in the wide table, and the station names in the order
+    the stations first appear.
+    """
+
+    def _name(col):
+        with suppress(TypeError, ValueError):
+            return tsd.columns[int(col) - 1]
+        return col
+
+    station_col = _name(station_col)
+    values = [_name(temp_min_col), _name(temp_max_col)]
+    if temp_mean_col is not None:
+        values.append(_name(temp_mean_col))
+
+    stations = pd.unique(tsd[station_col])
+    wide = tsd.pivot(columns=station_col, values=values)
+    wide = wide[[(value, station) for station in stations for value in values]]
+    wide.columns = [f"{station}_{value}" for value, station in wide.columns]
+
+    def _station_column_list(value):
+        return [f"{station}_{value}" for station in stations]
+
+    return (
+        wide,
+        _station_column_list(values[0]),
+        _station_column_list(values[1]),
+        _station_column_list(values[2]) if temp_mean_col is not None else None,
+        [str(station) for station in stations],
+    )
+
+
+def _station_name(min_col, max_col):
+    """Common part of the minimum and maximum column names of a station."""
+    names = [str(min_col).split(":")[0], str(max_col).split(":")[0]]
+    prefix = os.path.commonprefix(names)
+    if prefix not in names:
+        # Only keep whole words, so "Avon_Min" and "Avon_Max" give "Avon".
+        prefix = prefix[: max(prefix.rfind(sep) for sep in " _-.") + 1]
+    return prefix.rstrip(" _-.")
+
+
+def _check_temperature_station(tsd, temp_min_col, temp_max_col):
+    """Check the minimum and maximum temperatures of one station."""
+    if any((tsd.tmax <= tsd.tmin).dropna()):
+        raise ValueError(
+            tsutils.error_wrapper(
+                f"""
+                On the following dates:
+
+                {tsd[tsd.tmax <= tsd.tmin].index},
+
+                minimum temperature values in column "{temp_min_col}" are
+                greater than or equal to the maximum temperature values in
+                column "{temp_max_col}".
+                """
+            )
+        )
+
+
+def _temperature_station(tsd, sun_times, kwds, slots=24):
+    """Disaggregate the daily tmin, tmax, and temp of one station."""
+    if slots == 24:
+        return disaggregate_temperature(tsd, sun_times=sun_times, **kwds)
+    return to_frame(
+        temperature_slots.disaggregate_temperature(
+            tsd, sun_times=sun_times, slots=slots, **kwds
+        ),
+        daily_range(tsd.index),
+        ["temp"],
+    )
+
+
+def _stack_stations(results, nstations):
+    """Copy the disaggregated series of each station into one 2-D block.
+
+    The results are consumed one at a time, so only the block and the
+    result of a single station are in memory at once instead of every
+    station result plus their concatenation.
+    """
+    block = index = None
+    for station, result in enumerate(results):
+        if block is None:
+            index = result.index
+            block = np.empty((len(index), nstations), dtype=get_dtype())
+        block[:, station] = np.asarray(result).reshape(-1)
+    return pd.DataFrame(block, index=index)
+
+
 @validate_call(config={"arbitrary_types_allowed": True})
 @tsutils.doc(_LOCAL_DOCSTRINGS)
 def temperature(
@@ -89,12 +244,28 @@ def temperature(
     print_input=False,
     target_units=None,
     max_delta: bool = False,
-    temp_min_col: Optional[Union[PositiveInt, str, pd.Series]] = None,
-    temp_max_col: Optional[Union[PositiveInt, str, pd.Series]] = None,
-    temp_mean_col: Optional[Union[PositiveInt, str, pd.Series]] = None,
-    lat: Optional[confloat(ge=-90, le=90)] = None,
-    lon: Optional[confloat(ge=-180, le=180)] = None,
+    temp_min_col: Optional[
+        Union[PositiveInt, str, pd.Series, List[Union[PositiveInt, str]]]
+    ] = None,
+    temp_max_col: Optional[
+        Union[PositiveInt, str, pd.Series, List[Union[PositiveInt, str]]]
+    ] = None,
+    temp_mean_col: Optional[
+        Union[PositiveInt, str, pd.Series, List[Union[PositiveInt, str]]]
+    ] = None,
+    lat: Optional[
+        Union[confloat(ge=-90, le=90), List[confloat(ge=-90, le=90)], str]
+    ] = None,
+    lon: Optional[
+        Union[confloat(ge=-180, le=180), List[confloat(ge=-180, le=180)], str]
+    ] = None,
     hourly: Optional[Union[str, pd.Series]] = None,
+    hourly_lat: Optional[confloat(ge=-90, le=90)] = None,
+    hourly_lon: Optional[confloat(ge=-180, le=180)] = None,
+    station_col: Optional[Union[PositiveInt, str]] = None,
+    n_jobs: PositiveInt = 1,
+    sun_times_cache: Optional[str] = None,
+    target_freq: Optional[str] = None,
 ):
     """
     Disaggregate daily temperature to hourly temperature.
@@ -118,6 +289,13 @@ def temperature(
     |               | `temp_max_col`.                                        |
     +---------------+--------------------------------------------------------+
 
+    Several stations can be disaggregated at once, either by giving lists of
+    paired columns to `temp_min_col`, `temp_max_col`, and optionally
+    `temp_mean_col`, or from a long-format table with one row per station
+    and day where the station identifier is in the `station_col` column.
+    The sunrise, sun noon, and sunset times are calculated once for each
+    distinct `lat`/`lon` pair and shared by all stations at that location.
+
     Parameters
     ----------
     method : str
@@ -182,36 +360,72 @@ def temperature(
     ${target_units}
     ${print_input}
     ${tablefmt}
-    temp_min_col : str, int
+    temp_min_col : str, int, list
         The column name or number (data columns start numbering at 1) in
-        the input data that represents the daily minimum temperature.
-    temp_max_col : str, int
+        the input data that represents the daily minimum temperature.  A
+        list, or a comma separated string, of columns disaggregates several
+        stations, paired in order with `temp_max_col`.
+    temp_max_col : str, int, list
         The column name or number (data columns start numbering at 1) in
-        the input data that represents the daily maximum temperature.
-    temp_mean_col : str, int
+        the input data that represents the daily maximum temperature.  Must
+        have the same number of columns as `temp_min_col`.
+    temp_mean_col : str, int, list
         The column name or number (data columns start numbering at 1) in
         the input data that represents the daily mean temperature.  If
         None will be estimated by the average of `temp_min_col` and
-        `temp_max_col`.
-    lat : float
+        `temp_max_col`.  If given must have the same number of columns as
+        `temp_min_col`.
+    lat : float, list
         The latitude of the station.  Required if `min_max_time` is
-        "sun_loc" or "sun_loc_shift".
-    lon : float
+        "sun_loc" or "sun_loc_shift".  With several stations either a
+        single latitude used for all stations or one for each station.
+    lon : float, list
         The longitude of the station.  Required if `min_max_time` is
-        "sun_loc" or "sun_loc_shift".
+        "sun_loc" or "sun_loc_shift".  With several stations either a
+        single longitude used for all stations or one for each station.
     hourly : str
         File name that contains the hourly time series of temperatures
         to use when `method` is "mean_course_min" or "mean_course_mean"
-        or when `max_delta` is True.
+        or when `max_delta` is True.  The same hourly observations are used
+        for all stations.
+    hourly_lat : float
+        The latitude of the station of the `hourly` observations.  Defaults
+        to the latitude of the first station.
+    hourly_lon : float
+        The longitude of the station of the `hourly` observations.  Defaults
+        to the longitude of the first station.  The time zone of the
+        `hourly` observations is taken as the nearest multiple of 15
+        degrees of `hourly_lon`.
     max_delta : bool
         Uses maximum delta of hourly values for each month to constrain
         the disaggregated hourly temperature values.  If set to True
         requires an hourly time-series filename specified with the
-        `hourly` keyword.
+        `hourly` keyword.  The delta is the mean monthly difference between
+        the observed hour of the maximum and the sun noon at `hourly_lat`
+        and `hourly_lon`, and is applied to every station relative to the
+        sun noon of that station.
+    station_col : str, int
+        If given the input is a long-format table with one row for each
+        station and day, and this is the column name or number (data
+        columns start numbering at 1) that identifies the station.  Then
+        `temp_min_col`, `temp_max_col`, and `temp_mean_col` are single
+        columns of the long table and `lat` and `lon` lists are in the order
+        the stations first appear in the table.
+    n_jobs : int
+        Number of worker processes used to disaggregate the stations.  The
+        default of 1 disaggregates the stations one after the other in this
+        process.
+    sun_times_cache : str
+        Optional CSV file name used to keep the sunrise, sun noon, and
+        sunset tables between runs.  The tables are calculated once for
+        each location and day of the year.  If the file exists the tables
+        in it are used and any new locations are added to it.
+    ${target_freq}
+        For a sub-hourly step the times of the minimum and maximum are
+        rounded to the step rather than to the hour.
     """
-    target_units = single_target_units(source_units, target_units, "degC")
-
     pd.options.display.width = 60
+    slots = slots_per_day(target_freq)
 
     if (
         method in ("mean_course_min_max", "mean_course_mean")
@@ -229,6 +443,48 @@ def temperature(
             )
         )
 
+    if temp_min_col is None or temp_max_col is None:
+        raise ValueError(
+            tsutils.error_wrapper(
+                f"""
+                For "temperature" disaggregation you need to supply the daily
+                minimum column (name or number, data column numbering starts at
+                1) and the daily maximum column (name or number).
+
+                Instead `temp_min_col` is {temp_min_col} and `temp_max_col` is
+                {temp_max_col}
+                """
+            )
+        )
+
+    tsd = tsutils.read_iso_ts(
+        input_ts, skiprows=skiprows, names=names, index_type=index_type
+    )
+
+    station_names = None
+    if station_col is not None:
+        tsd, temp_min_col, temp_max_col, temp_mean_col, station_names = _long_to_wide(
+            tsd, station_col, temp_min_col, temp_max_col, temp_mean_col
+        )
+
+    min_cols = _column_list(temp_min_col)
+    max_cols = _column_list(temp_max_col)
+    mean_cols = _column_list(temp_mean_col)
+    nstations = len(min_cols)
+    if len(max_cols) != nstations or len(mean_cols) not in (0, nstations):
+        raise ValueError(
+            tsutils.error_wrapper(
+                f"""
+                Each station needs one minimum and one maximum temperature
+                column, and if given one mean temperature column.  You gave
+                {len(min_cols)} minimum, {len(max_cols)} maximum, and
+                {len(mean_cols)} mean temperature columns.
+                """
+            )
+        )
+    lats = _station_values(lat, nstations, "lat", -90, 90)
+    lons = _station_values(lon, nstations, "lon", -180, 180)
+
     if (
         method in ("mean_course_min_max", "mean_course_mean")
         or min_max_time == "sun_loc_shift"
@@ -240,72 +496,54 @@ def temperature(
         )
 
         if min_max_time == "sun_loc_shift" or max_delta:
-            max_delta = get_shift_by_data(hourly.squeeze(), lon, lat, round(lon / 15.0))
+            if hourly_lat is None:
+                hourly_lat = lats[0]
+            if hourly_lon is None:
+                hourly_lon = lons[0]
+            max_delta = get_shift_by_data(
+                hourly.squeeze(), hourly_lon, hourly_lat, round(hourly_lon / 15.0)
+            )
         else:
             max_delta = None
     else:
         mean_course = None
 
-    if temp_min_col is None or temp_max_col is None:
-        raise ValueError(
-            tsutils.error_wrapper(
-                f"""
-                For "temperature" disaggregation you need to supply the daily
-                minimum column (name or number, data column numbering starts at
-                1) and the daily maximum column (name or number).
-
-                Instead `temp_min_col` is {temp_min_col} and `temp_max_col` is
-                {temp_max_col}
-                """
-            )
-        )
-
-    with suppress(TypeError):
-        temp_min_col = int(temp_min_col)
-    with suppress(TypeError):
-        temp_max_col = int(temp_max_col)
-
-    columns = [temp_min_col, temp_max_col]
-    if temp_mean_col is not None:
-        with suppress(TypeError):
-            temp_mean_col = int(temp_mean_col)
-        columns.append(temp_mean_col)
+    columns = []
+    for station in range(nstations):
+        columns.extend([min_cols[station], max_cols[station]])
+        if mean_cols:
+            columns.append(mean_cols[station])
+
+    # One unit given for all of the temperature columns.
+    source_units = tsutils.make_list(source_units)
+    if len(source_units) == 1:
+        source_units = source_units * len(columns)
+    target_units = single_target_units(source_units, target_units, "degC")
 
     tsd = tsutils.common_kwds(
-        tsutils.read_iso_ts(
-            input_ts, skiprows=skiprows, names=names, index_type=index_type
-        ),
+        tsd,
         start_date=start_date,
         end_date=end_date,
         pick=columns,
         round_index=round_index,
         dropna=dropna,
-        source_units=source_units,
-        target_units=target_units,
         clean=clean,
     )
+    tsd = _convert_units(tsd, source_units, target_units)
 
-    if len(tsd.columns) == 3:
-        tsd.columns = ("tmin", "tmax", "temp")
-    else:
-        tsd.columns = ("tmin", "tmax")
-
-    if any((tsd.tmax <= tsd.tmin).dropna()):
-        raise ValueError(
-            tsutils.error_wrapper(
-                f"""
-                On the following dates:
-
-                {tsd[tsd.tmax <= tsd.tmin].index},
-
-                minimum temperature values in column "{temp_min_col}" are
-                greater than or equal to the maximum temperature values in
-                column "{temp_max_col}".
-                """
+    ncols = 3 if mean_cols else 2
+    if station_names is None:
+        station_names = [
+            _station_name(
+                tsd.columns[station * ncols], tsd.columns[station * ncols + 1]
             )
-        )
+            or str(station + 1)
+            for station in range(nstations)
+        ]
+        if len(set(station_names)) < nstations:
+            station_names = [str(station + 1) for station in range(nstations)]
 
-    if temp_mean_col is None:
+    if not mean_cols:
         warnings.warn(
             tsutils.error_wrapper(
                 """
@@ -315,22 +553,22 @@ def temperature(
                 """
             )
         )
-        tsd["temp"] = (tsd.tmin + tsd.tmax) / 2.0
 
-        if any((tsd.tmin >= tsd.temp).dropna()) or any((tsd.tmax <= tsd.temp).dropna()):
-            raise ValueError(
-                tsutils.error_wrapper(
-                    f"""
-                    On the following dates:
-
-                    {tsd[tsd.tmin >= tsd.temp | tsd.tmax <= tsd.temp]},
-
-                    the daily average is either below or equal to the minimum
-                    temperature in column {temp_min_col} or higher or equal to
-                    the maximum temperature in column {temp_max_col}.
-                    """
-                )
-            )
+    # One (days, stations, 3) block of tmin, tmax, and temp that the frame
+    # of each station is a view of.  Without mean columns the block is
+    # allocated with room for the estimated mean temperature.
+    values = tsd.to_numpy(dtype=get_dtype()).reshape(len(tsd.index), nstations, ncols)
+    if ncols == 2:
+        values = np.concatenate(
+            [values, np.mean(values, axis=2, keepdims=True)], axis=2
+        )
+    stations = []
+    for station in range(nstations):
+        std = pd.DataFrame(
+            values[:, station, :], index=tsd.index, columns=("tmin", "tmax", "temp")
+        )
+        _check_temperature_station(std, min_cols[station], max_cols[station])
+        stations.append(std)
 
     if min_max_time == "fix":
         # Not dependent on sun, just average values.
@@ -341,7 +579,8 @@ def temperature(
         sun_times.sunnoon = 12
         sun_times.sunset = 19
         sun_times.daylength = 12
-    elif lat is None or lon is None:
+        station_sun_times = [sun_times] * nstations
+    elif None in lats or None in lons:
         raise ValueError(
             tsutils.error_wrapper(
                 f"""
@@ -360,23 +599,66 @@ def temperature(
         )
 
     else:
-        sun_times = get_sun_times(tsd.index, float(lon), float(lat), round(lon / 15.0))
-
-    ntsd = pd.DataFrame(
-        disaggregate_temperature(
-            tsd,
-            method=method,
-            min_max_time=min_max_time,
-            mod_nighttime=mod_nighttime,
-            max_delta=max_delta,
-            mean_course=mean_course,
-            sun_times=sun_times,
+        # Stations at the same location share one sun times table.
+        if sun_times_cache is not None:
+            load_sun_times(sun_times_cache)
+        by_location = {}
+        for slat, slon in zip(lats, lons):
+            if (slat, slon) not in by_location:
+                by_location[(slat, slon)] = cached_sun_times(tsd.index, slat, slon)
+        station_sun_times = [
+            by_location[(slat, slon)] for slat, slon in zip(lats, lons)
+        ]
+        if sun_times_cache is not None:
+            save_sun_times(sun_times_cache)
+
+    kwds = {
+        "method": method,
+        "min_max_time": min_max_time,
+        "mod_nighttime": mod_nighttime,
+        "max_delta": max_delta,
+        "mean_course": mean_course,
+    }
+    if n_jobs > 1 and nstations > 1:
+        with ProcessPoolExecutor(max_workers=min(n_jobs, nstations)) as executor:
+            ntsd = _stack_stations(
+                executor.map(
+                    _temperature_station,
+                    stations,
+                    station_sun_times,
+                    [kwds] * nstations,
+                    [slots] * nstations,
+                ),
+                nstations,
+            )
+    else:
+        ntsd = _stack_stations(
+            (
+                _temperature_station(std, sun_times, kwds, slots)
+                for std, sun_times in zip(stations, station_sun_times)
+            ),
+            nstations,
         )
-    )
 
-    ntsd.columns = [f"temperature:{target_units[0]}:disagg"]
+    if nstations == 1:
+        tsd = stations[0]
+        ntsd.columns = [f"temperature:{target_units[0]}:disagg"]
+    else:
+        if print_input:
+            tsd = pd.DataFrame(
+                values.reshape(len(tsd.index), -1),
+                index=tsd.index,
+                columns=[
+                    f"{col}_{name}"
+                    for name in station_names
+                    for col in stations[0].columns
+                ],
+            )
+        ntsd.columns = [
+            f"temperature_{name}:{target_units[0]}:disagg" for name in station_names
+        ]
 
-    return tsutils.return_input(print_input, tsd, ntsd)
+    return _return_input(print_input, tsd, ntsd)
 
 
 @validate_call(config={"arbitrary_types_allowed": True})
@@ -599,6 +881,8 @@ def prepare_hum_tdew(
 
         elif method == "month_hour_precip_mean":
             tsd.columns = ["precip"]
+    tsd = _float_frame(tsd)
+
     if disagg_type == "humidity":
         if method in [
             "minimal",
@@ -607,7 +891,7 @@ def prepare_hum_tdew(
             "min_max",
         ]:
             hourly_temp = tstoolbox.read(hourly_temp)
-            hourly_temp = hourly_temp.astype(float).squeeze()
+            hourly_temp = hourly_temp.astype(get_dtype()).squeeze()
     elif disagg_type == "dewpoint":
         if method in [
             "equal",
@@ -618,11 +902,16 @@ def prepare_hum_tdew(
             "month_hour_precip_mean",
         ]:
             hourly_temp = tstoolbox.read(hourly_temp)
-            hourly_temp = hourly_temp.astype(float).squeeze()
+            hourly_temp = hourly_temp.astype(get_dtype()).squeeze()
 
     if method == "month_hour_precip_mean":
         hourly_precip_hum = tstoolbox.read(hourly_precip_hum)
-        month_hour_precip_mean = calculate_month_hour_precip_mean(hourly_precip_hum)
+        if disagg_type == "dewpoint":
+            month_hour_precip_mean = tdew_melo.calculate_month_hour_precip_mean(
+                hourly_precip_hum
+            )
+        else:
+            month_hour_precip_mean = calculate_month_hour_precip_mean(hourly_precip_hum)
     else:
         month_hour_precip_mean = "None"
 
@@ -853,7 +1142,7 @@ def humidity(
 
     ntsd = pd.DataFrame(
         disaggregate_humidity(
-            tsd.astype(float),
+            tsd,
             method=method,
             temp=hourly_temp,
             a0=a0,
@@ -866,7 +1155,7 @@ def humidity(
 
     ntsd.columns = ["humidity:{0}:disagg"]
 
-    return tsutils.return_input(print_input, tsd, ntsd)
+    return _return_input(print_input, tsd, ntsd)
 
 
 @validate_call(config={"arbitrary_types_allowed": True})
@@ -1092,7 +1381,7 @@ def dewpoint_temperature(
 
     ntsd = pd.DataFrame(
         tdew_melo.disaggregate_tdew(
-            tsd.astype(float),
+            tsd,
             method=method,
             temp=hourly_temp,
             a0=a0,
@@ -1107,7 +1396,7 @@ def dewpoint_temperature(
     ntsd = tsutils.common_kwds(
         input_tsd=ntsd, source_units="degK", target_units=target_units[0]
     )
-    return tsutils.return_input(print_input, tsd, ntsd)
+    return _return_input(print_input, tsd, ntsd)
 
 
 @validate_call(config={"arbitrary_types_allowed": True})
@@ -1130,6 +1419,8 @@ def wind_speed(
     a=None,
     b=None,
     t_shift=None,
+    seed: Optional[int] = None,
+    target_freq: Optional[str] = None,
 ):
     """
     Disaggregate daily wind speed to hourly wind speed.
@@ -1176,8 +1467,16 @@ def wind_speed(
         Parameter `b` when method is equal to "cosine".
     t_shift : float
         Parameter `t_shift` when method is equal to "cosine".
+    seed : int
+        Seed for the random numbers of the "random" method.  Each station
+        and year has its own random stream, so the same seed gives the same
+        hourly values for a station and day whichever other stations or
+        dates are disaggregated in the same run.  If None the result will be
+        different every run.
+    ${target_freq}
     """
     target_units = single_target_units(source_units, target_units, "m/s")
+    slots = slots_per_day(target_freq)
 
     if method == "cosine" and (a is None or b is None or t_shift is None):
         raise ValueError(
@@ -1219,12 +1518,34 @@ def wind_speed(
         clean=clean,
     )
 
-    ndf = pd.DataFrame()
-    for _, column_data in tsd.iteritems():
-        df = disaggregate_wind(column_data, method=method, a=a, b=b, t_shift=t_shift)
-        ndf = ndf.join(df, how="outer")
-    ndf.columns = ["windspeed:{target_units[0]}:disagg"]
-    return tsutils.return_input(
+    daily = tsd.resample("D").first()
+    ncols = daily.shape[1]
+
+    # All columns at once as a (days, slots, columns) array.  Every method
+    # starts from the daily mean repeated for each time slot.
+    hourly = broadcast_daily(daily, slots=slots)
+    if method == "cosine":
+        hourly *= (a * np.cos(np.pi * (slot_hours(slots) - t_shift) / 12) + b)[
+            np.newaxis, :, np.newaxis
+        ]
+    elif method == "random":
+        uniforms = _daily_uniforms(
+            np.random.SeedSequence(seed).entropy,
+            daily.columns,
+            daily.index,
+            shape=(slots,),
+        )
+        hourly *= (-np.log1p(-uniforms.transpose(1, 2, 0))) ** 0.3
+
+    if ncols == 1:
+        columns = [f"windspeed:{target_units[0]}:disagg"]
+    else:
+        columns = [
+            f"{str(col).split(':')[0]}:{target_units[0]}:disagg"
+            for col in daily.columns
+        ]
+    ndf = to_frame(hourly, daily.index, columns)
+    return _return_input(
         print_input,
         tsd,
         ndf,
@@ -1260,6 +1581,7 @@ def radiation(
     temp_min_col: Optional[Union[PositiveInt, str, pd.Series]] = None,
     temp_max_col: Optional[Union[PositiveInt, str, pd.Series]] = None,
     ssd_col: Optional[Union[PositiveInt, str, pd.Series]] = None,
+    sun_times_cache: Optional[str] = None,
 ):
     """
     Disaggregate daily radiation to hourly radiation.
@@ -1308,7 +1630,11 @@ def radiation(
     ${print_input}
     ${tablefmt}
     pot_rad : str
-        hourly dataframe including potential radiation
+        Filename of an HOURLY CSV file of potential radiation.  If None the
+        hourly potential (extraterrestrial) radiation is calculated in
+        W/m**2 for the `lat` and `lon` of the station over the dates of the
+        input, so `lat` and `lon` are required.  Not used with the
+        "mean_course" method.
     angstr_a : float
         parameter a of the Angstrom model (intercept)
     angstr_b : float
@@ -1320,9 +1646,11 @@ def radiation(
     hourly_rad : str
         monthly values of the mean hourly radiation course
     lat : float
-        Latitude
+        Latitude.  Required by "pot_rad_via_ssd" and when `pot_rad` is None.
     lon : float
-        Longitude
+        Longitude, negative to the west.  Required by "pot_rad_via_ssd" and
+        when `pot_rad` is None.  The time zone is estimated as
+        `round(lon / 15)`.
     mean_course:
         Filename of HOURLY CSV file that contains radiation values to be
         used with the "mean_course" method.
@@ -1338,6 +1666,11 @@ def radiation(
     temp_max_col:
         Column index (data columns start numbering at 1) or column name
         from the input data that contains the daily maximum temperature.
+    sun_times_cache : str
+        Optional CSV file name used to keep the sunrise, sun noon, and
+        sunset tables between runs for the "pot_rad_via_ssd" method.  If
+        the file exists the tables in it are used and any new locations are
+        added to it.
     """
     target_units = single_target_units(source_units, target_units, "W/m**2")
 
@@ -1365,6 +1698,25 @@ def radiation(
             )
         )
 
+    if method != "mean_course" and pot_rad is None and (lat is None or lon is None):
+        raise ValueError(
+            tsutils.error_wrapper(
+                f"""
+                If method is not "mean_course" need either the CSV filename of
+                hourly potential radiation with the `pot_rad` keyword, or the
+                `lat` and `lon` keywords to calculate the potential radiation.
+
+                You gave:
+
+                pot_rad={pot_rad}
+
+                lat={lat}
+
+                lon={lon}
+                """
+            )
+        )
+
     if method == "pot_rad_via_bc" and (bristcamp_a is None or bristcamp_c is None):
         raise ValueError(
             tsutils.error_wrapper(
@@ -1409,19 +1761,22 @@ def radiation(
     )
 
     if method in ["pot_rad", "mean_course"]:
-        tsd.columns = ["glob"]
+        tsd = _float_frame(tsd, ["glob"])
     if method in ["pot_rad_via_bc"]:
-        tsd.columns = ["tmin", "tmax"]
+        tsd = _float_frame(tsd, ["tmin", "tmax"])
     if method in ["pot_rad_via_ssd"]:
-        tsd.columns = ["ssd"]
+        tsd = _float_frame(tsd, ["ssd"])
 
     if method == "mean_course":
         hourly_rad = tstoolbox.read(hourly_rad)
-        hourly_rad = hourly_rad.astype(float).squeeze()
+        hourly_rad = hourly_rad.astype(get_dtype()).squeeze()
         mean_course = calculate_mean_daily_course_by_month(
             hourly_rad.squeeze(), normalize=True
         )
         pot_rad = None
+    elif pot_rad is None:
+        pot_rad = potential_radiation(hourly_index(daily_range(tsd.index)), lat, lon)
+        mean_course = None
     else:
         pot_rad = tstoolbox.read(pot_rad)
         pot_rad = pot_rad.astype(float).squeeze()
@@ -1429,11 +1784,15 @@ def radiation(
 
     sun_times = None
     if method == "pot_rad_via_ssd":
-        sun_times = get_sun_times(tsd.index, float(lon), float(lat), round(lon / 15.0))
+        if sun_times_cache is not None:
+            load_sun_times(sun_times_cache)
+        sun_times = cached_sun_times(tsd.index, lat, lon)
+        if sun_times_cache is not None:
+            save_sun_times(sun_times_cache)
 
     ntsd = pd.DataFrame(
         disaggregate_radiation(
-            tsd.astype(float),
+            tsd,
             method=method,
             sun_times=sun_times,
             pot_rad=pot_rad,
@@ -1445,7 +1804,22 @@ def radiation(
         )
     )
     ntsd.columns = ["Radiation:W/m**2:disagg"]
-    return tsutils.return_input(print_input, tsd, ntsd)
+    return _return_input(print_input, tsd, ntsd)
+
+
+def _masterstation_fractions(master):
+    """Fraction of each daily total that falls in each hour at the master.
+
+    Returns the daily index and a (days, 24) array where each row sums to 1.
+    Days when the master station recorded no precipitation have no
+    distribution to transfer and are NaN.
+    """
+    days = daily_range(master.index)
+    hours = to_day_matrix(master, days)
+    dsum = np.nansum(hours, axis=1, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fractions = np.where(dsum > 0.0, np.nan_to_num(hours) / dsum, np.nan)
+    return days, fractions
 
 
 @validate_call(config={"arbitrary_types_allowed": True})
@@ -1466,6 +1840,10 @@ def precipitation(
     print_input=False,
     columns=None,
     masterstation_hour_col: Optional[Union[PositiveInt, str]] = None,
+    hourly_precip: Optional[Union[str, pd.Series, pd.DataFrame]] = None,
+    nmembers: PositiveInt = 1,
+    seed: Optional[int] = None,
+    target_freq: Optional[str] = None,
 ):
     """
     Disaggregate daily precipitation to hourly precipitation.
@@ -1479,11 +1857,15 @@ def precipitation(
         | `method`      | Description                                  |
         +===============+==============================================+
         | equal         | In order to derive hourly from daily values, |
-        |               | the daily total is simply divided by 24      |
-        |               | resulting in an equal distribution.          |
+        |               | the daily total is simply divided by 24, or  |
+        |               | the number of time steps in a day, resulting |
+        |               | in an equal distribution.                    |
         +---------------+----------------------------------------------+
-        | cascade       | The cascade model is more complex and        |
-        |               | requires a parameter estimation method.      |
+        | cascade       | Stochastic multiplicative random cascade     |
+        |               | (Olsson, 1998) calibrated from the hourly    |
+        |               | observations given with the `hourly_precip`  |
+        |               | keyword.  Generates `nmembers` ensemble      |
+        |               | members for each station.                    |
         +---------------+----------------------------------------------+
         | masterstation | If hourly values are available for another   |
         |               | site in the vicinity of the station          |
@@ -1510,11 +1892,39 @@ def precipitation(
     masterstation_hour_col
         The column number or name that contains the hourly data used as the reference
         station.
+    hourly_precip : str
+        Filename of a CSV file that contains an hourly time series of
+        precipitation used to calibrate the "cascade" method.
+    nmembers : int
+        Number of ensemble members to generate for each station with the
+        "cascade" method.  If more than one the output columns are named
+        with the member number appended to the station column name.
+    seed : int
+        Seed for the random number generator of the "cascade" method.  The
+        same seed gives the same ensemble, and the values for a station
+        and day do not depend on which other stations or dates are
+        disaggregated in the same run.  If None the ensemble will be
+        different every run.
+    ${target_freq}
+        The "masterstation" method shares the hourly fraction of the master
+        station equally among the time steps of each hour.
     """
     target_units = single_target_units(source_units, target_units, "mm")
+    slots = slots_per_day(target_freq)
 
     pd.options.display.width = 60
 
+    if method == "cascade" and hourly_precip is None:
+        raise ValueError(
+            tsutils.error_wrapper(
+                """
+                If `method` is "cascade" need to supply the hourly
+                precipitation used to calibrate the cascade with the
+                `hourly_precip` keyword.
+                """
+            )
+        )
+
     tsd = tsutils.common_kwds(
         input_tsd=tsutils.make_list(input_ts),
         skiprows=skiprows,
@@ -1530,6 +1940,12 @@ def precipitation(
         usecols=columns,
     )
 
+    if method == "equal":
+        daily = tsd.resample("D").first()
+        ntsd = to_frame(
+            broadcast_daily(daily, slots=slots) / slots, daily.index, daily.columns
+        )
+
     if method == "masterstation":
         try:
             # If masterstations_hour_col is a column name:
@@ -1538,50 +1954,49 @@ def precipitation(
             # If masterstations_hour_col is a column number:
             masterstation_hour_col = int(masterstation_hour_col) - 1
 
-        try:
-            mhour = tsd[masterstation_hour_col].to_frame()
-        except Exception:
-            mhour = tsutils.common_kwds(
-                input_tsd=tsutils.make_list(input_ts),
-                skiprows=skiprows,
-                index_type=index_type,
-                start_date=start_date,
-                end_date=end_date,
-                round_index=round_index,
-                names=names,
-                dropna=dropna,
-                clean=clean,
-                source_units=source_units,
-                target_units=target_units,
-                usecols=columns,
-            )
+        days, fractions = _masterstation_fractions(tsd.iloc[:, masterstation_hour_col])
 
-        # Should only be one hourly column in the input.
-        dsum = (
-            mhour.groupby(pd.Grouper(freq="D"))
-            .sum()
-            .asfreq(pandas_offset_by_version("h"), method="ffill")
+        # All the remaining columns are daily.
+        daily = tsd.drop(columns=tsd.columns[masterstation_hour_col])
+        daily = daily.resample("D").first().reindex(days)
+
+        # One broadcast multiply of the (days, slots) master fractions
+        # against the (days, stations) daily totals into a single output
+        # array.
+        if slots != 24:
+            fractions = fractions @ slot_weights(24, slots)
+        hourly = np.multiply(
+            daily.to_numpy(dtype=float)[:, np.newaxis, :],
+            fractions[:, :, np.newaxis],
         )
-        master = mhour.join(dsum, rsuffix="sum")
-        mask = master.iloc[:, 0] > 0.0
-        master = (
-            master.loc[mask, master.columns[0]] / master.loc[mask, master.columns[1]]
-        ).to_frame()
-        ntsd = tsd.loc[:, tsd.columns != masterstation_hour_col].asfreq(
-            pandas_offset_by_version("h"), method="ffill"
+        ntsd = to_frame(hourly, days, daily.columns)
+
+    if method == "cascade":
+        stats = calculate_cascade_statistics(
+            tstoolbox.read(hourly_precip).astype(float).squeeze()
         )
-        ntsd = ntsd.join(master)
-        ntsd = ntsd.loc[:, tsd.columns != masterstation_hour_col].multiply(
-            ntsd.iloc[:, -1:], axis="index"
+
+        daily = tsd.resample("D").first()
+
+        hourly = disaggregate_cascade(
+            daily, stats, seed=seed, nmembers=nmembers, slots=slots
         )
-        # All the remaining columns are daily.
-        ntsd = (
-            tsd.loc[:, tsd.columns != masterstation_hour_col]
-            .asfreq(pandas_offset_by_version("h"), method="ffill")
-            .mul(master, axis="rows")
+
+        if nmembers == 1:
+            columns = daily.columns
+        else:
+            # The member number goes on the name, before the units.
+            columns = []
+            for col in daily.columns:
+                for member in range(1, nmembers + 1):
+                    words = str(col).split(":")
+                    words[0] = f"{words[0]}_{member}"
+                    columns.append(":".join(words))
+        ntsd = to_frame(
+            hourly.reshape(len(daily.index), slots, -1), daily.index, columns
         )
 
-    return tsutils.return_input(print_input, tsd, ntsd)
+    return _return_input(print_input, tsd, ntsd)
 
 
 @validate_call(config={"arbitrary_types_allowed": True})
@@ -1602,6 +2017,7 @@ def evaporation(
     target_units=None,
     print_input=False,
     lat: Optional[confloat(ge=-90, le=90)] = None,
+    target_freq: Optional[str] = None,
 ):
     """
     Disaggregate daily evaporation to hourly evaporation.
@@ -1633,8 +2049,13 @@ def evaporation(
         The latitude of the station.  Positive specifies the Northern
         Hemisphere, and negative values represent the Southern
         Hemisphere.
+    ${target_freq}
+        The "trap" method places the corners of the trapezoid on the time
+        steps, and the "fixed" method shares each hourly fraction equally
+        among the time steps of the hour.
     """
     target_units = single_target_units(source_units, target_units)
+    slots = slots_per_day(target_freq)
 
     pd.options.display.width = 60
 
@@ -1661,19 +2082,16 @@ def evaporation(
         clean=clean,
     )
 
-    ntsd = tsd.append(
-        pd.DataFrame(
-            columns=tsd.columns, index=[tsd.index[-1] + datetime.timedelta(days=1)]
-        )
-    )
-    ndata = ntsd.resample(pandas_offset_by_version("h")).ffill()
-
-    fdata = pd.DataFrame(columns=ndata.columns, index=ndata.index, dtype="f")
+    # Days missing from the input take the value of the previous day.
+    daily = tsd.resample("D").ffill()
+    days = daily.index
+    hours = slot_hours(slots)
+    step = 24.0 / slots
 
     if method == "trap":
         lrad = lat * np.pi / 180.0
 
-        ad = 0.40928 * np.cos(0.0172141 * (172 - tsd.index.dayofyear))
+        ad = 0.40928 * np.cos(0.0172141 * (172 - days.dayofyear.to_numpy()))
         ss = np.sin(lrad) * np.sin(ad)
         cs = np.cos(lrad) * np.cos(ad)
         x2 = -ss / cs
@@ -1688,72 +2106,538 @@ def evaporation(
         tr3 = tr2 + dtr2
         tr4 = tr3 + dtr4
 
-        for index, _ in enumerate(sunr):
-            cdate = ntsd.index[index]
-            fdata.loc[
-                datetime.datetime(cdate.year, cdate.month, cdate.day, int(sunr[index])),
-                :,
-            ] = 0.0
-            fdata.loc[
-                datetime.datetime(
-                    cdate.year, cdate.month, cdate.day, int(tr4[index]) + 1
-                ),
-                :,
-            ] = 0.0
-            fdata.loc[
-                datetime.datetime(
-                    cdate.year, cdate.month, cdate.day, int(round(tr2[index]))
-                ),
-                :,
-            ] = 1.0
-            fdata.loc[
-                datetime.datetime(
-                    cdate.year, cdate.month, cdate.day, int(round(tr3[index]))
-                ),
-                :,
-            ] = 1.0
+        # Trapezoid for each day that is 0 at sunrise, rises linearly to 1
+        # at tr2, stays at 1 until tr3, and falls linearly to 0 the time
+        # step after tr4.
+        rise = (np.trunc(sunr / step) * step)[:, np.newaxis]
+        top_start = (np.round(tr2 / step) * step)[:, np.newaxis]
+        top_end = (np.round(tr3 / step) * step)[:, np.newaxis]
+        fall = ((np.trunc(tr4 / step) + 1) * step)[:, np.newaxis]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            up = np.where(
+                top_start > rise,
+                (hours - rise) / (top_start - rise),
+                hours >= top_start,
+            )
+            down = np.where(
+                fall > top_end,
+                (fall - hours) / (fall - top_end),
+                hours <= top_end,
+            )
+            shape = np.clip(np.minimum(up, down), 0.0, 1.0)
+            shape = shape / shape.sum(axis=1, keepdims=True)
 
-        fdata.iloc[0, :] = 0.0
-        fdata.iloc[-1, :] = 0.0
+    elif method == "fixed":
+        # DATA EVAPDIST / 0.000,0.000,0.000,0.000,0.000,0.000,0.019,0.041,
+        # $ 0.067,0.088,0.102,0.110,0.110,0.110,0.105,0.095,
+        # $ 0.081,0.055,0.017,0.000,0.000,0.000,0.000,0.000
+        shape = np.zeros(24)
+        shape[7:20] = [
+            0.019,
+            0.041,
+            0.067,
+            0.088,
+            0.102,
+            0.110,
+            0.110,
+            0.110,
+            0.105,
+            0.095,
+            0.081,
+            0.055,
+            0.017,
+        ]
+        if slots != 24:
+            shape = shape @ slot_weights(24, slots)
+        shape = np.broadcast_to(shape, (len(days), slots))
+
+    fdata = to_frame(
+        broadcast_daily(daily, days, slots) * shape[:, :, np.newaxis],
+        days,
+        tsd.columns,
+    )
 
-        fdata = fdata.interpolate("linear")
+    return _return_input(print_input, tsd, fdata)
 
-        fdata = fdata.fillna(0.0)
 
-        fdata = (
-            fdata
-            / fdata.groupby(pd.Grouper(freq="D"))
-            .sum()
-            .resample(pandas_offset_by_version("h"))
-            .ffill()
+def _column_name(tsd, col):
+    """Name of the column `col`, given by name or number (starting at 1)."""
+    with suppress(TypeError, ValueError):
+        return tsd.columns[int(col) - 1]
+    if col not in tsd.columns:
+        raise ValueError(
+            tsutils.error_wrapper(
+                f"""
+                The column "{col}" is not in the input data.  The columns are
+                {list(tsd.columns)}.
+                """
+            )
         )
+    return col
+
+
+def _hum_tdew_columns(
+    method,
+    hum_min_col,
+    hum_max_col,
+    hum_mean_col,
+    temp_min_col,
+    temp_max_col,
+    precip_col,
+    preserve_daily_mean,
+):
+    """Keyword and column pairs in the order `prepare_hum_tdew` picks them."""
+    if method == "equal":
+        cols = [("hum_mean_col", hum_mean_col)]
+    elif method == "min_max":
+        cols = [
+            ("temp_min_col", temp_min_col),
+            ("temp_max_col", temp_max_col),
+            ("hum_min_col", hum_min_col),
+            ("hum_max_col", hum_max_col),
+        ]
+    elif method == "month_hour_precip_mean":
+        cols = [("precip_col", precip_col)]
+    else:
+        cols = [("temp_min_col", temp_min_col)]
+    if preserve_daily_mean is not None and method != "equal":
+        cols.append(("preserve_daily_mean", preserve_daily_mean))
+    return cols
+
+
+@validate_call(config={"arbitrary_types_allowed": True})
+@tsutils.doc(_LOCAL_DOCSTRINGS)
+def all_variables(
+    source_units,
+    input_ts="-",
+    start_date=None,
+    end_date=None,
+    dropna="no",
+    clean=False,
+    round_index=None,
+    skiprows=None,
+    index_type="datetime",
+    names=None,
+    print_input=False,
+    lat: Optional[confloat(ge=-90, le=90)] = None,
+    lon: Optional[confloat(ge=-180, le=180)] = None,
+    temperature_method: Optional[
+        Literal[
+            "sine_min_max",
+            "sine_mean",
+            "sine",
+            "mean_course_min_max",
+            "mean_course_mean",
+        ]
+    ] = None,
+    min_max_time: Literal["fix", "sun_loc", "sun_loc_shift"] = "fix",
+    mod_nighttime: bool = False,
+    max_delta: bool = False,
+    hourly: Optional[str] = None,
+    temp_min_col: Optional[Union[PositiveInt, str]] = None,
+    temp_max_col: Optional[Union[PositiveInt, str]] = None,
+    temp_mean_col: Optional[Union[PositiveInt, str]] = None,
+    humidity_method: Optional[
+        Literal[
+            "equal",
+            "minimal",
+            "dewpoint_regression",
+            "linear_dewpoint_variation",
+            "min_max",
+            "month_hour_precip_mean",
+        ]
+    ] = None,
+    dewpoint_method: Optional[
+        Literal[
+            "equal",
+            "minimal",
+            "dewpoint_regression",
+            "linear_dewpoint_variation",
+            "min_max",
+            "month_hour_precip_mean",
+        ]
+    ] = None,
+    hum_min_col: Optional[Union[PositiveInt, str]] = None,
+    hum_max_col: Optional[Union[PositiveInt, str]] = None,
+    hum_mean_col: Optional[Union[PositiveInt, str]] = None,
+    a0=None,
+    a1=None,
+    kr: Optional[Literal[6, 12]] = None,
+    hourly_precip_hum: Optional[str] = None,
+    preserve_daily_mean: Optional[Union[PositiveInt, str]] = None,
+    wind_method: Optional[Literal["equal", "cosine", "random"]] = None,
+    wind_col=None,
+    a=None,
+    b=None,
+    t_shift=None,
+    seed: Optional[int] = None,
+    radiation_method: Optional[
+        Literal["pot_rad", "pot_rad_via_ssd", "pot_rad_via_bc", "mean_course"]
+    ] = None,
+    glob_swr_col: Optional[Union[PositiveInt, str]] = None,
+    ssd_col: Optional[Union[PositiveInt, str]] = None,
+    pot_rad: Optional[str] = None,
+    angstr_a=0.25,
+    angstr_b=0.5,
+    bristcamp_a=0.75,
+    bristcamp_c=2.4,
+    hourly_rad: Optional[str] = None,
+    precipitation_method: Optional[Literal["equal", "cascade", "masterstation"]] = None,
+    precip_col=None,
+    masterstation_hour_col: Optional[Union[PositiveInt, str]] = None,
+    hourly_precip: Optional[str] = None,
+    nmembers: PositiveInt = 1,
+    evaporation_method: Optional[Literal["trap", "fixed"]] = None,
+    evap_col=None,
+    sun_times_cache: Optional[str] = None,
+    target_freq: Optional[str] = None,
+):
+    """
+    Disaggregate all variables of a daily weather record in one pass.
 
-        fdata = fdata * ndata
+    The daily record is read once and each variable that has a method is
+    disaggregated from it in memory, with all of the hourly results returned
+    together.  The hourly temperature from the temperature step is used
+    directly by the humidity and dewpoint temperature steps instead of the
+    `hourly_temp` file, and the sun times are calculated once for `lat` and
+    `lon` and shared by the temperature and radiation steps.  Variables
+    without a method are skipped.
 
-        fdata = fdata.iloc[:-1, :]
+    See the individual disaggregate commands for the description of each
+    method and its parameters.
 
-    elif method == "fixed":
-        # DATA EVAPDIST / 0.000,0.000,0.000,0.000,0.000,0.000,0.019,0.041,
-        # $ 0.067,0.088,0.102,0.110,0.110,0.110,0.105,0.095,
-        # $ 0.081,0.055,0.017,0.000,0.000,0.000,0.000,0.000
-        fdata = fdata.fillna(0.0)
-
-        fdata[fdata.index.hour == 7] = 0.019
-        fdata[fdata.index.hour == 8] = 0.041
-        fdata[fdata.index.hour == 9] = 0.067
-        fdata[fdata.index.hour == 10] = 0.088
-        fdata[fdata.index.hour == 11] = 0.102
-        fdata[fdata.index.hour == 12] = 0.110
-        fdata[fdata.index.hour == 13] = 0.110
-        fdata[fdata.index.hour == 14] = 0.110
-        fdata[fdata.index.hour == 15] = 0.105
-        fdata[fdata.index.hour == 16] = 0.095
-        fdata[fdata.index.hour == 17] = 0.081
-        fdata[fdata.index.hour == 18] = 0.055
-        fdata[fdata.index.hour == 19] = 0.017
-
-        fdata = fdata * ndata
-
-        fdata = fdata.iloc[:-1, :]
-
-    return tsutils.print_input(print_input, tsd, fdata, None)
+    Parameters
+    ----------
+    ${psource_units}
+        There must be one unit for each column of the input data.
+    ${input_ts}
+    ${start_date}
+    ${end_date}
+    ${dropna}
+    ${clean}
+    ${round_index}
+    ${skiprows}
+    ${index_type}
+    ${names}
+    ${print_input}
+    ${tablefmt}
+    lat : float
+        The latitude of the station, used by the temperature, radiation,
+        and evaporation steps.
+    lon : float
+        The longitude of the station, used by the temperature and radiation
+        steps.
+    temperature_method : str
+        The `method` of the temperature disaggregation.  Required by the
+        humidity and dewpoint methods that need hourly temperature.
+    min_max_time : str
+        The `min_max_time` of the temperature disaggregation.
+    mod_nighttime : bool
+        The `mod_nighttime` of the temperature disaggregation.
+    max_delta : bool
+        The `max_delta` of the temperature disaggregation.
+    hourly : str
+        The `hourly` observed temperature file of the temperature
+        disaggregation.
+    temp_min_col : str, int
+        Column name or number (data columns start numbering at 1) of the
+        daily minimum temperature.
+    temp_max_col : str, int
+        Column name or number of the daily maximum temperature.
+    temp_mean_col : str, int
+        Column name or number of the daily mean temperature.
+    humidity_method : str
+        The `method` of the humidity disaggregation.
+    dewpoint_method : str
+        The `method` of the dewpoint temperature disaggregation.
+    hum_min_col : str, int
+        Column name or number of the daily minimum humidity.
+    hum_max_col : str, int
+        Column name or number of the daily maximum humidity.
+    hum_mean_col : str, int
+        Column name or number of the daily mean humidity.
+    a0 : float
+        The "a0" parameter of the humidity and dewpoint methods.
+    a1 : float
+        The "a1" parameter of the humidity and dewpoint methods.
+    kr : int
+        The "kr" parameter of the "linear_dewpoint_variation" method.
+    hourly_precip_hum : str
+        Filename of the hourly precipitation and humidity for the
+        "month_hour_precip_mean" method.
+    preserve_daily_mean : str, int
+        Column name or number of the observed daily mean humidity used to
+        correct the humidity and dewpoint results.
+    wind_method : str
+        The `method` of the wind speed disaggregation.
+    wind_col : str, int, list
+        Column names or numbers of the daily wind speed.
+    a : float
+        Parameter `a` of the "cosine" wind method.
+    b : float
+        Parameter `b` of the "cosine" wind method.
+    t_shift : float
+        Parameter `t_shift` of the "cosine" wind method.
+    seed : int
+        Seed for the "random" wind and "cascade" precipitation methods.
+    radiation_method : str
+        The `method` of the radiation disaggregation.
+    glob_swr_col : str, int
+        Column name or number of the daily global short wave radiation.
+    ssd_col : str, int
+        Column name or number of the daily sunshine duration.
+    pot_rad : str
+        Filename of the hourly potential radiation.  If None calculated from
+        `lat` and `lon`.
+    angstr_a : float
+        Parameter a of the Angstrom model.
+    angstr_b : float
+        Parameter b of the Angstrom model.
+    bristcamp_a : float
+        Parameter a of the Bristow-Campbell model.
+    bristcamp_c : float
+        Parameter c of the Bristow-Campbell model.
+    hourly_rad : str
+        Filename of the hourly radiation for the "mean_course" radiation
+        method.
+    precipitation_method : str
+        The `method` of the precipitation disaggregation.
+    precip_col : str, int, list
+        Column names or numbers of the daily precipitation.  The first
+        column is also used by the "month_hour_precip_mean" humidity and
+        dewpoint methods.
+    masterstation_hour_col : str, int
+        Column name or number of the hourly master station precipitation.
+    hourly_precip : str
+        Filename of the hourly precipitation for the "cascade" method.
+    nmembers : int
+        Number of ensemble members of the "cascade" method.
+    evaporation_method : str
+        The `method` of the evaporation disaggregation.
+    evap_col : str, int, list
+        Column names or numbers of the daily evaporation.
+    sun_times_cache : str
+        Optional CSV file name used to keep the sun times tables between
+        runs.
+    ${target_freq}
+        Only the temperature, wind speed, precipitation, and evaporation
+        steps can use a sub-hourly step.
+    """
+    tsd = tsutils.common_kwds(
+        tsutils.read_iso_ts(
+            input_ts, skiprows=skiprows, names=names, index_type=index_type
+        ),
+        start_date=start_date,
+        end_date=end_date,
+        round_index=round_index,
+        dropna=dropna,
+        clean=clean,
+    )
+
+    if slots_per_day(target_freq) != 24:
+        hourly_only = {
+            "humidity_method": humidity_method,
+            "dewpoint_method": dewpoint_method,
+            "radiation_method": radiation_method,
+        }
+        given = [key for key, value in hourly_only.items() if value is not None]
+        if given:
+            raise ValueError(
+                tsutils.error_wrapper(
+                    f"""
+                    The humidity, dewpoint temperature, and radiation steps
+                    only disaggregate to hourly, so `target_freq` cannot be
+                    "{target_freq}" with {given}.
+                    """
+                )
+            )
+
+    source_units = tsutils.make_list(source_units)
+    if len(source_units) != len(tsd.columns):
+        raise ValueError(
+            tsutils.error_wrapper(
+                f"""
+                Need one source unit for each of the {len(tsd.columns)} columns
+                in the input data.  You gave {source_units}.
+                """
+            )
+        )
+    units = dict(zip(tsd.columns, source_units))
+
+    def _step(pairs):
+        """Input columns, units, and column numbers for one step."""
+        cols = [_column_name(tsd, col) for _, col in pairs]
+        return (
+            tsd[cols],
+            [units[col] for col in cols],
+            {key: index + 1 for index, (key, _) in enumerate(pairs)},
+        )
+
+    if sun_times_cache is not None:
+        load_sun_times(sun_times_cache)
+
+    results = []
+
+    hourly_temp = None
+    if temperature_method is not None:
+        pairs = [("temp_min_col", temp_min_col), ("temp_max_col", temp_max_col)]
+        if temp_mean_col is not None:
+            pairs.append(("temp_mean_col", temp_mean_col))
+        sub, sub_units, kwds = _step(pairs)
+        hourly_temp = temperature(
+            temperature_method,
+            sub_units,
+            input_ts=sub,
+            min_max_time=min_max_time,
+            mod_nighttime=mod_nighttime,
+            max_delta=max_delta,
+            hourly=hourly,
+            lat=lat,
+            lon=lon,
+            target_freq=target_freq,
+            **kwds,
+        )
+        results.append(hourly_temp)
+
+    def _hourly_temp_in(method, name, target):
+        """The hourly temperature in `target` units for a humidity step."""
+        if method in ("equal", "month_hour_precip_mean") and name == "humidity":
+            return None
+        if hourly_temp is None:
+            raise ValueError(
+                tsutils.error_wrapper(
+                    f"""
+                    The "{method}" {name} method needs hourly temperature, so
+                    `temperature_method` is required.
+                    """
+                )
+            )
+        return tsutils.common_kwds(
+            hourly_temp, source_units=["degC"], target_units=[target]
+        ).squeeze()
+
+    for name, method, func in (
+        ("humidity", humidity_method, humidity),
+        ("dewpoint", dewpoint_method, dewpoint_temperature),
+    ):
+        if method is None:
+            continue
+        precip = _column_list(precip_col)[:1] or [None]
+        sub, sub_units, kwds = _step(
+            _hum_tdew_columns(
+                method,
+                hum_min_col,
+                hum_max_col,
+                hum_mean_col,
+                temp_min_col,
+                temp_max_col,
+                precip[0],
+                preserve_daily_mean,
+            )
+        )
+        if name == "humidity":
+            # The humidity methods use the daily temperatures as read.
+            target = units[_column_name(tsd, temp_min_col)] if temp_min_col else None
+        else:
+            target = "degK"
+        results.append(
+            func(
+                method,
+                sub_units,
+                input_ts=sub,
+                a0=a0,
+                a1=a1,
+                kr=kr,
+                hourly_temp=_hourly_temp_in(method, name, target),
+                hourly_precip_hum=hourly_precip_hum,
+                **kwds,
+            )
+        )
+
+    if wind_method is not None:
+        sub, sub_units, _ = _step([("", col) for col in _column_list(wind_col)])
+        results.append(
+            wind_speed(
+                wind_method,
+                sub_units,
+                input_ts=sub,
+                a=a,
+                b=b,
+                t_shift=t_shift,
+                seed=seed,
+                target_freq=target_freq,
+            )
+        )
+
+    if radiation_method is not None:
+        if radiation_method in ("pot_rad", "mean_course"):
+            pairs = [("glob_swr_col", glob_swr_col)]
+        elif radiation_method == "pot_rad_via_ssd":
+            pairs = [("ssd_col", ssd_col)]
+        else:
+            pairs = [("temp_min_col", temp_min_col), ("temp_max_col", temp_max_col)]
+        sub, sub_units, kwds = _step(pairs)
+        results.append(
+            radiation(
+                radiation_method,
+                sub_units,
+                input_ts=sub,
+                pot_rad=pot_rad,
+                angstr_a=angstr_a,
+                angstr_b=angstr_b,
+                bristcamp_a=bristcamp_a,
+                bristcamp_c=bristcamp_c,
+                hourly_rad=hourly_rad,
+                lat=lat,
+                lon=lon,
+                **kwds,
+            )
+        )
+
+    if precipitation_method is not None:
+        pairs = [("", col) for col in _column_list(precip_col)]
+        if masterstation_hour_col is not None:
+            pairs.append(("", masterstation_hour_col))
+        sub, sub_units, _ = _step(pairs)
+        results.append(
+            precipitation(
+                precipitation_method,
+                sub_units,
+                input_ts=sub,
+                masterstation_hour_col=(
+                    None if masterstation_hour_col is None else len(pairs)
+                ),
+                hourly_precip=hourly_precip,
+                nmembers=nmembers,
+                seed=seed,
+                target_freq=target_freq,
+            )
+        )
+
+    if evaporation_method is not None:
+        sub, sub_units, _ = _step([("", col) for col in _column_list(evap_col)])
+        results.append(
+            evaporation(
+                evaporation_method,
+                sub_units,
+                input_ts=sub,
+                lat=lat,
+                target_freq=target_freq,
+            )
+        )
+
+    if sun_times_cache is not None:
+        save_sun_times(sun_times_cache)
+
+    if not results:
+        raise ValueError(
+            tsutils.error_wrapper(
+                """
+                Give the method of at least one variable to disaggregate, for
+                example `temperature_method`.
+                """
+            )
+        )
+
+    ntsd = pd.concat(results, axis="columns")
+    return _return_input(print_input, tsd, ntsd)
@@ -15,7 +15,9 @@ Potential and actual evaporation functions
         - tvardry: calculate sensible heat flux from temperature variations.
         - gash79: Gash (1979) analytical rainfall interception model.
 
-Requires and imports scipy and meteolib modules.
+Requires and imports numpy and meteolib modules.  The evaporation
+equations are compiled to parallel ufuncs when numba is installed and
+otherwise run as numpy array expressions.
 Compatible with Python 2.7.3.
 
 Function descriptions
@@ -23,9 +25,9 @@ Function descriptions
 
 """
 
-import scipy
+import numpy as np
 
-from . import meteolib
+from . import _jit, meteolib
 
 __author__ = "Dr. Maarten J. Waterloo <maarten.waterloo@acaciawater.com>"
 __version__ = "1.0"
@@ -65,7 +67,115 @@ def evaplib():
     print(("Date: ", __date__))
 
 
-def ra(z=float, z0=float, d=float, u=scipy.array([])):
+@_jit.vectorize(8)
+def _E0(airtemp, rh, airpress, Rs, Rext, u, alpha, Z):
+    # Set constants
+    sigma = 4.903e-3  # Stefan Boltzmann constant J/m2/K4/d
+
+    # Calculate saturated and actual water vapour pressures
+    es = meteolib._es(airtemp)  # [Pa]
+    ea = meteolib._ea(rh, es)  # [Pa]
+
+    # Calculate Delta, gamma and lambda
+    DELTA = meteolib._delta(airtemp, es)  # [Pa/K]
+    gamma = meteolib._gamma(airtemp, ea, airpress)  # [Pa/K]
+    Lambda = meteolib._L(airtemp)  # [J/kg]
+
+    # calculate radiation components (J/m2/day)
+    Rns = (1.0 - alpha) * Rs  # Shortwave component [J/m2/d]
+    Rs0 = (0.75 + 2e-5 * Z) * Rext  # Calculate clear sky radiation Rs0
+    f = 1.35 * Rs / Rs0 - 0.35
+    epsilom = 0.34 - 0.14 * np.sqrt(ea / 1000)
+    Rnl = f * epsilom * sigma * (airtemp + 273.15) ** 4  # Longwave component [J/m2/d]
+    Rnet = Rns - Rnl  # Net radiation [J/m2/d]
+    Ea = (1 + 0.536 * u) * (es / 1000 - ea / 1000)
+    return (
+        DELTA / (DELTA + gamma) * Rnet / Lambda
+        + gamma / (DELTA + gamma) * 6430000 * Ea / Lambda
+    )
+
+
+@_jit.vectorize(7)
+def _ET0pm(airtemp, rh, airpress, Rs, Rext, u, Z):
+    # Set constants
+    albedo = 0.23  # short grass albedo
+    sigma = 4.903e-3  # Stefan Boltzmann constant J/m2/K4/d
+
+    # Calculate saturated and actual water vapour pressures
+    es = meteolib._es(airtemp)  # [Pa]
+    ea = meteolib._ea(rh, es)  # [Pa]
+
+    # Calculate Delta, gamma and lambda
+    DELTA = meteolib._delta(airtemp, es)  # [Pa/K]
+    gamma = meteolib._gamma(airtemp, ea, airpress)  # [Pa/K]
+    Lambda = meteolib._L(airtemp)  # [J/kg]
+
+    Rns = (1.0 - albedo) * Rs  # Shortwave component [J/m2/d]
+    # Calculate clear sky radiation Rs0
+    Rs0 = (0.75 + 2e-5 * Z) * Rext  # Clear sky radiation [J/m2/d]
+    f = 1.35 * Rs / Rs0 - 0.35
+    epsilom = 0.34 - 0.14 * np.sqrt(ea / 1000)
+    Rnl = f * epsilom * sigma * (airtemp + 273.15) ** 4  # Longwave component [J/m2/d]
+    Rnet = Rns - Rnl  # Net radiation [J/m2/d]
+    return (
+        DELTA / 1000.0 * Rnet / Lambda
+        + 900.0 / (airtemp + 273.16) * u * (es - ea) / 1000 * gamma / 1000
+    ) / (DELTA / 1000.0 + gamma / 1000 * (1.0 + 0.34 * u))
+
+
+@_jit.vectorize(4)
+def _Em(airtemp, rh, airpress, Rs):
+    es = meteolib._es(airtemp)
+
+    # Calculate Delta and gamma constants
+    DELTA = meteolib._delta(airtemp, es)
+    gamma = meteolib._gamma(airtemp, meteolib._ea(rh, es), airpress)
+    Lambda = meteolib._L(airtemp)
+
+    return 0.65 * DELTA / (DELTA + gamma) * Rs / Lambda
+
+
+@_jit.vectorize(5)
+def _Ept(airtemp, rh, airpress, Rn, G):
+    es = meteolib._es(airtemp)
+
+    # Calculate Delta and gamma constants
+    DELTA = meteolib._delta(airtemp, es)
+    gamma = meteolib._gamma(airtemp, meteolib._ea(rh, es), airpress)
+    Lambda = meteolib._L(airtemp)
+    return 1.26 * DELTA / (DELTA + gamma) * (Rn - G) / Lambda
+
+
+@_jit.vectorize(7)
+def _Epm(airtemp, rh, airpress, Rn, G, ra, rs):
+    es = meteolib._es(airtemp)
+    eact = meteolib._ea(rh, es)
+
+    # Calculate Delta, gamma and lambda
+    DELTA = meteolib._delta(airtemp, es) / 100.0  # [hPa/K]
+    airpress = airpress * 100.0  # [Pa]
+    gamma = meteolib._gamma(airtemp, eact, airpress) / 100.0  # [hPa/K]
+    Lambda = meteolib._L(airtemp)  # [J/kg]
+    rho = meteolib._rho(airtemp, eact, airpress)  # [kg m-3]
+    cp = meteolib._cp(eact, airpress)  # [J kg-1 K-1]
+    # Calculate saturated and actual water vapour pressures
+    es = es / 100.0  # [hPa]
+    ea = eact / 100.0  # [hPa]
+    return (
+        (DELTA * (Rn - G) + rho * cp * (es - ea) / ra)
+        / (DELTA + gamma * (1.0 + rs / ra))
+    ) / Lambda
+
+
+@_jit.vectorize(8)
+def _tvardry(rho, cp, T, sigma_t, z, d, C1, C2):
+    # Define constants
+    k = 0.40  # von Karman constant
+    g = 9.81  # acceleration due to gravity [m/s^2]
+    return rho * cp * np.sqrt((sigma_t / C1) ** 3 * k * g * (z - d) / (T + 273.15) * C2)
+
+
+def ra(z=float, z0=float, d=float, u=np.array([])):
     """
     Function to calculate aerodynamic resistance from windspeed:
 
@@ -104,16 +214,16 @@ def ra(z=float, z0=float, d=float, u=scipy.array([])):
     # Test input array/value
     u = meteolib._arraytest(u)
 
-    return (scipy.log((z - d) / z0)) ** 2 / (0.16 * u)
+    return (np.log((z - d) / z0)) ** 2 / (0.16 * u)
 
 
 def E0(
-    airtemp=scipy.array([]),
-    rh=scipy.array([]),
-    airpress=scipy.array([]),
-    Rs=scipy.array([]),
-    Rext=scipy.array([]),
-    u=scipy.array([]),
+    airtemp=np.array([]),
+    rh=np.array([]),
+    airpress=np.array([]),
+    Rs=np.array([]),
+    Rext=np.array([]),
+    u=np.array([]),
     alpha=0.08,
     Z=0.0,
 ):
@@ -176,39 +286,16 @@ def E0(
         airtemp, rh, airpress, Rs, Rext, u
     )
 
-    # Set constants
-    sigma = 4.903e-3  # Stefan Boltzmann constant J/m2/K4/d
-
-    # Calculate Delta, gamma and lambda
-    DELTA = meteolib.Delta_calc(airtemp)  # [Pa/K]
-    gamma = meteolib.gamma_calc(airtemp, rh, airpress)  # [Pa/K]
-    Lambda = meteolib.L_calc(airtemp)  # [J/kg]
-
-    # Calculate saturated and actual water vapour pressures
-    es = meteolib.es_calc(airtemp)  # [Pa]
-    ea = meteolib.ea_calc(airtemp, rh)  # [Pa]
-
-    # calculate radiation components (J/m2/day)
-    Rns = (1.0 - alpha) * Rs  # Shortwave component [J/m2/d]
-    Rs0 = (0.75 + 2e-5 * Z) * Rext  # Calculate clear sky radiation Rs0
-    f = 1.35 * Rs / Rs0 - 0.35
-    epsilom = 0.34 - 0.14 * scipy.sqrt(ea / 1000)
-    Rnl = f * epsilom * sigma * (airtemp + 273.15) ** 4  # Longwave component [J/m2/d]
-    Rnet = Rns - Rnl  # Net radiation [J/m2/d]
-    Ea = (1 + 0.536 * u) * (es / 1000 - ea / 1000)
-    return (
-        DELTA / (DELTA + gamma) * Rnet / Lambda
-        + gamma / (DELTA + gamma) * 6430000 * Ea / Lambda
-    )
+    return _E0(airtemp, rh, airpress, Rs, Rext, u, alpha, Z)
 
 
 def ET0pm(
-    airtemp=scipy.array([]),
-    rh=scipy.array([]),
-    airpress=scipy.array([]),
-    Rs=scipy.array([]),
-    Rext=scipy.array([]),
-    u=scipy.array([]),
+    airtemp=np.array([]),
+    rh=np.array([]),
+    airpress=np.array([]),
+    Rs=np.array([]),
+    Rext=np.array([]),
+    u=np.array([]),
     Z=0.0,
 ):
     """
@@ -254,37 +341,14 @@ def ET0pm(
         airtemp, rh, airpress, Rs, Rext, u
     )
 
-    # Set constants
-    albedo = 0.23  # short grass albedo
-    sigma = 4.903e-3  # Stefan Boltzmann constant J/m2/K4/d
-
-    # Calculate Delta, gamma and lambda
-    DELTA = meteolib.Delta_calc(airtemp)  # [Pa/K]
-    gamma = meteolib.gamma_calc(airtemp, rh, airpress)  # [Pa/K]
-    Lambda = meteolib.L_calc(airtemp)  # [J/kg]
-
-    # Calculate saturated and actual water vapour pressures
-    es = meteolib.es_calc(airtemp)  # [Pa]
-    ea = meteolib.ea_calc(airtemp, rh)  # [Pa]
-
-    Rns = (1.0 - albedo) * Rs  # Shortwave component [J/m2/d]
-    # Calculate clear sky radiation Rs0
-    Rs0 = (0.75 + 2e-5 * Z) * Rext  # Clear sky radiation [J/m2/d]
-    f = 1.35 * Rs / Rs0 - 0.35
-    epsilom = 0.34 - 0.14 * scipy.sqrt(ea / 1000)
-    Rnl = f * epsilom * sigma * (airtemp + 273.15) ** 4  # Longwave component [J/m2/d]
-    Rnet = Rns - Rnl  # Net radiation [J/m2/d]
-    return (
-        DELTA / 1000.0 * Rnet / Lambda
-        + 900.0 / (airtemp + 273.16) * u * (es - ea) / 1000 * gamma / 1000
-    ) / (DELTA / 1000.0 + gamma / 1000 * (1.0 + 0.34 * u))
+    return _ET0pm(airtemp, rh, airpress, Rs, Rext, u, Z)
 
 
 def Em(
-    airtemp=scipy.array([]),
-    rh=scipy.array([]),
-    airpress=scipy.array([]),
-    Rs=scipy.array([]),
+    airtemp=np.array([]),
+    rh=np.array([]),
+    airpress=np.array([]),
+    Rs=np.array([]),
 ):
     """
     Function to calculate Makkink evaporation (in mm/day):
@@ -331,20 +395,15 @@ def Em(
     # Test input array/value
     airtemp, rh, airpress, Rs = meteolib._arraytest(airtemp, rh, airpress, Rs)
 
-    # Calculate Delta and gamma constants
-    DELTA = meteolib.Delta_calc(airtemp)
-    gamma = meteolib.gamma_calc(airtemp, rh, airpress)
-    Lambda = meteolib.L_calc(airtemp)
-
-    return 0.65 * DELTA / (DELTA + gamma) * Rs / Lambda
+    return _Em(airtemp, rh, airpress, Rs)
 
 
 def Ept(
-    airtemp=scipy.array([]),
-    rh=scipy.array([]),
-    airpress=scipy.array([]),
-    Rn=scipy.array([]),
-    G=scipy.array([]),
+    airtemp=np.array([]),
+    rh=np.array([]),
+    airpress=np.array([]),
+    Rn=np.array([]),
+    G=np.array([]),
 ):
     """
     Function to calculate daily Priestley - Taylor evaporation:
@@ -386,21 +445,17 @@ def Ept(
     # Test input array/value
     airtemp, rh, airpress, Rn, G = meteolib._arraytest(airtemp, rh, airpress, Rn, G)
 
-    # Calculate Delta and gamma constants
-    DELTA = meteolib.Delta_calc(airtemp)
-    gamma = meteolib.gamma_calc(airtemp, rh, airpress)
-    Lambda = meteolib.L_calc(airtemp)
-    return 1.26 * DELTA / (DELTA + gamma) * (Rn - G) / Lambda
+    return _Ept(airtemp, rh, airpress, Rn, G)
 
 
 def Epm(
-    airtemp=scipy.array([]),
-    rh=scipy.array([]),
-    airpress=scipy.array([]),
-    Rn=scipy.array([]),
-    G=scipy.array([]),
-    ra=scipy.array([]),
-    rs=scipy.array([]),
+    airtemp=np.array([]),
+    rh=np.array([]),
+    airpress=np.array([]),
+    Rn=np.array([]),
+    G=np.array([]),
+    ra=np.array([]),
+    rs=np.array([]),
 ):
     """
     Function to calculate the Penman Monteith evaporation.
@@ -445,27 +500,14 @@ def Epm(
         airtemp, rh, airpress, Rn, G, ra, rs
     )
 
-    # Calculate Delta, gamma and lambda
-    DELTA = meteolib.Delta_calc(airtemp) / 100.0  # [hPa/K]
-    airpress = airpress * 100.0  # [Pa]
-    gamma = meteolib.gamma_calc(airtemp, rh, airpress) / 100.0  # [hPa/K]
-    Lambda = meteolib.L_calc(airtemp)  # [J/kg]
-    rho = meteolib.rho_calc(airtemp, rh, airpress)  # [kg m-3]
-    cp = meteolib.cp_calc(airtemp, rh, airpress)  # [J kg-1 K-1]
-    # Calculate saturated and actual water vapour pressures
-    es = meteolib.es_calc(airtemp) / 100.0  # [hPa]
-    ea = meteolib.ea_calc(airtemp, rh) / 100.0  # [hPa]
-    return (
-        (DELTA * (Rn - G) + rho * cp * (es - ea) / ra)
-        / (DELTA + gamma * (1.0 + rs / ra))
-    ) / Lambda
+    return _Epm(airtemp, rh, airpress, Rn, G, ra, rs)
 
 
 def tvardry(
-    rho=scipy.array([]),
-    cp=scipy.array([]),
-    T=scipy.array([]),
-    sigma_t=scipy.array([]),
+    rho=np.array([]),
+    cp=np.array([]),
+    T=np.array([]),
+    sigma_t=np.array([]),
     z=0.0,
     d=0.0,
     C1=2.9,
@@ -528,21 +570,23 @@ def tvardry(
     # Test input array/value
     rho, cp, T, sigma_t = meteolib._arraytest(rho, cp, T, sigma_t)
 
-    # Define constants
-    k = 0.40  # von Karman constant
-    g = 9.81  # acceleration due to gravity [m/s^2]
-    return (
-        rho * cp * scipy.sqrt((sigma_t / C1) ** 3 * k * g * (z - d) / (T + 273.15) * C2)
-    )
+    return _tvardry(rho, cp, T, sigma_t, z, d, C1, C2)
 
 
-def gash79(Pg=scipy.array([]), ER=float, S=float, St=float, p=float, pt=float):
+def gash79(Pg=np.array([]), ER=float, S=float, St=float, p=float, pt=float):
     """
     Function to calculate precipitation interception loss from daily
     precipitation values and vegetation parameters.
 
+    All storms are classified at once against the rainfall needed to
+    saturate the canopy and the trunks, so `Pg` can be a long record.  With
+    one column of rainfall per station in a 2D `Pg` the vegetation
+    parameters can be single values or have one value per station.
+    Missing (NaN) rainfall gives missing results.
+
     Parameters:
-        - Pg: daily rainfall data [mm].
+        - Pg: (array of) daily rainfall data [mm], (days, stations) for
+          several stations.
         - ER: evaporation percentage of total rainfall [mm h-1].
         - S: storage capacity canopy [mm].
         - St: stem storage capacity [mm].
@@ -551,9 +595,9 @@ def gash79(Pg=scipy.array([]), ER=float, S=float, St=float, p=float, pt=float):
 
     Returns:
         - Pg: Daily rainfall [mm].
-        - Ei: Interception [mm].
         - TF: through fall [mm].
         - SF: stemflow [mm].
+        - Ei: Interception [mm].
 
     References
     ----------
@@ -564,84 +608,36 @@ def gash79(Pg=scipy.array([]), ER=float, S=float, St=float, p=float, pt=float):
     Examples
     --------
         >>> gash79(12.4,0.15,1.3,0.2,0.2,0.02)
-        (12.4, 8.4778854123725971, 0, 3.9221145876274024)
+        (12.4, 9.125885412372599, 0.048, 3.2261145876274027)
         >>> gash79(60.0,0.15,1.3,0.2,0.2,0.02)
-        (60.0, 47.033885412372598, 0, 12.966114587627404)
+        (60.0, 48.6338854123726, 1.0, 10.366114587627402)
+        >>> Pg, TF, SF, Ei = gash79(rain, [0.15, 0.12], 1.3, 0.2, 0.2, 0.02)
 
     """
     # Test input array/value
     Pg = meteolib._arraytest(Pg)
-
-    # Determine length of array Pg
-    length_array = scipy.size(Pg)
-    # Check if we have a single precipitation value or an array
-    if length_array < 2:  # Dealing with single value...
-        # PGsat calculation (for the saturation of the canopy)
-        PGsat = -(1 / ER * S) * scipy.log(1 - (ER / (1 - p - pt)))
-
-        # Set initial values to zero
-        Ecan = 0.0
-        Etrunk = 0.0
-
-        # Calculate interception for different storm sizes
-        if Pg < PGsat and Pg > 0:
-            Ecan = (1 - p - pt) * Pg
-            if Pg > St / pt:
-                Etrunk = St + pt * Pg
-            Ei = Ecan + Etrunk
-        if Pg > PGsat and Pg < St / pt:
-            Ecan = (((1 - p - pt) * PGsat) - S) + (ER * (Pg - PGsat)) + S
-            Etrunk = 0.0
-            Ei = Ecan + Etrunk
-        if Pg > PGsat and Pg > (St / pt):
-            Ecan = (
-                (((1 - p - pt) * PGsat) - S) + (ER * (Pg - PGsat)) + S + (St + pt * Pg)
-            )
-            Etrunk = St + pt * Pg
-        Ei = Ecan + Etrunk
-        TF = Pg - Ei
-        SF = 0
-
-    else:
-        # Define variables and constants
-        n = scipy.size(Pg)
-        TF = scipy.zeros(n)
-        SF = scipy.zeros(n)
-        Ei = scipy.zeros(n)
-        Etrunk = scipy.zeros(n)
-
-        # Set results to zero if rainfall Pg is zero
-        TF[Pg == 0] = 0.0
-        SF[Pg == 0] = 0.0
-        Ei[Pg == 0] = 0.0
-        Etrunk[Pg == 0] = 0.0
-
-        # PGsat calc (for the saturation of the canopy)
-        PGsat = -(1 / ER * S) * scipy.log(1 - (ER / (1 - p - pt)))
-
-        # Process rainfall series
-        for i in range(n):
-            Ecan = 0.0
-            Etrunk = 0.0
-            if Pg[i] < PGsat and Pg[i] > 0:
-                Ecan = (1 - p - pt) * Pg[i]
-                if Pg[i] > St / pt:
-                    Etrunk = St + pt * Pg[i]
-                Ei[i] = Ecan + Etrunk
-            if Pg[i] > PGsat and Pg[i] < St / pt:
-                Ecan = (((1 - p - pt) * PGsat) - S) + (ER * (Pg[i] - PGsat)) + S
-                Etrunk = 0.0
-            if Pg[i] > PGsat and Pg[i] > (St / pt):
-                Ecan = (
-                    (((1 - p - pt) * PGsat) - S)
-                    + (ER * (Pg[i] - PGsat))
-                    + S
-                    + (St + pt * Pg[i])
-                )
-                Etrunk = St + pt * Pg[i]
-            Ei[i] = Ecan + Etrunk
-            TF[i] = Pg[i] - Ei[i]
-    return Pg, TF, SF, Ei
+    rain = np.asarray(Pg, dtype=float)
+    ER, S, St, p, pt = (np.asarray(i, dtype=float) for i in (ER, S, St, p, pt))
+
+    # PGsat calc (for the saturation of the canopy)
+    PGsat = -(1 / ER * S) * np.log(1 - (ER / (1 - p - pt)))
+
+    # Canopy interception of the storms too small to saturate the canopy,
+    # and of the wetting up, saturated evaporation, and evaporation after
+    # the rain of the storms that do.  Missing rainfall stays missing.
+    Ecan = np.where(
+        rain >= PGsat,
+        (((1 - p - pt) * PGsat) - S) + (ER * (rain - PGsat)) + S,
+        (1 - p - pt) * rain,
+    )
+    # The trunks evaporate all of their share pt * Pg of the small storms,
+    # and St of the storms that saturate them, which drain the rest as
+    # stemflow.
+    Etrunk = np.minimum(pt * rain, St)
+    SF = np.maximum(pt * rain - St, 0.0)
+    Ei = Ecan + Etrunk
+    TF = rain - Ei - SF
+    return Pg, TF[()], SF[()], Ei[()]
 
 
 # Run doctest when executing module
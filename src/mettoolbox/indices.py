@@ -1,5 +1,7 @@
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional, Union
 
+import numpy as np
 import pandas as pd
 from pydantic import PositiveInt
 
@@ -24,26 +26,23 @@ def _nlarge_nsmall(
     if nlargest is None and nsmallest is None:
         return pe_data
 
+    def _select(n, ascending):
+        # Rank every column within each `groupby` period at once and keep the
+        # "n" top ranked values, which handles any number of columns.
+        rank = pe_data.groupby(pd.Grouper(freq=groupby)).rank(
+            method="first", ascending=ascending
+        )
+        selected = pe_data.where(rank <= int(n)).dropna(how="all")
+        return selected.reindex(
+            pd.date_range(start=selected.index[0], end=selected.index[-1], freq="D")
+        )
+
     nlarge = pd.Series()
     nsmall = pd.Series()
     if nlargest is not None:
-        nlarge = pe_data.resample(groupby).apply(
-            lambda x: x.nlargest(int(nlargest), x.columns[0])
-        )
-        nlarge = nlarge.droplevel(0)
-        nlarge.sort_index(inplace=True)
-        nlarge = nlarge.reindex(
-            pd.date_range(start=nlarge.index[0], end=nlarge.index[-1], freq="D")
-        )
+        nlarge = _select(nlargest, False)
     if nsmallest is not None:
-        nsmall = pe_data.resample(groupby).apply(
-            lambda x: x.nsmallest(int(nsmallest), x.columns[0])
-        )
-        nsmall = nsmall.droplevel(0)
-        nsmall.sort_index(inplace=True)
-        nsmall = nsmall.reindex(
-            pd.date_range(start=nsmall.index[0], end=nsmall.index[-1], freq="D")
-        )
+        nsmall = _select(nsmallest, True)
     if nsmallest is not None and nlargest is None:
         return nsmall
     if nsmallest is None and nlargest is not None:
@@ -51,6 +50,142 @@ def _nlarge_nsmall(
     return pd.concat([nsmall, nlarge], axis="columns")
 
 
+def _window_bounds(index, window, closed, center):
+    """Start (inclusive) and end (exclusive) row of each rolling window."""
+    nrows = len(index)
+    rows = np.arange(nrows)
+    if isinstance(window, (int, np.integer)):
+        closed = closed or "right"
+        start = rows - window + (1 if closed in ("right", "neither") else 0)
+        end = rows + (1 if closed in ("right", "both") else 0)
+        if center:
+            shift = (window - 1) // 2
+            start = start + shift
+            end = end + shift
+        return np.clip(start, 0, nrows), np.clip(end, 0, nrows), window
+
+    # Offset windows are variable length, located by their bounding times.
+    closed = closed or "right"
+    times = index.values
+    offset = pd.tseries.frequencies.to_offset(window)
+    start = np.searchsorted(
+        times,
+        (index - offset).values,
+        side="right" if closed in ("right", "neither") else "left",
+    )
+    end = np.searchsorted(
+        times, times, side="right" if closed in ("right", "both") else "left"
+    )
+    return start, end, 1
+
+
+def _rolling_sums(pe_data, windows, min_periods=None, closed=None, center=None):
+    """Rolling sums for every window in `windows` from one cumulative sum.
+
+    Each window total is the difference of the cumulative sum at the end and
+    start of the window, and the number of valid observations comes from the
+    cumulative count of non-missing values, so any number of fixed or offset
+    windows costs one pass over the data plus one subtraction each.
+    """
+    values = pe_data.to_numpy(dtype=float)
+    valid = ~np.isnan(values)
+    csum = np.zeros((len(values) + 1,) + values.shape[1:])
+    np.cumsum(np.where(valid, values, 0.0), axis=0, out=csum[1:])
+    ccount = np.zeros(csum.shape, dtype=np.int64)
+    np.cumsum(valid, axis=0, out=ccount[1:])
+
+    sums = []
+    for window in windows:
+        start, end, default_min_periods = _window_bounds(
+            pe_data.index, window, closed, center
+        )
+        nobs = ccount[end] - ccount[start]
+        total = csum[end] - csum[start]
+        sums.append(
+            np.where(
+                nobs >= (default_min_periods if min_periods is None else min_periods),
+                total,
+                np.nan,
+            )
+        )
+    return sums
+
+
+def _calendar_period(dates: pd.Series, freq: str) -> pd.Series:
+    """Integer calendar period (day, week or month of year) of each date."""
+    freq = freq.upper()
+    if freq.startswith("D"):
+        return dates.dt.dayofyear
+    if freq.startswith("W"):
+        return dates.dt.isocalendar().week.astype(int)
+    if freq.startswith("M"):
+        return dates.dt.month
+    raise ValueError(
+        tsutils.error_wrapper(
+            f"""
+            The frequency of the input data must be daily, weekly, or monthly
+            to calculate the SPEI.  The frequency of the input is "{freq}".
+            """
+        )
+    )
+
+
+def _spei_chunk(chunk, column, fit_type, dist_type):
+    """Fit and transform the calendar periods contained in `chunk`."""
+    return SPI().calculate(
+        chunk,
+        "date",
+        column,
+        freq_col="period",
+        scale=1,
+        fit_type=fit_type,
+        dist_type=dist_type,
+    )
+
+
+def _spei_parallel(tsd, column, scale, fit_type, dist_type, n_jobs):
+    """Calculate the SPEI with the per-period fits spread over `n_jobs` workers.
+
+    The distribution for each calendar period only sees the rows in that
+    period, so the periods are dealt round-robin into `n_jobs` chunks and each
+    chunk is handled by `SPI.calculate` in a separate process.  The rolling
+    sum for `scale` is calculated once on the full record before splitting so
+    that the windows span the period boundaries exactly as in the sequential
+    calculation.
+    """
+    pe_data = tsd[["date", column]].sort_values("date").reset_index(drop=True)
+    if scale > 1:
+        scaled = f"{column}_scale_{scale}"
+        pe_data[scaled] = pe_data[column].rolling(window=scale).sum()
+        pe_data = pe_data.drop(columns=column)
+        column = scaled
+    pe_data["period"] = _calendar_period(pe_data["date"], tsd.index.freqstr)
+
+    periods = sorted(pe_data["period"].unique())
+    chunks = [
+        pe_data[pe_data["period"].isin(periods[i::n_jobs])] for i in range(n_jobs)
+    ]
+    chunks = [chunk for chunk in chunks if len(chunk) > 0]
+
+    with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+        results = list(
+            executor.map(
+                _spei_chunk,
+                chunks,
+                [column] * len(chunks),
+                [fit_type] * len(chunks),
+                [dist_type] * len(chunks),
+            )
+        )
+
+    return (
+        pd.concat(results)
+        .drop(columns="period")
+        .sort_values("date")
+        .reset_index(drop=True)
+    )
+
+
 @tsutils.transform_args(source_units=tsutils.make_list)
 @validate_call(config={"arbitrary_types_allowed": True})
 @tsutils.doc(_LOCAL_DOCSTRINGS)
@@ -71,6 +206,7 @@ def spei(
     round_index=None,
     skiprows=None,
     index_type="datetime",
+    n_jobs: PositiveInt = 1,
 ):
     """
     Standard Precipitation/Evaporation Index.
@@ -152,6 +288,12 @@ def spei(
         Integer to specify the number of time periods over which the
         standardized precipitation index is to be calculated. If freq="M" then
         this is the number of months.
+    n_jobs : int (default=1)
+        Number of worker processes used to fit the distributions.  A
+        separate distribution is fit for each calendar period (12 for
+        monthly data, 52 for weekly, 365 for daily) and the fits are
+        independent, so they can be spread across processes.  The result
+        is identical to the sequential calculation.
     ${input_ts}
     ${start_date}
     ${end_date}
@@ -193,15 +335,18 @@ def spei(
 
     tsd = tsutils.asbestfreq(tsd)
 
-    ndf = spi.calculate(
-        tsd,
-        "date",
-        "pe",
-        freq=tsd.index.freqstr,
-        scale=scale,
-        fit_type=fit_type,
-        dist_type=dist_type,
-    )
+    if n_jobs > 1:
+        ndf = _spei_parallel(tsd, "pe", scale, fit_type, dist_type, n_jobs)
+    else:
+        ndf = spi.calculate(
+            tsd,
+            "date",
+            "pe",
+            freq=tsd.index.freqstr,
+            scale=scale,
+            fit_type=fit_type,
+            dist_type=dist_type,
+        )
 
     return _nlarge_nsmall(ndf, nlargest, nsmallest, groupby)
 
@@ -260,7 +405,7 @@ def pe(
     groupby : str
         Pandas offset period string representing the time over which the
         `nsmallest` or `nlargest` values would be evaluated.
-    window : int
+    window : int, str, or list
         [optional, default is 30]
 
         Size of the moving window. This is the number of observations used for
@@ -269,6 +414,10 @@ def pe(
         If its an offset then this will be the time period of each window. Each
         window will be a variable sized based on the observations included in
         the time-period. This is only valid for datetimelike indexes.
+
+        Can be a list, or a comma separated string on the command line, of
+        integers and/or offsets to calculate several windows at once.  The
+        result then has one column for each window.
     min_periods : int, default 170 days
         Minimum number of observations in window required to have a value
         (otherwise result is NA). For a window that is specified by an offset,
@@ -310,16 +459,41 @@ def pe(
         input_tsd=pe_data, source_units=["mm"], target_units=target_units
     )
 
-    pe_data = (
-        pe_data.astype(float)
-        .rolling(
-            window,
-            min_periods=min_periods,
-            center=center,
-            win_type=win_type,
-            closed=closed,
+    windows = tsutils.make_list(window)
+    pe_data = pe_data.astype(float)
+
+    if win_type is not None or (
+        center and not all(isinstance(i, (int, np.integer)) for i in windows)
+    ):
+        # Weighted windows and centered offset windows cannot be taken from
+        # a cumulative sum.
+        sums = [
+            pe_data.rolling(
+                i,
+                min_periods=min_periods,
+                center=center,
+                win_type=win_type,
+                closed=closed,
+            )
+            .sum()
+            .to_numpy()
+            for i in windows
+        ]
+    else:
+        sums = _rolling_sums(
+            pe_data, windows, min_periods=min_periods, closed=closed, center=center
         )
-        .sum()
-    )
+
+    if len(windows) == 1:
+        columns = pe_data.columns
+    else:
+        columns = []
+        for i in windows:
+            for col in pe_data.columns:
+                words = str(col).split(":")
+                words[0] = f"{words[0]}_{i}"
+                columns.append(":".join(words))
+
+    pe_data = pd.DataFrame(np.hstack(sums), index=pe_data.index, columns=columns)
 
     return _nlarge_nsmall(pe_data, nlargest, nsmallest, groupby)
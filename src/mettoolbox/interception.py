@@ -0,0 +1,143 @@
+from typing import List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from mettoolbox import evaplib
+from mettoolbox.mettoolbox_utils import _LOCAL_DOCSTRINGS
+from mettoolbox.toolbox_utils.src.toolbox_utils import tsutils
+from mettoolbox.utils import _convert_units, _return_input, _station_values
+
+try:
+    from pydantic import validate_arguments as validate_call
+except ImportError:
+    from pydantic import validate_call
+
+__all__ = ["gash"]
+
+
+@validate_call(config={"arbitrary_types_allowed": True})
+@tsutils.doc(_LOCAL_DOCSTRINGS)
+def gash(
+    evap_ratio: Union[float, List[float], str],
+    canopy_capacity: Union[float, List[float], str],
+    trunk_capacity: Union[float, List[float], str],
+    free_throughfall: Union[float, List[float], str],
+    trunk_fraction: Union[float, List[float], str],
+    source_units: Optional[Union[str, list]] = None,
+    columns=None,
+    input_ts="-",
+    start_date=None,
+    end_date=None,
+    dropna="no",
+    clean=False,
+    round_index=None,
+    skiprows=None,
+    index_type="datetime",
+    names=None,
+    target_units="mm",
+    print_input=False,
+):
+    """
+    Rainfall interception with the analytical model of [gash_1979]_.
+
+    Each column of the input is the daily rainfall of one station, and all
+    the storms of all the stations are calculated in one vectorized pass.
+    The vegetation parameters are either a single value used for every
+    station or a list, or comma separated string on the command line, with
+    one value for each rainfall column.
+
+    Parameters
+    ----------
+    evap_ratio : float or list
+        The ratio of the mean evaporation rate to the mean rainfall rate
+        during saturated conditions, E/R in Gash (1979).
+    canopy_capacity : float or list
+        The storage capacity of the canopy in mm, S in Gash (1979).  The
+        rainfall needed to saturate the canopy is calculated from it.
+    trunk_capacity : float or list
+        The storage capacity of the trunks in mm, St in Gash (1979).  The
+        trunks are saturated by storms larger than St / pt.
+    free_throughfall : float or list
+        The fraction of rainfall that falls through the canopy without
+        touching it, p in Gash (1979).
+    trunk_fraction : float or list
+        The fraction of rainfall that is diverted to the trunks, pt in
+        Gash (1979).
+    ${source_units}
+    ${columns}
+    ${input_ts}
+    ${start_date}
+    ${end_date}
+    ${dropna}
+    ${clean}
+    ${round_index}
+    ${skiprows}
+    ${index_type}
+    ${names}
+    ${target_units}
+    ${print_input}
+    ${tablefmt}
+
+    Returns
+    -------
+    pandas.DataFrame
+        The interception, throughfall, and stemflow of each station in
+        columns named "<station>_interception", "<station>_throughfall",
+        and "<station>_stemflow".
+
+    Examples
+    --------
+    >>> loss = gash(0.15, 1.3, 0.2, 0.2, 0.02, "mm", input_ts="rain.csv")
+
+    Command line::
+
+        mettoolbox interception gash 0.15,0.12 1.3 0.2 0.2 0.02 --source_units=mm,mm < rain.csv
+
+    References
+    ----------
+    .. [gash_1979] Gash, J. H. C. (1979). An analytical model of rainfall
+       interception by forests. Quarterly Journal of the Royal
+       Meteorological Society, 105(443), 43-55.
+    """
+    tsd = tsutils.common_kwds(
+        input_ts,
+        skiprows=skiprows,
+        names=names,
+        index_type=index_type,
+        start_date=start_date,
+        end_date=end_date,
+        pick=columns,
+        round_index=round_index,
+        dropna=dropna,
+        clean=clean,
+    )
+    nstations = len(tsd.columns)
+    tsd = _convert_units(tsd, source_units, "mm")
+
+    params = [
+        _station_values(name, values, nstations)
+        for name, values in (
+            ("evap_ratio", evap_ratio),
+            ("canopy_capacity", canopy_capacity),
+            ("trunk_capacity", trunk_capacity),
+            ("free_throughfall", free_throughfall),
+            ("trunk_fraction", trunk_fraction),
+        )
+    ]
+    _, throughfall, stemflow, interception = evaplib.gash79(
+        tsd.to_numpy(dtype=float), *params
+    )
+
+    stations = [str(col).split(":")[0] for col in tsd.columns]
+    result = pd.DataFrame(
+        np.hstack([interception, throughfall, stemflow]),
+        index=tsd.index,
+        columns=[
+            f"{station}_{variable}:mm"
+            for variable in ("interception", "throughfall", "stemflow")
+            for station in stations
+        ],
+    )
+    result = _convert_units(result, "mm", target_units)
+    return _return_input(print_input, tsd, result)
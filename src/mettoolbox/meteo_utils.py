@@ -1,5 +1,6 @@
 """The meteo_utils module contains utility functions for meteorological data"""
 
+import numpy as np
 from numpy import arccos, array, clip, cos, exp, log, minimum, mod, pi, sin, tan
 from pandas import to_numeric
 
@@ -241,6 +242,79 @@ def calc_ea(tmean=None, tmax=None, tmin=None, rhmax=None, rhmin=None, rh=None):
         return rh / 100 * es
 
 
+def calc_vapour(tmean, pressure, rh=None, out=None):
+    """Saturation vapour pressure, its slope, and the psychrometric constant.
+
+    The quantities of `calc_e0`, `calc_vpc`, and `calc_psy` from one
+    evaluation of the exponential, and with `rh` also those of `calc_ea` and
+    the vapour pressure deficit.  The results are written into the `out`
+    arrays, which are also used for the intermediate values, so there are no
+    temporary arrays.
+
+    Parameters
+    ----------
+    tmean : array_like
+        air temperature [°C]
+    pressure : array_like
+        atmospheric pressure [kPa]
+    rh : array_like, optional
+        relative humidity [%]
+    out : tuple of numpy.ndarray, optional
+        Three arrays, or five with `rh`, of the broadcast shape of the
+        inputs to write the results into.  If None new arrays are returned.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        es [kPa], vpc [kPa °C-1], and psy [kPa °C-1], followed by ea [kPa]
+        and vpd [kPa] if `rh` is given.
+
+    Examples
+    --------
+    >>> es, vpc, psy, ea, vpd = calc_vapour(tmean, pressure, rh=rh)
+
+    Notes
+    -----
+    Based on equations 11, 13, 14, and (3-1) in [allen_1998]_ and FAO (1990),
+    ANNEX V, eq. 4, the same as the separate functions.
+    """
+    tmean = np.asarray(tmean, dtype=float)
+    pressure = np.asarray(pressure, dtype=float)
+    args = (tmean, pressure) if rh is None else (tmean, pressure, np.asarray(rh))
+    nout = 3 if rh is None else 5
+    if out is None:
+        shape = np.broadcast_shapes(*(arg.shape for arg in args))
+        out = tuple(np.empty(shape) for _ in range(nout))
+    elif len(out) != nout:
+        raise ValueError(f"Need {nout} arrays in `out`, not {len(out)}.")
+    es, vpc, psy = out[:3]
+
+    # 0.6108 * exp(17.27 * tmean / (tmean + 237.3))
+    np.add(tmean, 237.3, out=vpc)
+    np.multiply(tmean, 17.27, out=es)
+    np.divide(es, vpc, out=es)
+    np.exp(es, out=es)
+    np.multiply(es, 0.6108, out=es)
+
+    # 4098 * es / (tmean + 237.3) ** 2 with psy as scratch.
+    np.square(vpc, out=vpc)
+    np.multiply(es, 4098, out=psy)
+    np.divide(psy, vpc, out=vpc)
+
+    # CP * pressure / (0.622 * (2.501 - 0.002361 * tmean))
+    np.multiply(tmean, 0.002361, out=psy)
+    np.subtract(2.501, psy, out=psy)
+    np.multiply(psy, 0.622, out=psy)
+    np.divide(CP * pressure, psy, out=psy)
+
+    if rh is not None:
+        ea, vpd = out[3:]
+        np.divide(rh, 100, out=ea)
+        np.multiply(ea, es, out=ea)
+        np.subtract(es, ea, out=vpd)
+    return out
+
+
 def day_of_year(tindex):
     """Day of the year (1-365) based on pandas.Index
 
@@ -331,7 +405,7 @@ def sunset_angle_hour(tindex, lat, lz, lon):
     b = 2 * pi * (j - 81) / 364
     sc = 0.1645 * sin(2 * b) - 0.1255 * cos(b) - 0.025 * sin(b)
 
-    sol_t = t + 0.006667 * (lz - lon) + sc - 12
+    sol_t = t + 0.06667 * (lz - lon) + sc - 12
 
     omega = array(pi / 12 * sol_t)
     omega = _wrap(omega, -pi, pi)
@@ -13,10 +13,13 @@ Meteorological function names
     - pottemp:    Calculate potential temperature (1000 hPa reference pressure)
     - rho_calc:   Calculate air density
     - sun_NR:     Maximum sunshine duration [h] and extraterrestrial radiation [J/day]
+    - vapour_calc: Calculate es, Delta, gamma, ea, and vpd in one pass
     - vpd_calc:   Calculate vapour pressure deficits
     - windvec:    Calculate average wind direction and speed
 
-Module requires and imports math and scipy modules.
+Module requires and imports math, numpy, and pandas modules.  The
+element-wise calculations are compiled to parallel ufuncs when numba is
+installed and otherwise run as numpy array expressions.
 
 Tested for compatibility with Python 2.7.
 
@@ -29,7 +32,8 @@ import math
 
 import numpy as np
 import pandas as pd
-import scipy
+
+from . import _jit
 
 
 def _arraytest(*args):
@@ -62,13 +66,118 @@ def _arraytest(*args):
     rargs = []
     for a in args:
         if isinstance(a, (list, tuple)):
-            rargs.append(scipy.array(a))
+            rargs.append(np.array(a))
         else:
             rargs.append(a)
     return rargs[0] if len(rargs) == 1 else rargs
 
 
-def cp_calc(airtemp=scipy.array([]), rh=scipy.array([]), airpress=scipy.array([])):
+# Element-wise helpers shared by the kernels here and in evaplib.  They are
+# branch-free so that they work on single values inside numba kernels and on
+# whole arrays in the numpy fallback.
+
+
+@_jit.jit
+def _es(airtemp):
+    """Arden-Buck saturated vapour pressure [Pa], over ice at or below 0 C."""
+    water = (airtemp > 0) * 1.0
+    ice = 1.0 - water
+    a = 6.1121 * water + 6.1115 * ice
+    b = 18.678 * water + 23.036 * ice
+    c = 234.5 * water + 333.7 * ice
+    d = 257.14 * water + 279.82 * ice
+    return a * np.exp((b - (airtemp / c)) * (airtemp / (d + airtemp))) * 100.0
+
+
+@_jit.jit
+def _delta(airtemp, es):
+    """Slope of the saturated vapour pressure curve [Pa K-1]."""
+    return es * 4098.0 / ((airtemp + 237.3) ** 2)
+
+
+@_jit.jit
+def _ea(rh, es):
+    """Actual vapour pressure [Pa] from `es` in Pa."""
+    return rh / 100.0 * es
+
+
+@_jit.jit
+def _cp(ea, airpress):
+    """Specific heat of air [J kg-1 K-1]."""
+    return 0.24 * 4185.5 * (1 + 0.8 * (0.622 * ea / (airpress - ea)))
+
+
+@_jit.jit
+def _L(airtemp):
+    """Latent heat of vapourisation [J kg-1]."""
+    return 4185.5 * (751.78 - 0.5655 * (airtemp + 273.15))
+
+
+@_jit.jit
+def _gamma(airtemp, ea, airpress):
+    """Psychrometric constant [Pa K-1]."""
+    return _cp(ea, airpress) * airpress / (0.622 * _L(airtemp))
+
+
+@_jit.jit
+def _rho(airtemp, ea, airpress):
+    """Density of air [kg m-3]."""
+    return (
+        1.201
+        * (290.0 * (airpress - 0.378 * ea))
+        / (1000.0 * (airtemp + 273.15))
+        / 100.0
+    )
+
+
+@_jit.vectorize(3)
+def _cp_calc(airtemp, rh, airpress):
+    return _cp(_ea(rh, _es(airtemp)), airpress)
+
+
+@_jit.vectorize(1)
+def _Delta_calc(airtemp):
+    return _delta(airtemp, _es(airtemp))
+
+
+@_jit.vectorize(2)
+def _ea_calc(airtemp, rh):
+    return _ea(rh, _es(airtemp))
+
+
+@_jit.vectorize(1)
+def _es_calc(airtemp):
+    return _es(airtemp)
+
+
+@_jit.vectorize(3)
+def _gamma_calc(airtemp, rh, airpress):
+    return _gamma(airtemp, _ea(rh, _es(airtemp)), airpress)
+
+
+@_jit.vectorize(1)
+def _L_calc(airtemp):
+    return _L(airtemp)
+
+
+@_jit.vectorize(3)
+def _pottemp(airtemp, rh, airpress):
+    cp = _cp(_ea(rh, _es(airtemp)), airpress)
+    return (airtemp + 273.15) * (100000.0 / airpress) ** (287.0 / cp) - 273.15
+
+
+@_jit.vectorize(3)
+def _rho_calc(airtemp, rh, airpress):
+    return _rho(airtemp, _ea(rh, _es(airtemp)), airpress)
+
+
+@_jit.vectorize(2)
+def _vpd_calc(airtemp, rh):
+    es = _es(airtemp)
+    return es - _ea(rh, es)
+
+
+def cp_calc(airtemp=np.array([]), rh=np.array([]), airpress=np.array([])):
     """
     Function to calculate the specific heat of air:
 
@@ -110,12 +219,10 @@ def cp_calc(airtemp=scipy.array([]), rh=scipy.array([]), airpress=scipy.array([]
     # Test input array/value
     airtemp, rh, airpress = _arraytest(airtemp, rh, airpress)
 
-    # calculate vapour pressures
-    eact = ea_calc(airtemp, rh)
-    return 0.24 * 4185.5 * (1 + 0.8 * (0.622 * eact / (airpress - eact)))
+    return _cp_calc(airtemp, rh, airpress)
 
 
-def Delta_calc(airtemp=scipy.array([])):
+def Delta_calc(airtemp=np.array([])):
     """
     Function to calculate the slope of the temperature - vapour pressure curve
     (Delta) from air temperature T:
@@ -149,13 +256,10 @@ def Delta_calc(airtemp=scipy.array([])):
     # Test input array/value
     airtemp = _arraytest(airtemp)
 
-    # calculate saturation vapour pressure at temperature
-    es = es_calc(airtemp)  # in kPa
-
-    return es * 4098.0 / ((airtemp + 237.3) ** 2) * 1000
+    return _Delta_calc(airtemp)
 
 
-def ea_calc(airtemp=scipy.array([]), rh=scipy.array([])):
+def ea_calc(airtemp=np.array([]), rh=np.array([])):
     """
     Function to calculate actual vapour pressure from relative humidity:
 
@@ -181,10 +285,7 @@ def ea_calc(airtemp=scipy.array([]), rh=scipy.array([])):
     # Test input array/value
     airtemp, rh = _arraytest(airtemp, rh)
 
-    # Calculate saturation vapour pressures
-    es = es_calc(airtemp) * 10  # kPa convert to hPa
-
-    return rh / 100.0 * es
+    return _ea_calc(airtemp, rh)
 
 
 def es_calc(airtemp):
@@ -219,33 +320,10 @@ def es_calc(airtemp):
     """
     airtemp = pd.to_numeric(airtemp, errors="coerce")
 
-    # Calculate saturated vapour pressures, distinguish between water/ice
-    mask = airtemp > 0
+    return _es_calc(airtemp) / 1000.0  # in kPa
 
-    es = pd.Series(0.0, index=airtemp.index)
 
-    # Calculate saturation vapour pressure over liquid water.
-    es[mask] = 6.1121 * np.exp(
-        (
-            (18.678 - (airtemp[mask] / 234.5))
-            * (airtemp[mask] / (257.14 + airtemp[mask]))
-        ).astype(float)
-    )
-
-    # Calculate saturation vapour pressure for ice
-    es[~mask] = 6.1115 * np.exp(
-        (
-            (23.036 - (airtemp[~mask] / 333.7))
-            * (airtemp[~mask] / (279.82 + airtemp[~mask]))
-        ).astype(float)
-    )
-
-    # Convert from hPa to kPa
-    es = es / 10.0
-    return es  # in kPa
-
-
-def gamma_calc(airtemp=scipy.array([]), rh=scipy.array([]), airpress=scipy.array([])):
+def gamma_calc(airtemp=np.array([]), rh=np.array([]), airpress=np.array([])):
     """
     Function to calculate the psychrometric constant gamma.
 
@@ -283,13 +361,10 @@ def gamma_calc(airtemp=scipy.array([]), rh=scipy.array([]), airpress=scipy.array
     # Test input array/value
     airtemp, rh, airpress = _arraytest(airtemp, rh, airpress)
 
-    # Calculate cp and Lambda values
-    cp = cp_calc(airtemp, rh, airpress)
-    L = L_calc(airtemp)
-    return cp * airpress / (0.622 * L)
+    return _gamma_calc(airtemp, rh, airpress)
 
 
-def L_calc(airtemp=scipy.array([])):
+def L_calc(airtemp=np.array([])):
     """
     Function to calculate the latent heat of vapourisation from air temperature.
 
@@ -316,10 +391,10 @@ def L_calc(airtemp=scipy.array([])):
     # Test input array/value
     airtemp = _arraytest(airtemp)
 
-    return 4185.5 * (751.78 - 0.5655 * (airtemp + 273.15))
+    return _L_calc(airtemp)
 
 
-def pottemp(airtemp=scipy.array([]), rh=scipy.array([]), airpress=scipy.array([])):
+def pottemp(airtemp=np.array([]), rh=np.array([]), airpress=np.array([])):
     """
     Function to calculate the potential temperature air, theta, from air
     temperatures, relative humidity and air pressure. Reference pressure
@@ -347,12 +422,10 @@ def pottemp(airtemp=scipy.array([]), rh=scipy.array([]), airpress=scipy.array([]
     # Test input array/value
     airtemp, rh, airpress = _arraytest(airtemp, rh, airpress)
 
-    # Determine cp
-    cp = cp_calc(airtemp, rh, airpress)
-    return (airtemp + 273.15) * pow((100000.0 / airpress), (287.0 / cp)) - 273.15
+    return _pottemp(airtemp, rh, airpress)
 
 
-def rho_calc(airtemp=scipy.array([]), rh=scipy.array([]), airpress=scipy.array([])):
+def rho_calc(airtemp=np.array([]), rh=np.array([]), airpress=np.array([])):
     """
     Function to calculate the density of air, rho, from air
     temperatures, relative humidity and air pressure.
@@ -383,17 +456,10 @@ def rho_calc(airtemp=scipy.array([]), rh=scipy.array([]), airpress=scipy.array([
     # Test input array/value
     airtemp, rh, airpress = _arraytest(airtemp, rh, airpress)
 
-    # Calculate actual vapour pressure
-    eact = ea_calc(airtemp, rh)
-    return (
-        1.201
-        * (290.0 * (airpress - 0.378 * eact))
-        / (1000.0 * (airtemp + 273.15))
-        / 100.0
-    )
+    return _rho_calc(airtemp, rh, airpress)
 
 
-def sun_NR(doy=scipy.array([]), lat=float):
+def sun_NR(doy=np.array([]), lat=float):
     """
     Function to calculate the maximum sunshine duration [h] and incoming
     radiation [MJ/day] at the top of the atmosphere from day of year and
@@ -441,30 +507,134 @@ def sun_NR(doy=scipy.array([]), lat=float):
     # Convert latitude [degrees] to radians
     latrad = lat * math.pi / 180.0
     # calculate solar declination dt [radians]
-    dt = 0.409 * scipy.sin(2 * math.pi / 365 * doy - 1.39)
+    dt = 0.409 * np.sin(2 * math.pi / 365 * doy - 1.39)
     # calculate sunset hour angle [radians]
-    ws = scipy.arccos(-scipy.tan(latrad) * scipy.tan(dt))
+    ws = np.arccos(-np.tan(latrad) * np.tan(dt))
     # Calculate sunshine duration N [h]
     N = 24 / math.pi * ws
     # Calculate day angle j [radians]
     j = 2 * math.pi / 365.25 * doy
     # Calculate relative distance to sun
-    dr = 1.0 + 0.03344 * scipy.cos(j - 0.048869)
+    dr = 1.0 + 0.03344 * np.cos(j - 0.048869)
     # Calculate Rext
     Rext = (
         S
         * 86400
         / math.pi
         * dr
-        * (
-            ws * scipy.sin(latrad) * scipy.sin(dt)
-            + scipy.sin(ws) * scipy.cos(latrad) * scipy.cos(dt)
-        )
+        * (ws * np.sin(latrad) * np.sin(dt) + np.sin(ws) * np.cos(latrad) * np.cos(dt))
     )
     return N, Rext
 
 
-def vpd_calc(airtemp=scipy.array([]), rh=scipy.array([])):
+def vapour_calc(airtemp, rh=None, airpress=None, out=None):
+    """
+    Function to calculate the saturation vapour pressure, the slope of the
+    vapour pressure curve, and with relative humidity and air pressure the
+    psychrometric constant, actual vapour pressure, and vapour pressure
+    deficit, all from one evaluation of the saturation vapour pressure.
+
+    The values are the same as those of es_calc, Delta_calc, gamma_calc,
+    ea_calc, and vpd_calc, which each calculate the saturation vapour
+    pressure again.  The results are written into the `out` arrays, which
+    are also used for the intermediate values.
+
+    Parameters:
+        - airtemp: (array of) air temperature [Celsius].
+        - rh: (array of) relative humidity data [%].
+        - airpress: (array of) air pressure data [Pa].
+        - out: tuple of two arrays, or five with rh and airpress, of the
+          broadcast shape of the input to write the results into.  If None
+          new arrays are returned.
+
+    Returns:
+        - es: array of saturated vapour pressure [kPa].
+        - Delta: array of slope of saturated vapour curve [Pa K-1].
+        - gamma: array of psychrometric constant values [Pa K-1], only with
+          rh and airpress.
+        - ea: array of actual vapour pressure [Pa], only with rh and
+          airpress.
+        - vpd: array of vapour pressure deficits [Pa], only with rh and
+          airpress.
+
+    Examples
+    --------
+        >>> es, Delta = vapour_calc([20, 25])
+        >>> es, Delta, gamma, ea, vpd = vapour_calc(t, rh, airpress)
+
+    """
+    airtemp = np.asarray(airtemp, dtype=float)
+    args = [airtemp]
+    if rh is not None:
+        rh = np.asarray(rh, dtype=float)
+        airpress = np.asarray(airpress, dtype=float)
+        args.extend([rh, airpress])
+    nout = 2 if rh is None else 5
+    if out is None:
+        shape = np.broadcast_shapes(*(arg.shape for arg in args))
+        out = tuple(np.empty(shape) for _ in range(nout))
+    elif len(out) != nout:
+        raise ValueError(f"Need {nout} arrays in `out`, not {len(out)}.")
+    es, Delta = out[:2]
+    # Scratch space, the gamma output if there is one.
+    work = out[2] if rh is not None else np.empty_like(es)
+
+    # Arden-Buck over water above 0 C and over ice otherwise, as es_calc.
+    water = airtemp > 0
+    for where, a, b, c, d in (
+        (water, 6.1121, 18.678, 234.5, 257.14),
+        (~water, 6.1115, 23.036, 333.7, 279.82),
+    ):
+        np.divide(airtemp, c, out=Delta, where=where)
+        np.subtract(b, Delta, out=Delta, where=where)
+        np.add(d, airtemp, out=work, where=where)
+        np.divide(airtemp, work, out=es, where=where)
+        np.multiply(Delta, es, out=es, where=where)
+        np.exp(es, out=es, where=where)
+        np.multiply(es, a, out=es, where=where)
+    np.divide(es, 10.0, out=es)
+
+    # es * 4098 / (airtemp + 237.3) ** 2 * 1000
+    np.add(airtemp, 237.3, out=work)
+    np.square(work, out=work)
+    np.multiply(es, 4098.0, out=Delta)
+    np.divide(Delta, work, out=Delta)
+    np.multiply(Delta, 1000, out=Delta)
+
+    if rh is None:
+        return out
+
+    gamma, ea, vpd = out[2:]
+
+    # ea = rh / 100 * es with es in Pa, as ea_calc.
+    np.multiply(es, 1000, out=gamma)
+    np.divide(rh, 100.0, out=ea)
+    np.multiply(ea, gamma, out=ea)
+
+    # cp * airpress with cp as cp_calc into vpd.
+    np.subtract(airpress, ea, out=vpd)
+    np.multiply(ea, 0.622, out=gamma)
+    np.divide(gamma, vpd, out=vpd)
+    np.multiply(vpd, 0.8, out=vpd)
+    np.add(vpd, 1, out=vpd)
+    np.multiply(vpd, 0.24 * 4185.5, out=vpd)
+    np.multiply(vpd, airpress, out=vpd)
+
+    # gamma = cp * airpress / (0.622 * L) with L as L_calc.
+    np.add(airtemp, 273.15, out=gamma)
+    np.multiply(gamma, 0.5655, out=gamma)
+    np.subtract(751.78, gamma, out=gamma)
+    np.multiply(gamma, 4185.5, out=gamma)
+    np.multiply(gamma, 0.622, out=gamma)
+    np.divide(vpd, gamma, out=gamma)
+
+    # vpd = es - ea in Pa, as vpd_calc.
+    np.multiply(es, 1000, out=vpd)
+    np.subtract(vpd, ea, out=vpd)
+    return out
+
+
+def vpd_calc(airtemp=np.array([]), rh=np.array([])):
     """
     Function to calculate vapour pressure deficit.
 
@@ -488,13 +658,10 @@ def vpd_calc(airtemp=scipy.array([]), rh=scipy.array([])):
     # Test input array/value
     airtemp, rh = _arraytest(airtemp, rh)
 
-    # Calculate saturation vapour pressures
-    es = es_calc(airtemp) * 10  # kPa convert to hPa
-    eact = ea_calc(airtemp, rh)
-    return es - eact
+    return _vpd_calc(airtemp, rh)
 
 
-def windvec(u=scipy.array([]), D=scipy.array([])):
+def windvec(u=np.array([]), D=np.array([])):
     """
     Function to calculate the wind vector from time series of wind
     speed and direction.
@@ -509,8 +676,8 @@ def windvec(u=scipy.array([]), D=scipy.array([])):
 
     Examples
     --------
-        >>> u = scipy.array([[ 3.],[7.5],[2.1]])
-        >>> D = scipy.array([[340],[356],[2]])
+        >>> u = np.array([[ 3.],[7.5],[2.1]])
+        >>> D = np.array([[340],[356],[2]])
         >>> windvec(u,D)
         (4.162354202836905, array([ 353.2118882]))
         >>> uv, Dv = windvec(u,D)
@@ -523,23 +690,15 @@ def windvec(u=scipy.array([]), D=scipy.array([])):
     # Test input array/value
     u, D = _arraytest(u, D)
 
-    ve = 0.0  # define east component of wind speed
-    vn = 0.0  # define north component of wind speed
     D = D * math.pi / 180.0  # convert wind direction degrees to radians
-    for i in range(len(u)):
-        ve = ve + u[i] * math.sin(D[i])  # calculate sum east speed components
-        vn = vn + u[i] * math.cos(D[i])  # calculate sum north speed components
-    ve = -ve / len(u)  # determine average east speed component
-    vn = -vn / len(u)  # determine average north speed component
-    uv = math.sqrt(ve * ve + vn * vn)  # calculate wind speed vector magnitude
+    ve = -np.sum(u * np.sin(D), axis=0) / len(u)  # average east speed component
+    vn = -np.sum(u * np.cos(D), axis=0) / len(u)  # average north speed component
+    uv = np.sqrt(ve * ve + vn * vn)  # calculate wind speed vector magnitude
     # Calculate wind speed vector direction
-    vdir = scipy.arctan2(ve, vn)
+    vdir = np.arctan2(ve, vn)
     vdir = vdir * 180.0 / math.pi  # Convert radians to degrees
-    if vdir < 180:
-        Dv = vdir + 180.0
-    else:
-        Dv = vdir - 180 if vdir > 180.0 else vdir
-    return uv, Dv  # uv in m/s, Dv in dgerees from North
+    Dv = np.where(vdir < 180, vdir + 180.0, np.where(vdir > 180.0, vdir - 180, vdir))
+    return uv, Dv[()]  # uv in m/s, Dv in dgerees from North
 
 
 if __name__ == "__main__":
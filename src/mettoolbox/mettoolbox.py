@@ -2,7 +2,7 @@ import os.path
 import sys
 import warnings
 
-from mettoolbox import disaggregate, indices, pet, ret
+from mettoolbox import disaggregate, indices, interception, pet, ret
 from mettoolbox.toolbox_utils.src.toolbox_utils import tsutils
 
 warnings.filterwarnings("ignore")
@@ -18,12 +18,135 @@ def main():
     program.add_subprog("pet")
     program.add_subprog("ret")
     program.add_subprog("indices")
+    program.add_subprog("interception")
 
     @program.command()
     def about():
         """Display version number and system information."""
         tsutils.about(__name__)
 
+    @program.disaggregate.command("all", formatter_class=RSTHelpFormatter)
+    @tsutils.copy_doc(disaggregate.all_variables)
+    def all_cli(
+        source_units,
+        input_ts="-",
+        start_date=None,
+        end_date=None,
+        dropna="no",
+        clean=False,
+        round_index=None,
+        skiprows=None,
+        index_type="datetime",
+        names=None,
+        print_input=False,
+        tablefmt="csv",
+        lat=None,
+        lon=None,
+        temperature_method=None,
+        min_max_time="fix",
+        mod_nighttime=False,
+        max_delta=False,
+        hourly=None,
+        temp_min_col=None,
+        temp_max_col=None,
+        temp_mean_col=None,
+        humidity_method=None,
+        dewpoint_method=None,
+        hum_min_col=None,
+        hum_max_col=None,
+        hum_mean_col=None,
+        a0=None,
+        a1=None,
+        kr=None,
+        hourly_precip_hum=None,
+        preserve_daily_mean=None,
+        wind_method=None,
+        wind_col=None,
+        a=None,
+        b=None,
+        t_shift=None,
+        seed=None,
+        radiation_method=None,
+        glob_swr_col=None,
+        ssd_col=None,
+        pot_rad=None,
+        angstr_a=0.25,
+        angstr_b=0.5,
+        bristcamp_a=0.75,
+        bristcamp_c=2.4,
+        hourly_rad=None,
+        precipitation_method=None,
+        precip_col=None,
+        masterstation_hour_col=None,
+        hourly_precip=None,
+        nmembers=1,
+        evaporation_method=None,
+        evap_col=None,
+        sun_times_cache=None,
+        target_freq=None,
+    ):
+        """Disaggregate all variables of a daily record to hourly."""
+        tsutils.printiso(
+            disaggregate.all_variables(
+                source_units=source_units,
+                input_ts=input_ts,
+                start_date=start_date,
+                end_date=end_date,
+                dropna=dropna,
+                clean=clean,
+                round_index=round_index,
+                skiprows=skiprows,
+                index_type=index_type,
+                names=names,
+                print_input=print_input,
+                lat=lat,
+                lon=lon,
+                temperature_method=temperature_method,
+                min_max_time=min_max_time,
+                mod_nighttime=mod_nighttime,
+                max_delta=max_delta,
+                hourly=hourly,
+                temp_min_col=temp_min_col,
+                temp_max_col=temp_max_col,
+                temp_mean_col=temp_mean_col,
+                humidity_method=humidity_method,
+                dewpoint_method=dewpoint_method,
+                hum_min_col=hum_min_col,
+                hum_max_col=hum_max_col,
+                hum_mean_col=hum_mean_col,
+                a0=a0,
+                a1=a1,
+                kr=kr,
+                hourly_precip_hum=hourly_precip_hum,
+                preserve_daily_mean=preserve_daily_mean,
+                wind_method=wind_method,
+                wind_col=wind_col,
+                a=a,
+                b=b,
+                t_shift=t_shift,
+                seed=seed,
+                radiation_method=radiation_method,
+                glob_swr_col=glob_swr_col,
+                ssd_col=ssd_col,
+                pot_rad=pot_rad,
+                angstr_a=angstr_a,
+                angstr_b=angstr_b,
+                bristcamp_a=bristcamp_a,
+                bristcamp_c=bristcamp_c,
+                hourly_rad=hourly_rad,
+                precipitation_method=precipitation_method,
+                precip_col=precip_col,
+                masterstation_hour_col=masterstation_hour_col,
+                hourly_precip=hourly_precip,
+                nmembers=nmembers,
+                evaporation_method=evaporation_method,
+                evap_col=evap_col,
+                sun_times_cache=sun_times_cache,
+                target_freq=target_freq,
+            ),
+            tablefmt=tablefmt,
+        )
+
     @program.disaggregate.command("evaporation", formatter_class=RSTHelpFormatter)
     @tsutils.copy_doc(disaggregate.evaporation)
     def evaporation_cli(
@@ -43,6 +166,7 @@ def main():
         print_input=False,
         tablefmt="csv",
         lat=None,
+        target_freq=None,
     ):
         """Disaggregate daily to hourly data."""
         tsutils.printiso(
@@ -62,6 +186,7 @@ def main():
                 target_units=target_units,
                 print_input=print_input,
                 lat=lat,
+                target_freq=target_freq,
             ),
             tablefmt=tablefmt,
         )
@@ -215,6 +340,10 @@ def main():
         tablefmt="csv",
         columns=None,
         masterstation_hour_col=None,
+        hourly_precip=None,
+        nmembers=1,
+        seed=None,
+        target_freq=None,
     ):
         """Disaggregate daily to hourly data."""
         tsutils.printiso(
@@ -234,6 +363,10 @@ def main():
                 target_units=target_units,
                 print_input=print_input,
                 masterstation_hour_col=masterstation_hour_col,
+                hourly_precip=hourly_precip,
+                nmembers=nmembers,
+                seed=seed,
+                target_freq=target_freq,
             ),
             tablefmt=tablefmt,
         )
@@ -269,6 +402,7 @@ def main():
         ssd_col=None,
         temp_min_col=None,
         temp_max_col=None,
+        sun_times_cache=None,
     ):
         """Disaggregate daily to hourly data."""
         tsutils.printiso(
@@ -299,6 +433,7 @@ def main():
                 ssd_col=ssd_col,
                 temp_min_col=temp_min_col,
                 temp_max_col=temp_max_col,
+                sun_times_cache=sun_times_cache,
             ),
             tablefmt=tablefmt,
         )
@@ -328,7 +463,13 @@ def main():
         lat=None,
         lon=None,
         hourly=None,
+        hourly_lat=None,
+        hourly_lon=None,
         max_delta=False,
+        station_col=None,
+        n_jobs=1,
+        sun_times_cache=None,
+        target_freq=None,
     ):
         """Disaggregate daily temperature to hourly temperature."""
         tsutils.printiso(
@@ -354,7 +495,13 @@ def main():
                 lat=lat,
                 lon=lon,
                 hourly=hourly,
+                hourly_lat=hourly_lat,
+                hourly_lon=hourly_lon,
                 max_delta=max_delta,
+                station_col=station_col,
+                n_jobs=n_jobs,
+                sun_times_cache=sun_times_cache,
+                target_freq=target_freq,
             ),
             tablefmt=tablefmt,
         )
@@ -380,6 +527,8 @@ def main():
         a=None,
         b=None,
         t_shift=None,
+        seed=None,
+        target_freq=None,
     ):
         """Disaggregate daily to hourly data."""
         tsutils.printiso(
@@ -401,6 +550,8 @@ def main():
                 a=a,
                 b=b,
                 t_shift=t_shift,
+                seed=seed,
+                target_freq=target_freq,
             ),
             tablefmt=tablefmt,
         )
@@ -488,6 +639,194 @@ def main():
             tablefmt=tablefmt,
         )
 
+    @program.pet.command("e0", formatter_class=RSTHelpFormatter)
+    @tsutils.copy_doc(pet.e0)
+    def e0_cli(
+        lat,
+        temp_mean_col,
+        rh_col,
+        airpress_col,
+        srad_col,
+        wind_col,
+        source_units=None,
+        albedo=0.08,
+        elevation=0.0,
+        input_ts="-",
+        start_date=None,
+        end_date=None,
+        dropna="no",
+        clean=False,
+        round_index=None,
+        skiprows=None,
+        index_type="datetime",
+        names=None,
+        target_units="mm",
+        print_input=False,
+        tablefmt="csv",
+    ):
+        tsutils.printiso(
+            pet.e0(
+                lat,
+                temp_mean_col,
+                rh_col,
+                airpress_col,
+                srad_col,
+                wind_col,
+                source_units=source_units,
+                albedo=albedo,
+                elevation=elevation,
+                input_ts=input_ts,
+                start_date=start_date,
+                end_date=end_date,
+                dropna=dropna,
+                clean=clean,
+                round_index=round_index,
+                skiprows=skiprows,
+                index_type=index_type,
+                names=names,
+                target_units=target_units,
+                print_input=print_input,
+            ),
+            tablefmt=tablefmt,
+        )
+
+    @program.pet.command("em", formatter_class=RSTHelpFormatter)
+    @tsutils.copy_doc(pet.em)
+    def em_cli(
+        temp_mean_col,
+        rh_col,
+        airpress_col,
+        srad_col,
+        source_units=None,
+        input_ts="-",
+        start_date=None,
+        end_date=None,
+        dropna="no",
+        clean=False,
+        round_index=None,
+        skiprows=None,
+        index_type="datetime",
+        names=None,
+        target_units="mm",
+        print_input=False,
+        tablefmt="csv",
+    ):
+        tsutils.printiso(
+            pet.em(
+                temp_mean_col,
+                rh_col,
+                airpress_col,
+                srad_col,
+                source_units=source_units,
+                input_ts=input_ts,
+                start_date=start_date,
+                end_date=end_date,
+                dropna=dropna,
+                clean=clean,
+                round_index=round_index,
+                skiprows=skiprows,
+                index_type=index_type,
+                names=names,
+                target_units=target_units,
+                print_input=print_input,
+            ),
+            tablefmt=tablefmt,
+        )
+
+    @program.pet.command("epm", formatter_class=RSTHelpFormatter)
+    @tsutils.copy_doc(pet.epm)
+    def epm_cli(
+        temp_mean_col,
+        rh_col,
+        airpress_col,
+        net_rad_col,
+        aero_resistance,
+        surface_resistance,
+        soil_heat_col=None,
+        source_units=None,
+        input_ts="-",
+        start_date=None,
+        end_date=None,
+        dropna="no",
+        clean=False,
+        round_index=None,
+        skiprows=None,
+        index_type="datetime",
+        names=None,
+        target_units="mm",
+        print_input=False,
+        tablefmt="csv",
+    ):
+        tsutils.printiso(
+            pet.epm(
+                temp_mean_col,
+                rh_col,
+                airpress_col,
+                net_rad_col,
+                aero_resistance,
+                surface_resistance,
+                soil_heat_col=soil_heat_col,
+                source_units=source_units,
+                input_ts=input_ts,
+                start_date=start_date,
+                end_date=end_date,
+                dropna=dropna,
+                clean=clean,
+                round_index=round_index,
+                skiprows=skiprows,
+                index_type=index_type,
+                names=names,
+                target_units=target_units,
+                print_input=print_input,
+            ),
+            tablefmt=tablefmt,
+        )
+
+    @program.pet.command("ept", formatter_class=RSTHelpFormatter)
+    @tsutils.copy_doc(pet.ept)
+    def ept_cli(
+        temp_mean_col,
+        rh_col,
+        airpress_col,
+        net_rad_col,
+        soil_heat_col=None,
+        source_units=None,
+        input_ts="-",
+        start_date=None,
+        end_date=None,
+        dropna="no",
+        clean=False,
+        round_index=None,
+        skiprows=None,
+        index_type="datetime",
+        names=None,
+        target_units="mm",
+        print_input=False,
+        tablefmt="csv",
+    ):
+        tsutils.printiso(
+            pet.ept(
+                temp_mean_col,
+                rh_col,
+                airpress_col,
+                net_rad_col,
+                soil_heat_col=soil_heat_col,
+                source_units=source_units,
+                input_ts=input_ts,
+                start_date=start_date,
+                end_date=end_date,
+                dropna=dropna,
+                clean=clean,
+                round_index=round_index,
+                skiprows=skiprows,
+                index_type=index_type,
+                names=names,
+                target_units=target_units,
+                print_input=print_input,
+            ),
+            tablefmt=tablefmt,
+        )
+
     @program.pet.command("hamon", formatter_class=RSTHelpFormatter)
     @tsutils.copy_doc(pet.hamon)
     def hamon_cli(
@@ -753,8 +1092,67 @@ def main():
                 names=names,
                 target_units=target_units,
                 print_input=print_input,
-                tablefmt=tablefmt,
-            )
+            ),
+            tablefmt=tablefmt,
+        )
+
+    @program.ret.command("asce_hourly", formatter_class=RSTHelpFormatter)
+    @tsutils.copy_doc(ret.asce_hourly)
+    def asce_hourly_cli(
+        lat,
+        lon,
+        elevation,
+        temp_col,
+        rh_col,
+        srad_col,
+        wind_col,
+        source_units=None,
+        reference="eto",
+        tz=None,
+        wind_height=2.0,
+        surface_resistance_day=None,
+        surface_resistance_night=None,
+        input_ts="-",
+        start_date=None,
+        end_date=None,
+        dropna="no",
+        clean=False,
+        round_index=None,
+        skiprows=None,
+        index_type="datetime",
+        names=None,
+        target_units="mm",
+        print_input=False,
+        tablefmt="csv",
+    ):
+        tsutils.printiso(
+            ret.asce_hourly(
+                lat,
+                lon,
+                elevation,
+                temp_col,
+                rh_col,
+                srad_col,
+                wind_col,
+                source_units=source_units,
+                reference=reference,
+                tz=tz,
+                wind_height=wind_height,
+                surface_resistance_day=surface_resistance_day,
+                surface_resistance_night=surface_resistance_night,
+                input_ts=input_ts,
+                start_date=start_date,
+                end_date=end_date,
+                dropna=dropna,
+                clean=clean,
+                round_index=round_index,
+                skiprows=skiprows,
+                index_type=index_type,
+                names=names,
+                target_units=target_units,
+                print_input=print_input,
+            ),
+            tablefmt=tablefmt,
         )
 
     @program.ret.command("penman_monteith", formatter_class=RSTHelpFormatter)
@@ -832,6 +1230,7 @@ def main():
         names=None,
         print_input=False,
         tablefmt="csv",
+        n_jobs=1,
     ):
         tsutils.printiso(
             indices.spei(
@@ -854,6 +1253,7 @@ def main():
                 index_type=index_type,
                 names=names,
                 print_input=print_input,
+                n_jobs=n_jobs,
             ),
             tablefmt=tablefmt,
         )
@@ -910,6 +1310,53 @@ def main():
             tablefmt=tablefmt,
         )
 
+    @program.interception.command("gash", formatter_class=RSTHelpFormatter)
+    @tsutils.copy_doc(interception.gash)
+    def gash_cli(
+        evap_ratio,
+        canopy_capacity,
+        trunk_capacity,
+        free_throughfall,
+        trunk_fraction,
+        source_units=None,
+        columns=None,
+        input_ts="-",
+        start_date=None,
+        end_date=None,
+        dropna="no",
+        clean=False,
+        round_index=None,
+        skiprows=None,
+        index_type="datetime",
+        names=None,
+        target_units="mm",
+        print_input=False,
+        tablefmt="csv",
+    ):
+        tsutils.printiso(
+            interception.gash(
+                evap_ratio,
+                canopy_capacity,
+                trunk_capacity,
+                free_throughfall,
+                trunk_fraction,
+                source_units=source_units,
+                columns=columns,
+                input_ts=input_ts,
+                start_date=start_date,
+                end_date=end_date,
+                dropna=dropna,
+                clean=clean,
+                round_index=round_index,
+                skiprows=skiprows,
+                index_type=index_type,
+                names=names,
+                target_units=target_units,
+                print_input=print_input,
+            ),
+            tablefmt=tablefmt,
+        )
+
     """Main"""
     if not os.path.exists("debug_mettoolbox"):
         sys.tracebacklimit = 0
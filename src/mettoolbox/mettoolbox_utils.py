@@ -16,3 +16,7 @@ sunits = _LOCAL_DOCSTRINGS["source_units"]
 sunits = sunits.split("\n")
 del sunits[1:3]
 _LOCAL_DOCSTRINGS["psource_units"] = "\n".join(sunits)
+_LOCAL_DOCSTRINGS["target_freq"] = """target_freq : str
+        The time step of the disaggregated data as a pandas offset alias
+        that divides a day evenly, for example "15min" or "5min".  If None
+        (the default) the data is disaggregated to hourly."""
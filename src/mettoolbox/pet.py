@@ -1,14 +1,13 @@
 import warnings
-from typing import Optional, Union
+from typing import List, Optional, Union
 
+import numpy as np
 import pandas as pd
 import pydaymet.pet as daypet
-from numpy import exp
 from pydantic import PositiveInt, confloat
 from tstoolbox.tstoolbox import read
 
-from mettoolbox import utils
-from mettoolbox.meteo_utils import calc_ea, calc_es, daylight_hours
+from mettoolbox import core, evaplib, meteolib, utils
 from mettoolbox.mettoolbox_utils import _LOCAL_DOCSTRINGS
 from mettoolbox.toolbox_utils.src.toolbox_utils import tsutils
 
@@ -19,6 +18,10 @@ except ImportError:
 
 __all__ = [
     "blaney_criddle",
+    "e0",
+    "em",
+    "epm",
+    "ept",
     "hamon",
     "romanenko",
     "linacre",
@@ -76,37 +79,43 @@ def _temp_read(
     index_type="datetime",
 ):
     if temp_mean_col is None:
-        tsd = tsutils.common_kwds(
-            input_tsd=[temp_min_col, temp_max_col],
-            names=["tmin", "tmax"],
-            source_units=source_units,
-            target_units=["degC", "degC"],
-            start_date=start_date,
-            end_date=end_date,
-            dropna=dropna,
-            clean=clean,
-            round_index=round_index,
-            skiprows=skiprows,
-            index_type=index_type,
-        )
-        tsd["tmean:degC"] = (tsd["tmin:degC"] + tsd["tmax:degC"]) / 2
+        input_tsd = [temp_min_col, temp_max_col]
+        names = ["tmin", "tmax"]
     else:
-        tsd = tsutils.common_kwds(
-            input_tsd=[temp_min_col, temp_max_col, temp_max_col],
-            names=["tmin", "tmax", "tmean"],
-            source_units=source_units,
-            target_units=["degC", "degC", "degC"],
-            start_date=start_date,
-            end_date=end_date,
-            dropna=dropna,
-            clean=clean,
-            round_index=round_index,
-            skiprows=skiprows,
-            index_type=index_type,
-        )
+        input_tsd = [temp_min_col, temp_max_col, temp_max_col]
+        names = ["tmin", "tmax", "tmean"]
+    tsd = tsutils.common_kwds(
+        input_tsd=input_tsd,
+        names=names,
+        start_date=start_date,
+        end_date=end_date,
+        dropna=dropna,
+        clean=clean,
+        round_index=round_index,
+        skiprows=skiprows,
+        index_type=index_type,
+    )
+    tsd = utils._convert_units(tsd, source_units, "degC")
+    if temp_mean_col is None:
+        tsd["tmean:degC"] = (tsd["tmin:degC"] + tsd["tmax:degC"]) / 2
     return tsd
 
 
+def _doy(tsd):
+    """The day of the year of each row of `tsd` as an array."""
+    return tsd.index.dayofyear.to_numpy()
+
+
+def _aligned(tsd, col, **kwds):
+    """Read the single column `col` as an array aligned to the rows of `tsd`."""
+    return (
+        tsutils.common_kwds(col, **kwds)
+        .reindex(tsd.index)
+        .iloc[:, 0]
+        .to_numpy(dtype=float, na_value=np.nan)
+    )
+
+
 def _preprocess(
     input_ts,
     temp_min_col,
@@ -173,13 +182,7 @@ def _preprocess(
                 """
             )
         )
-    interim_target_units = ["degC"] * len(tsd.columns)
-
-    tsd = tsutils.common_kwds(
-        tsd,
-        source_units=source_units,
-        target_units=interim_target_units,
-    )
+    tsd = utils._convert_units(tsd, source_units, "degC")
 
     tsd.columns = column_names
 
@@ -314,8 +317,8 @@ def blaney_criddle(
     pet.columns = ["pet_blaney_criddle:mm"]
 
     if target_units != source_units:
-        pet = tsutils.common_kwds(pet, source_units="mm", target_units=target_units)
-    return tsutils.return_input(print_input, tsd, pet)
+        pet = utils._convert_units(pet, "mm", target_units)
+    return utils._return_input(print_input, tsd, pet)
 
 
 @validate_call
@@ -326,12 +329,14 @@ def hamon(
     temp_mean_col=None,
     temp_min_col=None,
     temp_max_col=None,
+    k=1,
     start_date=None,
     end_date=None,
     dropna="no",
     clean=False,
     round_index=None,
     skiprows=None,
+    index_type="datetime",
     names=None,
     target_units=None,
     print_input=False,
@@ -439,16 +444,12 @@ def hamon(
         clean=clean,
         round_index=round_index,
         skiprows=skiprows,
+        index_type=index_type,
     )
 
-    daylh = daylight_hours(tsd.index, lat)
-
-    pet = (daylh / 12) ** 2 * exp(tsd["tmean:degC"] / 16)
-    pet.columns = ["pet_hamon:mm"]
-
-    if target_units != source_units:
-        pet = tsutils.common_kwds(pet, source_units="mm", target_units=target_units)
-    return tsutils.return_input(print_input, tsd, pet)
+    pet = core.hamon(tsd["tmean:degC"].to_numpy(), _doy(tsd), lat, k=k)
+    pet = utils._station_frame("pet_hamon", pet[:, np.newaxis], tsd.index, target_units)
+    return utils._return_input(print_input, tsd, pet)
 
 
 @tsutils.doc(_LOCAL_DOCSTRINGS)
@@ -563,7 +564,8 @@ def romanenko(
         round_index=round_index,
         skiprows=skiprows,
     )
-    rh_col = tsutils.common_kwds(
+    rh = _aligned(
+        tsd,
         rh_col,
         start_date=start_date,
         end_date=end_date,
@@ -572,21 +574,18 @@ def romanenko(
         clean=clean,
     )
 
-    ea = calc_ea(tmean=tsd["tmean:degC"], rh=rh_col)
-    es = calc_es(tmean=tsd["tmean:degC"])
-
-    pet = k * (1 + tsd["tmean:degC"] / 25) ** 2 * (1 - ea / es)
-    pet.columns = ["pet_romanenko:mm"]
-
-    if target_units != source_units:
-        pet = tsutils.common_kwds(pet, source_units="mm", target_units=target_units)
-    return tsutils.return_input(print_input, tsd, pet)
+    pet = core.romanenko(tsd["tmean:degC"].to_numpy(), rh, k=k)
+    pet = utils._station_frame(
+        "pet_romanenko", pet[:, np.newaxis], tsd.index, target_units
+    )
+    return utils._return_input(print_input, tsd, pet)
 
 
+@validate_call
 @tsutils.doc(_LOCAL_DOCSTRINGS)
 def linacre(
     lat: confloat(ge=-90, le=90),
-    elevation,
+    elevation: float,
     source_units: Optional[Union[str, list]],
     temp_mean_col=None,
     temp_min_col=None,
@@ -598,6 +597,7 @@ def linacre(
     clean=False,
     round_index=None,
     skiprows=None,
+    index_type="datetime",
     names=None,
     target_units=None,
     print_input=False,
@@ -698,32 +698,32 @@ def linacre(
         clean=clean,
         round_index=round_index,
         skiprows=skiprows,
+        index_type=index_type,
     )
-    tdew_col = tsutils.common_kwds(
-        tdew_col,
-        start_date=start_date,
-        end_date=end_date,
-        round_index=round_index,
-        dropna=dropna,
-        clean=clean,
-    )
-
-    if tdew_col is None:
-        tdew_col = (
-            0.52 * tsd["tmin:degC"]
-            + 0.6 * tsd["tmax:degC"]
-            - 0.009 * tsd["tmax:degC"] ** 2
-            - 2
+    tdew = None
+    if tdew_col is not None:
+        tdew = _aligned(
+            tsd,
+            tdew_col,
+            start_date=start_date,
+            end_date=end_date,
+            round_index=round_index,
+            dropna=dropna,
+            clean=clean,
         )
-    tm = tsd["tmean:degC"] + 0.006 * elevation
-    pet = (500 * tm / (100 - lat) + 15 * (tsd["tmean:degC"] - tdew_col)) / (
-        80 - tsd["tmean:degC"]
-    )
-    pet.columns = ["pet_linacre:mm"]
 
-    if target_units != source_units:
-        pet = tsutils.common_kwds(pet, source_units="mm", target_units=target_units)
-    return tsutils.return_input(print_input, tsd, pet)
+    pet = core.linacre(
+        tsd["tmin:degC"].to_numpy(),
+        tsd["tmax:degC"].to_numpy(),
+        lat,
+        elevation,
+        tmean=tsd["tmean:degC"].to_numpy(),
+        tdew=tdew,
+    )
+    pet = utils._station_frame(
+        "pet_linacre", pet[:, np.newaxis], tsd.index, target_units
+    )
+    return utils._return_input(print_input, tsd, pet)
 
 
 @validate_call
@@ -825,23 +825,17 @@ def hargreaves(
         index_type=index_type,
     )
 
-    newra = utils.radiation(tsd, lat)
-    tsdiff = tsd["tmax:degC"] - tsd["tmin:degC"]
-
-    # Create new dataframe with tsd.index as index in
-    # order to get all of the time components correct.
-    pe = pd.DataFrame(0.0, index=tsd.index, columns=["pet_hargreaves:mm"])
-
-    pe["pet_hargreaves:mm"] = (
-        0.408
-        * 0.0023
-        * newra.ra.values
-        * tsdiff.values**0.5
-        * (tsd["tmean:degC"].values + 17.8)
+    pe = core.hargreaves(
+        tsd["tmin:degC"].to_numpy(),
+        tsd["tmax:degC"].to_numpy(),
+        _doy(tsd),
+        lat,
+        tmean=tsd["tmean:degC"].to_numpy(),
     )
-    if target_units != source_units:
-        pe = tsutils.common_kwds(pe, source_units="mm", target_units=target_units)
-    return tsutils.return_input(print_input, tsd, pe)
+    pe = utils._station_frame(
+        "pet_hargreaves", pe[:, np.newaxis], tsd.index, target_units
+    )
+    return utils._return_input(print_input, tsd, pe)
 
 
 @validate_call
@@ -973,22 +967,9 @@ def oudin_form(
         index_type=index_type,
     )
 
-    newra = utils.radiation(tsd, lat)
-
-    # Create new dataframe with tsd.index as index in
-    # order to get all of the time components correct.
-    pe = pd.DataFrame(0.0, index=tsd.index, columns=["pet_oudin:mm"])
-
-    gamma = 2.45  # the latent heat flux (MJ kg−1)
-    rho = 1000.0  # density of water (kg m-3)
-
-    pe.loc[tsd["tmean"] > k2, "pet_oudin:mm"] = (
-        newra.ra / (gamma * rho) * (tsd["tmean"] + k2) / k1 * 1000
-    )
-
-    if target_units != source_units:
-        pe = tsutils.common_kwds(pe, source_units="mm", target_units=target_units)
-    return tsutils.return_input(print_input, tsd, pe)
+    pe = core.oudin_form(tsd["tmean:degC"].to_numpy(), _doy(tsd), lat, k1=k1, k2=k2)
+    pe = utils._station_frame("pet_oudin", pe[:, np.newaxis], tsd.index, target_units)
+    return utils._return_input(print_input, tsd, pe)
 
 
 @validate_call
@@ -1083,23 +1064,15 @@ def allen(
         index_type=index_type,
     )
 
-    newra = utils.radiation(tsd, lat)
-
-    # Create new dataframe with tsd.index as index in
-    # order to get all of the time components correct.
-    pe = pd.DataFrame(0.0, index=tsd.index, columns=["pet_allen:mm"])
-
-    pe["pet_allen:mm"] = (
-        0.408
-        * 0.0029
-        * newra.ra
-        * (tsd["tmax:degC"] - tsd["tmin:degC"]) ** 0.4
-        * (tsd["tmean:degC"] + 20)
+    pe = core.allen(
+        tsd["tmin:degC"].to_numpy(),
+        tsd["tmax:degC"].to_numpy(),
+        _doy(tsd),
+        lat,
+        tmean=tsd["tmean:degC"].to_numpy(),
     )
-
-    if target_units != source_units:
-        pe = tsutils.common_kwds(pe, source_units="mm", target_units=target_units)
-    return tsutils.return_input(print_input, tsd, pe)
+    pe = utils._station_frame("pet_allen", pe[:, np.newaxis], tsd.index, target_units)
+    return utils._return_input(print_input, tsd, pe)
 
 
 def prepare_daymet(
@@ -1234,4 +1207,460 @@ def priestley_taylor(
 
     pe = daypet.PETCoords(tsd, (lon, lat))
     pe = pe.priestley_taylor().iloc[:, -1]
-    return tsutils.return_input(print_input, tsd, pe)
+    return utils._return_input(print_input, tsd, pe)
+
+
+@validate_call
+@tsutils.doc(_LOCAL_DOCSTRINGS)
+def e0(
+    lat: Union[float, List[float], str],
+    temp_mean_col: Union[PositiveInt, str, list],
+    rh_col: Union[PositiveInt, str, list],
+    airpress_col: Union[PositiveInt, str, list],
+    srad_col: Union[PositiveInt, str, list],
+    wind_col: Union[PositiveInt, str, list],
+    source_units: Optional[Union[str, list]] = None,
+    albedo: Union[float, List[float], str] = 0.08,
+    elevation: Union[float, List[float], str] = 0.0,
+    input_ts="-",
+    start_date=None,
+    end_date=None,
+    dropna="no",
+    clean=False,
+    round_index=None,
+    skiprows=None,
+    index_type="datetime",
+    names=None,
+    target_units="mm",
+    print_input=False,
+):
+    """
+    Penman open water evaporation according to [penman_1948]_.
+
+    Each of the column arguments is a list, or comma separated string on the
+    command line, with one column for each station, or a single column used
+    for all of the stations.  The parameters are a single value for all of
+    the stations or one value for each station.  All stations are
+    calculated together in one vectorized call of `evaplib.E0`.
+
+    Parameters
+    ----------
+    lat : float or list
+        The latitude of each station, used for the extraterrestrial
+        radiation.  Positive specifies the Northern Hemisphere, and
+        negative values represent the Southern Hemisphere.
+    temp_mean_col : str, int, or list
+        The column names or numbers (data columns start numbering at 1) in
+        the input data of the daily mean air temperature.
+    rh_col : str, int, or list
+        The column names or numbers (data columns start numbering at 1) in
+        the input data of the daily mean relative humidity in percent.
+    airpress_col : str, int, or list
+        The column names or numbers (data columns start numbering at 1) in
+        the input data of the daily mean air pressure.
+    srad_col : str, int, or list
+        The column names or numbers (data columns start numbering at 1) in
+        the input data of the daily total incoming solar radiation, for
+        example in "MJ/m^2".
+    wind_col : str, int, or list
+        The column names or numbers (data columns start numbering at 1) in
+        the input data of the daily mean wind speed at 2 m.
+    ${source_units}
+    albedo : float or list
+        The albedo of the water surface, by default 0.08.
+    elevation : float or list
+        The elevation of each station in m, by default 0.
+    ${input_ts}
+    ${start_date}
+    ${end_date}
+    ${dropna}
+    ${clean}
+    ${round_index}
+    ${skiprows}
+    ${index_type}
+    ${names}
+    ${target_units}
+    ${print_input}
+    ${tablefmt}
+
+    Returns
+    -------
+    pandas.DataFrame
+        The evaporation with one column for each station, named from the
+        station's "temp_mean_col" column.
+
+    Examples
+    --------
+    >>> pe = e0([52.1, 51.4], "1,5", "2,6", 3, "4,7", "8,9", input_ts="met.csv")
+
+    References
+    ----------
+    .. [penman_1948] Penman, H. L. (1948). Natural evaporation from open
+       water, bare soil and grass. Proceedings of the Royal Society of
+       London. Series A. Mathematical and Physical Sciences, 193, 120-145.
+    """
+    tsd, data, stations = utils._station_read(
+        input_ts,
+        [
+            ("temp_mean_col", temp_mean_col, "degC"),
+            ("rh_col", rh_col, "percent"),
+            ("airpress_col", airpress_col, "Pa"),
+            ("srad_col", srad_col, "J/m^2"),
+            ("wind_col", wind_col, "m/s"),
+        ],
+        source_units,
+        skiprows,
+        names,
+        index_type,
+        start_date,
+        end_date,
+        round_index,
+        dropna,
+        clean,
+    )
+
+    doy = tsd.index.dayofyear.to_numpy()
+    rext = np.column_stack(
+        [
+            meteolib.sun_NR(doy, station_lat)[1]
+            for station_lat in utils._station_values("lat", lat, len(stations))
+        ]
+    )
+    pe = evaplib.E0(
+        data["temp_mean_col"],
+        data["rh_col"],
+        data["airpress_col"],
+        data["srad_col"],
+        rext,
+        data["wind_col"],
+        utils._station_values("albedo", albedo, len(stations)),
+        utils._station_values("elevation", elevation, len(stations)),
+    )
+    pe = utils._station_frame("pet_e0", pe, tsd.index, target_units, stations)
+    return utils._return_input(print_input, tsd, pe)
+
+
+@validate_call
+@tsutils.doc(_LOCAL_DOCSTRINGS)
+def em(
+    temp_mean_col: Union[PositiveInt, str, list],
+    rh_col: Union[PositiveInt, str, list],
+    airpress_col: Union[PositiveInt, str, list],
+    srad_col: Union[PositiveInt, str, list],
+    source_units: Optional[Union[str, list]] = None,
+    input_ts="-",
+    start_date=None,
+    end_date=None,
+    dropna="no",
+    clean=False,
+    round_index=None,
+    skiprows=None,
+    index_type="datetime",
+    names=None,
+    target_units="mm",
+    print_input=False,
+):
+    """
+    Makkink reference evaporation according to [debruin_1987]_.
+
+    Each of the column arguments is a list, or comma separated string on the
+    command line, with one column for each station, or a single column used
+    for all of the stations.  All stations are calculated together in one
+    vectorized call of `evaplib.Em`.
+
+    Parameters
+    ----------
+    temp_mean_col : str, int, or list
+        The column names or numbers (data columns start numbering at 1) in
+        the input data of the daily mean air temperature.
+    rh_col : str, int, or list
+        The column names or numbers (data columns start numbering at 1) in
+        the input data of the daily mean relative humidity in percent.
+    airpress_col : str, int, or list
+        The column names or numbers (data columns start numbering at 1) in
+        the input data of the daily mean air pressure.
+    srad_col : str, int, or list
+        The column names or numbers (data columns start numbering at 1) in
+        the input data of the daily total incoming solar radiation, for
+        example in "MJ/m^2".
+    ${source_units}
+    ${input_ts}
+    ${start_date}
+    ${end_date}
+    ${dropna}
+    ${clean}
+    ${round_index}
+    ${skiprows}
+    ${index_type}
+    ${names}
+    ${target_units}
+    ${print_input}
+    ${tablefmt}
+
+    Returns
+    -------
+    pandas.DataFrame
+        The evaporation with one column for each station, named from the
+        station's "temp_mean_col" column.
+
+    Examples
+    --------
+    >>> pe = em("1,5", "2,6", 3, "4,7", input_ts="met.csv")
+
+    References
+    ----------
+    .. [debruin_1987] de Bruin, H. A. R. (1987). From Penman to Makkink. In
+       Hooghart, C. (Ed.), Evaporation and Weather, Proceedings and
+       Information. Comm. Hydrological Research TNO, The Hague. pp. 5-30.
+    """
+    tsd, data, stations = utils._station_read(
+        input_ts,
+        [
+            ("temp_mean_col", temp_mean_col, "degC"),
+            ("rh_col", rh_col, "percent"),
+            ("airpress_col", airpress_col, "Pa"),
+            ("srad_col", srad_col, "J/m^2"),
+        ],
+        source_units,
+        skiprows,
+        names,
+        index_type,
+        start_date,
+        end_date,
+        round_index,
+        dropna,
+        clean,
+    )
+
+    pe = evaplib.Em(
+        data["temp_mean_col"], data["rh_col"], data["airpress_col"], data["srad_col"]
+    )
+    pe = utils._station_frame("pet_em", pe, tsd.index, target_units, stations)
+    return utils._return_input(print_input, tsd, pe)
+
+
+@validate_call
+@tsutils.doc(_LOCAL_DOCSTRINGS)
+def ept(
+    temp_mean_col: Union[PositiveInt, str, list],
+    rh_col: Union[PositiveInt, str, list],
+    airpress_col: Union[PositiveInt, str, list],
+    net_rad_col: Union[PositiveInt, str, list],
+    soil_heat_col: Optional[Union[PositiveInt, str, list]] = None,
+    source_units: Optional[Union[str, list]] = None,
+    input_ts="-",
+    start_date=None,
+    end_date=None,
+    dropna="no",
+    clean=False,
+    round_index=None,
+    skiprows=None,
+    index_type="datetime",
+    names=None,
+    target_units="mm",
+    print_input=False,
+):
+    """
+    Priestley-Taylor evaporation according to [priestley_1972]_.
+
+    Each of the column arguments is a list, or comma separated string on the
+    command line, with one column for each station, or a single column used
+    for all of the stations.  All stations are calculated together in one
+    vectorized call of `evaplib.Ept`.
+
+    Parameters
+    ----------
+    temp_mean_col : str, int, or list
+        The column names or numbers (data columns start numbering at 1) in
+        the input data of the daily mean air temperature.
+    rh_col : str, int, or list
+        The column names or numbers (data columns start numbering at 1) in
+        the input data of the daily mean relative humidity in percent.
+    airpress_col : str, int, or list
+        The column names or numbers (data columns start numbering at 1) in
+        the input data of the daily mean air pressure.
+    net_rad_col : str, int, or list
+        The column names or numbers (data columns start numbering at 1) in
+        the input data of the daily total net radiation, for example in
+        "MJ/m^2".
+    soil_heat_col : str, int, or list
+        The column names or numbers (data columns start numbering at 1) in
+        the input data of the daily total soil heat flux.  If None the soil
+        heat flux is 0.
+    ${source_units}
+    ${input_ts}
+    ${start_date}
+    ${end_date}
+    ${dropna}
+    ${clean}
+    ${round_index}
+    ${skiprows}
+    ${index_type}
+    ${names}
+    ${target_units}
+    ${print_input}
+    ${tablefmt}
+
+    Returns
+    -------
+    pandas.DataFrame
+        The evaporation with one column for each station, named from the
+        station's "temp_mean_col" column.
+
+    Examples
+    --------
+    >>> pe = ept("1,5", "2,6", 3, "4,7", input_ts="met.csv")
+
+    References
+    ----------
+    .. [priestley_1972] Priestley, C. H. B. and Taylor, R. J. (1972). On the
+       assessment of surface heat flux and evaporation using large-scale
+       parameters. Monthly Weather Review, 100, 81-92.
+    """
+    tsd, data, stations = utils._station_read(
+        input_ts,
+        [
+            ("temp_mean_col", temp_mean_col, "degC"),
+            ("rh_col", rh_col, "percent"),
+            ("airpress_col", airpress_col, "Pa"),
+            ("net_rad_col", net_rad_col, "J/m^2"),
+            ("soil_heat_col", soil_heat_col, "J/m^2"),
+        ],
+        source_units,
+        skiprows,
+        names,
+        index_type,
+        start_date,
+        end_date,
+        round_index,
+        dropna,
+        clean,
+    )
+
+    pe = evaplib.Ept(
+        data["temp_mean_col"],
+        data["rh_col"],
+        data["airpress_col"],
+        data["net_rad_col"],
+        data.get("soil_heat_col", 0.0),
+    )
+    pe = utils._station_frame("pet_ept", pe, tsd.index, target_units, stations)
+    return utils._return_input(print_input, tsd, pe)
+
+
+@validate_call
+@tsutils.doc(_LOCAL_DOCSTRINGS)
+def epm(
+    temp_mean_col: Union[PositiveInt, str, list],
+    rh_col: Union[PositiveInt, str, list],
+    airpress_col: Union[PositiveInt, str, list],
+    net_rad_col: Union[PositiveInt, str, list],
+    aero_resistance: Union[float, List[float], str],
+    surface_resistance: Union[float, List[float], str],
+    soil_heat_col: Optional[Union[PositiveInt, str, list]] = None,
+    source_units: Optional[Union[str, list]] = None,
+    input_ts="-",
+    start_date=None,
+    end_date=None,
+    dropna="no",
+    clean=False,
+    round_index=None,
+    skiprows=None,
+    index_type="datetime",
+    names=None,
+    target_units="mm",
+    print_input=False,
+):
+    """
+    Penman-Monteith evaporation according to [monteith_1965]_.
+
+    Each of the column arguments is a list, or comma separated string on the
+    command line, with one column for each station, or a single column used
+    for all of the stations.  The resistances are a single value for all of
+    the stations or one value for each station.  All stations are
+    calculated together in one vectorized call of `evaplib.Epm`.
+
+    Parameters
+    ----------
+    temp_mean_col : str, int, or list
+        The column names or numbers (data columns start numbering at 1) in
+        the input data of the daily mean air temperature.
+    rh_col : str, int, or list
+        The column names or numbers (data columns start numbering at 1) in
+        the input data of the daily mean relative humidity in percent.
+    airpress_col : str, int, or list
+        The column names or numbers (data columns start numbering at 1) in
+        the input data of the daily mean air pressure.
+    net_rad_col : str, int, or list
+        The column names or numbers (data columns start numbering at 1) in
+        the input data of the daily total net radiation, for example in
+        "MJ/m^2".
+    aero_resistance : float or list
+        The aerodynamic resistance in s/m.  `evaplib.ra` calculates it from
+        the wind speed and the roughness of the surface.
+    surface_resistance : float or list
+        The surface resistance in s/m, 0 for a wet canopy.
+    soil_heat_col : str, int, or list
+        The column names or numbers (data columns start numbering at 1) in
+        the input data of the daily total soil heat flux.  If None the soil
+        heat flux is 0.
+    ${source_units}
+    ${input_ts}
+    ${start_date}
+    ${end_date}
+    ${dropna}
+    ${clean}
+    ${round_index}
+    ${skiprows}
+    ${index_type}
+    ${names}
+    ${target_units}
+    ${print_input}
+    ${tablefmt}
+
+    Returns
+    -------
+    pandas.DataFrame
+        The evaporation with one column for each station, named from the
+        station's "temp_mean_col" column.
+
+    Examples
+    --------
+    >>> pe = epm("1,5", "2,6", 3, "4,7", 104.0, "70,50", input_ts="met.csv")
+
+    References
+    ----------
+    .. [monteith_1965] Monteith, J. L. (1965). Evaporation and environment.
+       Symposia of the Society for Experimental Biology, 19, 205-234.
+    """
+    tsd, data, stations = utils._station_read(
+        input_ts,
+        [
+            ("temp_mean_col", temp_mean_col, "degC"),
+            ("rh_col", rh_col, "percent"),
+            ("airpress_col", airpress_col, "hPa"),
+            ("net_rad_col", net_rad_col, "J/m^2"),
+            ("soil_heat_col", soil_heat_col, "J/m^2"),
+        ],
+        source_units,
+        skiprows,
+        names,
+        index_type,
+        start_date,
+        end_date,
+        round_index,
+        dropna,
+        clean,
+    )
+
+    pe = evaplib.Epm(
+        data["temp_mean_col"],
+        data["rh_col"],
+        data["airpress_col"],
+        data["net_rad_col"],
+        data.get("soil_heat_col", 0.0),
+        utils._station_values("aero_resistance", aero_resistance, len(stations)),
+        utils._station_values("surface_resistance", surface_resistance, len(stations)),
+    )
+    pe = utils._station_frame("pet_epm", pe, tsd.index, target_units, stations)
+    return utils._return_input(print_input, tsd, pe)
@@ -1,11 +1,20 @@
 import warnings
-from typing import Optional, Union
+from typing import List, Literal, Optional, Union
 
+import numpy as np
 import pandas as pd
 import pydaymet.pet as daypet
 from pydantic import PositiveInt, confloat
 from tstoolbox.tstoolbox import read
 
+from mettoolbox import utils
+from mettoolbox.meteo_utils import (
+    calc_press,
+    calc_vapour,
+    extraterrestrial_r_hour,
+    solar_declination,
+    sunset_angle_hour,
+)
 from mettoolbox.mettoolbox_utils import _LOCAL_DOCSTRINGS
 from mettoolbox.toolbox_utils.src.toolbox_utils import tsutils
 
@@ -14,7 +23,16 @@ try:
 except ImportError:
     from pydantic import validate_call
 
-__all__ = ["penman_monteith"]
+__all__ = ["asce_hourly", "penman_monteith"]
+
+# Constants of the ASCE standardized hourly reference equation: Cn, Cd for
+# daytime and nighttime, soil heat flux as a fraction of net radiation for
+# daytime and nighttime, and the aerodynamic resistance times the wind speed
+# at 2 m [s m-1 * m s-1] that converts a surface resistance to Cd.
+_ASCE_HOURLY = {
+    "eto": (37.0, 0.24, 0.96, 0.1, 0.5, 208.0),
+    "etr": (66.0, 0.25, 1.7, 0.04, 0.2, 118.0),
+}
 
 warnings.filterwarnings("ignore")
 
@@ -149,4 +167,224 @@ def penman_monteith(
 
     pe = daypet.PETCoords(tsd, (lon, lat))
     pe = pe.penman_monteith().iloc[:, -1]
-    return tsutils.return_input(print_input, tsd, pe)
+    return utils._return_input(print_input, tsd, pe)
+
+
+@validate_call(config={"arbitrary_types_allowed": True})
+@tsutils.doc(_LOCAL_DOCSTRINGS)
+def asce_hourly(
+    lat: Union[float, List[float], str],
+    lon: Union[float, List[float], str],
+    elevation: Union[float, List[float], str],
+    temp_col: Union[PositiveInt, str, list],
+    rh_col: Union[PositiveInt, str, list],
+    srad_col: Union[PositiveInt, str, list],
+    wind_col: Union[PositiveInt, str, list],
+    source_units: Optional[Union[str, list]] = None,
+    reference: Literal["eto", "etr"] = "eto",
+    tz: Optional[Union[float, List[float], str]] = None,
+    wind_height: Union[float, List[float], str] = 2.0,
+    surface_resistance_day: Optional[Union[float, List[float], str]] = None,
+    surface_resistance_night: Optional[Union[float, List[float], str]] = None,
+    input_ts="-",
+    start_date=None,
+    end_date=None,
+    dropna="no",
+    clean=False,
+    round_index=None,
+    skiprows=None,
+    index_type="datetime",
+    names=None,
+    target_units="mm",
+    print_input=False,
+):
+    """
+    ASCE standardized hourly reference evapotranspiration [asce_2005]_.
+
+    Calculates the hourly short (ETo, grass) or tall (ETr, alfalfa)
+    reference evapotranspiration of any number of stations in one
+    vectorized pass over an hourly input with the columns of all of the
+    stations.  Each of the column arguments is a list, or comma separated
+    string on the command line, with one column for each station, or a
+    single column used for all of the stations.  The site parameters are a
+    single value for all of the stations or one value for each station.
+
+    The index is the end of each hour.  Daytime is when the net radiation
+    is positive, and the surface resistance, through the Cd coefficient,
+    and the soil heat flux switch between their daytime and nighttime
+    values hour by hour.
+
+    Parameters
+    ----------
+    lat : float or list
+        The latitude of each station in decimal degrees.  Positive
+        specifies the Northern Hemisphere, and negative values represent
+        the Southern Hemisphere.
+    lon : float or list
+        The longitude of each station in decimal degrees.  Positive
+        specifies east of the prime meridian, and negative values represent
+        west of the prime meridian.
+    elevation : float or list
+        The elevation of each station in m, used for the atmospheric
+        pressure and the clear sky radiation.
+    temp_col : str, int, or list
+        The column names or numbers (data columns start numbering at 1) in
+        the input data of the hourly mean air temperature.
+    rh_col : str, int, or list
+        The column names or numbers (data columns start numbering at 1) in
+        the input data of the hourly mean relative humidity in percent.
+    srad_col : str, int, or list
+        The column names or numbers (data columns start numbering at 1) in
+        the input data of the hourly mean incoming solar radiation, for
+        example in "W/m^2".
+    wind_col : str, int, or list
+        The column names or numbers (data columns start numbering at 1) in
+        the input data of the hourly mean wind speed at `wind_height`.
+    ${source_units}
+    reference : str
+        [optional, default is "eto"]
+
+        Either "eto" for the short, clipped grass reference or "etr" for
+        the tall, full cover alfalfa reference.
+    tz : float or list
+        [optional, default is None]
+
+        The time zone of each station as hours from UTC.  If None estimated
+        as `round(lon / 15)`.
+    wind_height : float or list
+        [optional, default is 2]
+
+        The height of the wind speed measurement in m.  The wind speed is
+        adjusted to 2 m with the logarithmic wind profile.
+    surface_resistance_day : float or list
+        [optional, default is None]
+
+        The daytime bulk surface resistance in s/m.  If None the
+        standardized Cd of the reference is used, 50 s/m for ETo.
+    surface_resistance_night : float or list
+        [optional, default is None]
+
+        The nighttime bulk surface resistance in s/m.  If None the
+        standardized Cd of the reference is used, 200 s/m for ETo.
+    ${input_ts}
+    ${start_date}
+    ${end_date}
+    ${dropna}
+    ${clean}
+    ${round_index}
+    ${skiprows}
+    ${index_type}
+    ${names}
+    ${target_units}
+    ${print_input}
+    ${tablefmt}
+
+    Returns
+    -------
+    pandas.DataFrame
+        The hourly reference evapotranspiration with one column for each
+        station, named from the station's "temp_col" column.
+
+    Examples
+    --------
+    >>> et = asce_hourly(41.8, -88.1, 200, "1,5", "2,6", "3,7", "4,8",
+    ...                  tz=-6, input_ts="hourly.csv")
+
+    References
+    ----------
+    .. [asce_2005] ASCE-EWRI (2005). The ASCE standardized reference
+       evapotranspiration equation. Report of the Task Committee on
+       Standardization of Reference Evapotranspiration, Environmental and
+       Water Resources Institute of the American Society of Civil
+       Engineers, Reston, VA.
+    """
+    tsd, data, stations = utils._station_read(
+        input_ts,
+        [
+            ("temp_col", temp_col, "degC"),
+            ("rh_col", rh_col, "percent"),
+            ("srad_col", srad_col, "W/m^2"),
+            ("wind_col", wind_col, "m/s"),
+        ],
+        source_units,
+        skiprows,
+        names,
+        index_type,
+        start_date,
+        end_date,
+        round_index,
+        dropna,
+        clean,
+    )
+    nstations = len(stations)
+
+    lats = np.deg2rad(utils._station_values("lat", lat, nstations))
+    lons = utils._station_values("lon", lon, nstations)
+    if tz is None:
+        tzs = np.round(lons / 15)
+    else:
+        tzs = utils._station_values("tz", tz, nstations)
+    elevations = utils._station_values("elevation", elevation, nstations)
+    cn, cd_day, cd_night, g_day, g_night, ra_u2 = _ASCE_HOURLY[reference]
+    if surface_resistance_day is not None:
+        cd_day = (
+            utils._station_values(
+                "surface_resistance_day", surface_resistance_day, nstations
+            )
+            / ra_u2
+        )
+    if surface_resistance_night is not None:
+        cd_night = (
+            utils._station_values(
+                "surface_resistance_night", surface_resistance_night, nstations
+            )
+            / ra_u2
+        )
+
+    # Extraterrestrial radiation and the sine of the sun altitude at the
+    # middle of each hour.  meteo_utils uses radians, and degrees west of
+    # Greenwich for the longitudes of the site and of the time zone meridian.
+    sol_dec = solar_declination(tsd.index.dayofyear.to_numpy())[:, np.newaxis]
+    ra = np.empty((len(tsd.index), nstations))
+    omega = np.empty((len(tsd.index), nstations))
+    for i, (station_lat, station_lon, station_tz) in enumerate(zip(lats, lons, tzs)):
+        args = (tsd.index, station_lat, -15.0 * station_tz, -station_lon)
+        omega[:, i] = np.mean(sunset_angle_hour(*args), axis=0)
+        ra[:, i] = extraterrestrial_r_hour(*args)
+    sin_beta = np.sin(lats) * np.sin(sol_dec)
+    sin_beta += np.cos(lats) * np.cos(sol_dec) * np.cos(omega)
+
+    temp = data["temp_col"]
+    rs = data["srad_col"] * 0.0036  # W/m^2 to MJ/m^2/h
+    zw = utils._station_values("wind_height", wind_height, nstations)
+    u2 = data["wind_col"] * 4.87 / np.log(67.8 * zw - 5.42)
+    pressure = calc_press(elevations)
+    _, delta, _, ea, vpd = calc_vapour(temp, pressure, rh=data["rh_col"])
+    # The standardized psychrometric constant of [asce_2005]_, not the one of
+    # calc_vapour with the latent heat at the air temperature.
+    gamma = np.broadcast_to(0.000665 * pressure, temp.shape)
+
+    # The cloudiness function is only reliable with the sun more than 0.3
+    # radians above the horizon, otherwise the last daytime value is used.
+    rso = (0.75 + 2e-5 * elevations) * ra
+    fcd = 1.35 * np.clip(rs / rso, 0.3, 1.0) - 0.35
+    fcd = (
+        pd.DataFrame(np.where(sin_beta > np.sin(0.3), fcd, np.nan))
+        .ffill()
+        .bfill()
+        .to_numpy()
+    )
+    rnl = 2.042e-10 * fcd * (0.34 - 0.14 * np.sqrt(ea)) * (temp + 273.16) ** 4
+    rn = (1 - 0.23) * rs - rnl
+
+    daytime = rn > 0
+    g = np.where(daytime, g_day, g_night) * rn
+    cd = np.where(daytime, cd_day, cd_night)
+    et = (0.408 * delta * (rn - g) + gamma * cn / (temp + 273) * u2 * vpd) / (
+        delta + gamma * (1 + cd * u2)
+    )
+
+    et = utils._station_frame(
+        f"ret_asce_{reference}", et, tsd.index, target_units, stations
+    )
+    return utils._return_input(print_input, tsd, et)
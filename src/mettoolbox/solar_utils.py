@@ -9,24 +9,50 @@ import numpy as np
 from numpy import array, cos, deg2rad, sin
 
 
+def _check_range(x, low, high, range_msg, type_msg):
+    """
+    Checks that a scalar, or every element of a numeric array, is within
+    low <= x <= high.  For arrays all of the offending indices are reported
+    in one exception.
+    """
+    if isinstance(x, (int, float)):
+        if (x < low) or (x > high):
+            raise ValueError(range_msg)
+        return
+    if not (isinstance(x, np.ndarray) and np.issubdtype(x.dtype, np.number)):
+        raise TypeError(type_msg)
+    out_of_range = (x < low) | (x > high)
+    if not out_of_range.any():
+        return
+    if x.ndim == 0:
+        raise ValueError(range_msg)
+    if x.ndim == 1:
+        bad = np.flatnonzero(out_of_range).tolist()
+    else:
+        bad = [tuple(index) for index in np.argwhere(out_of_range).tolist()]
+    raise ValueError(f"{range_msg}, out of range at indices {bad}")
+
+
 def check_lat(lat):
     """
     Checks whether the input latitude is within range and correct type
 
     Parameters
     ----------
-    lat : float or int
+    lat : float, int, or array-like
         latitude (-90 to 90) in degrees
 
     Returns
     -------
     None. Raises an exception in case
     """
-    if isinstance(lat, (int, float)):
-        if abs(lat) > 90:
-            raise ValueError("latitude should be -90 <= latitude <= 90")
-    else:
-        raise TypeError('latitude should be "float" or "int"')
+    _check_range(
+        lat,
+        -90,
+        90,
+        "latitude should be -90 <= latitude <= 90",
+        'latitude should be "float", "int", or a numeric array',
+    )
 
 
 def check_long(lng):
@@ -35,18 +61,20 @@ def check_long(lng):
 
     Parameters
     ----------
-    lng : float or int
+    lng : float, int, or array-like
         longitude (-179 to 180) in degrees
 
     Returns
     -------
     None. Raises an exception in case
     """
-    if isinstance(lng, (int, float)):
-        if abs(lng) > 180:
-            raise ValueError("longitude should be -180 <= longitude <= 180")
-    else:
-        raise TypeError('longitude should be "float" or "int"')
+    _check_range(
+        lng,
+        -180,
+        180,
+        "longitude should be -180 <= longitude <= 180",
+        'longitude should be "float", "int", or a numeric array',
+    )
 
 
 def check_alt(h):
@@ -55,18 +83,20 @@ def check_alt(h):
 
     Parameters
     ----------
-    h : float or int
+    h : float, int, or array-like
         altitude (0 to 24k) in meters
 
     Returns
     -------
     None. Raises an exception in case
     """
-    if isinstance(h, (int, float)):
-        if (h < 0) or (h > 24000):
-            raise ValueError("pressure model is only valid if 0 <= h <= 24000")
-    else:
-        raise TypeError('altitude should be "float" or "int"')
+    _check_range(
+        h,
+        0,
+        24000,
+        "pressure model is only valid if 0 <= h <= 24000",
+        'altitude should be "float", "int", or a numeric array',
+    )
 
 
 def day_of_the_year(date):
@@ -75,18 +105,22 @@ def day_of_the_year(date):
 
     Parameters
     ----------
-    date : datetime object
-        date of interest
+    date : datetime object or array-like of datetime objects
+        date of interest, or for example a pandas.DatetimeIndex
 
     Returns
     -------
-    day : int
-        day of the year (1 to 365)
+    day : int or numpy.ndarray
+        day of the year (1 to 366)
     """
     if isinstance(date, datetime):
         return date.timetuple().tm_yday
-    msg = "date must be a datetime object or array of datetime objects"
-    raise TypeError(msg)
+    try:
+        days = np.asarray(date, dtype="datetime64[D]")
+    except (TypeError, ValueError):
+        msg = "date must be a datetime object or array of datetime objects"
+        raise TypeError(msg) from None
+    return (days - days.astype("datetime64[Y]")).astype(int) + 1
 
 
 class NoSunsetNoSunrise(Exception):
@@ -98,6 +132,13 @@ class NoSunsetNoSunrise(Exception):
         self.msg = "Permanent night (or day) on this latitude on this day"
 
 
+def _as_float(x):
+    """Scalars pass through unchanged, sequences become float arrays."""
+    if isinstance(x, (int, float)):
+        return x
+    return np.asarray(x, dtype=float)
+
+
 def lla2ecef(lat, lng, h):
     """
     Calculates geocentric coordinates (ECEF - Earth Centered, Earth Fixed) for
@@ -105,18 +146,20 @@ def lla2ecef(lat, lng, h):
 
     Parameters
     ----------
-    lat : float
+    lat : float or array-like
         latitude in degrees
-    lng : float
+    lng : float or array-like
         longitude in degrees
-    h : float
+    h : float or array-like
         geometric altitude above sea level in meters
 
     Returns
     -------
     array-like
-        ECEF coordinates in meters
+        ECEF coordinates in meters, (3,) for a single point or (N, 3) for
+        arrays of N points
     """
+    lat, lng, h = _as_float(lat), _as_float(lng), _as_float(h)
     check_lat(lat)
     check_long(lng)
     check_alt(h)
@@ -134,7 +177,7 @@ def lla2ecef(lat, lng, h):
     y = (N + h) * cos(lat) * sin(lng)
     z = (((b / a) ** 2) * N + h) * sin(lat)
 
-    return array([x, y, z])
+    return np.stack(np.broadcast_arrays(x, y, z), axis=-1)
 
 
 def ned2ecef(v_ned, lat, lng):
@@ -143,36 +186,44 @@ def ned2ecef(v_ned, lat, lng):
     East, Down) at a given latitude and longitude to geocentric coordinates
     (ECEF - Earth Centered, Earth Fixed).
 
+    The rotations of many points are applied together with `numpy.einsum`
+    on a stack of (N, 3, 3) rotation matrices.
+
     Parameters
     ----------
     v_ned: array-like
-        vector expressed in NED coordinates
-    lat : float
-        latitude in degrees
-    lng : float
-        longitude in degrees
+        vector expressed in NED coordinates, (3,) or (N, 3)
+    lat : float or array-like
+        latitude in degrees, a scalar or (N,)
+    lng : float or array-like
+        longitude in degrees, a scalar or (N,)
 
     Returns
     -------
     v_ecef : array-like
-        vector expressed in ECEF coordinates
+        vector expressed in ECEF coordinates, (3,) or (N, 3)
     """
+    lat, lng = _as_float(lat), _as_float(lng)
     check_lat(lat)
     check_long(lng)
 
     lat = deg2rad(lat)
     lng = deg2rad(lng)
 
-    Lne = array(
+    sin_lat, cos_lat, sin_lng, cos_lng, zero = np.broadcast_arrays(
+        sin(lat), cos(lat), sin(lng), cos(lng), 0.0
+    )
+    Lne = np.stack(
         [
-            [-sin(lat) * cos(lng), -sin(lat) * sin(lng), cos(lat)],
-            [-sin(lng), cos(lng), 0],
-            [-cos(lat) * cos(lng), -cos(lat) * sin(lng), -sin(lat)],
-        ]
+            np.stack([-sin_lat * cos_lng, -sin_lat * sin_lng, cos_lat], axis=-1),
+            np.stack([-sin_lng, cos_lng, zero], axis=-1),
+            np.stack([-cos_lat * cos_lng, -cos_lat * sin_lng, -sin_lat], axis=-1),
+        ],
+        axis=-2,
     )
 
-    Len = Lne.transpose()
-    v_ecef = Len.dot(v_ned)
+    # Len = Lne.T for each point, v_ecef = Len . v_ned
+    v_ecef = np.einsum("...ji,...j->...i", Lne, np.asarray(v_ned, dtype=float))
 
     return v_ecef
 
@@ -186,12 +237,12 @@ def pressure(h):
 
     Parameters
     ----------
-    h : float
+    h : float or array-like
         altitude above sea level in meters
 
     Returns
     -------
-    p : float
+    p : float or numpy.ndarray
         pressure in Pa
 
     Notes
@@ -152,18 +152,23 @@ def hour_angle(date):
 
     Parameters
     ----------
-    date : datetime object
-        date and *solar* time
+    date : datetime object or array-like of datetime objects
+        date and *solar* time, or for example a pandas.DatetimeIndex
 
     Returns
     -------
-    hour angle : float
+    hour angle : float or numpy.ndarray
         local hour angle in radians
     """
     if isinstance(date, datetime):
         w = (date.hour + (date.minute / 60) - 12) * 15
         return deg2rad(w)
-    raise TypeError("date must be a datetime object")
+    try:
+        minutes = np.asarray(date, dtype="datetime64[m]")
+    except (TypeError, ValueError):
+        raise TypeError("date must be a datetime object") from None
+    minutes = (minutes - minutes.astype("datetime64[D]")).astype(float)
+    return deg2rad((minutes / 60 - 12) * 15)
 
 
 def theta(date, lat, beta, surf_az):
@@ -515,16 +520,16 @@ def air_mass_kastenyoung1989(theta_z, h, limit=True):
 
     Parameters
     ----------
-    theta_z : float
+    theta_z : float or array-like
         zenith angle of incidence in degrees
-    h : float
+    h : float or array-like
         altitude above sea level in meters
     limit : boolean
         activates or deaactivates altitude limit
 
     Returns
     -------
-    m : float
+    m : float or numpy.ndarray
         ratio
 
     Notes
@@ -540,16 +545,11 @@ def air_mass_kastenyoung1989(theta_z, h, limit=True):
 
     # this saturation is an interim solution needed to avoid KY1989 model
     # limitations beyond 90º. TODO: improve
-    if theta_z < 91.5:
-        theta_z_rad = deg2rad(theta_z)
-        m = exp(-0.0001184 * h) / (
-            cos(theta_z_rad) + 0.50572 * (96.07995 - theta_z) ** (-1.634)
-        )
-    else:
-        theta_z_rad = deg2rad(91.5)
-        m = exp(-0.0001184 * h) / (
-            cos(theta_z_rad) + 0.50572 * (96.07995 - 91.5) ** (-1.634)
-        )
+    theta_z = np.minimum(theta_z, 91.5)
+    theta_z_rad = deg2rad(theta_z)
+    m = exp(-0.0001184 * h) / (
+        cos(theta_z_rad) + 0.50572 * (96.07995 - theta_z) ** (-1.634)
+    )
 
     return m
 
@@ -591,23 +591,24 @@ def beam_irradiance(h, date, lat):
 
     Parameters
     ----------
-    h : float
+    h : float or array-like
         altitude above sea level in meters
-    date : datetime object
-        date and *solar* time
+    date : datetime object or array-like of datetime objects
+        date and *solar* time, or for example an hourly pandas.DatetimeIndex
     lat : float
         latitude (-90 to 90) in degrees
 
     Returns
     -------
-    G : float
-        beam irradiance in W/m2
+    G : float or numpy.ndarray
+        beam irradiance in W/m2, an array for arrays of altitudes or dates
 
     Notes
     -----
     Aglietti, G.S., Redi, S., Tatnall,A.R., Markvart, T., (2009) "Harnessing
     High-Altitude Solar Power"
     """
+    h = np.asarray(h, dtype=float)
     alpha_int = 0.32  # atmospheric extinction. TODO: improve, as it changes
     # throughout the year. Visible light? 4000-7000A
     prel = pressure(h) / pressure(0)  # pressure relation
@@ -618,13 +619,11 @@ def beam_irradiance(h, date, lat):
 
     theta_zenith = theta_z(date, lat)  # radians
 
-    if theta_zenith < theta_lim:
-        m = air_mass_kastenyoung1989(rad2deg(theta_zenith), h)
-        G = gon(date) * exp(-prel * m * alpha_int)
-    else:
-        G = 0
+    # the air mass saturates below the horizon, so it is finite everywhere
+    m = air_mass_kastenyoung1989(rad2deg(theta_zenith), h)
+    G = np.where(theta_zenith < theta_lim, gon(date) * exp(-prel * m * alpha_int), 0.0)
 
-    return G
+    return G[()]
 
 
 def irradiance_on_plane(vnorm, h, date, lat):
@@ -670,3 +669,50 @@ def irradiance_on_plane(vnorm, h, date, lat):
             G = 0
 
     return G
+
+
+def irradiance_on_planes(vnorms, h, dates, lat):
+    """
+    Returns the solar beam irradiance on many planes, defined by their
+    normal vectors in NED frame, for every date of a series of dates at a
+    certain altitude and latitude.
+
+    The sun vector and the beam irradiance are calculated once for each
+    date and the incidence on all of the planes with one matrix multiply,
+    instead of calling `irradiance_on_plane` for each plane and date.
+
+    Note: it does not take into account the diffuse irradiance
+
+    Parameters
+    ----------
+    vnorms : array-like
+        (N, 3) array of vectors normal to the planes, or a single vector
+    h : float
+        altitude above sea level in meters
+    dates : iterable of datetime objects
+        dates and *solar* times, for example an hourly pandas.DatetimeIndex
+    lat : float
+        latitude (-90 to 90) in degrees
+
+    Returns
+    -------
+    G : numpy.ndarray
+        (len(dates), N) beam irradiance in W/m2
+    """
+    vnorms = np.atleast_2d(np.asarray(vnorms, dtype=float))
+    if vnorms.ndim != 2 or vnorms.shape[1] != 3:
+        raise ValueError("vnorms should be a (N, 3) array of normal vectors")
+    vnorms = vnorms / np.linalg.norm(vnorms, axis=1, keepdims=True)
+
+    dates = list(dates)
+    vsol = np.array([solar_vector_ned(date, lat) for date in dates], dtype=float)
+    vsol = vsol.reshape(len(dates), 3)
+    beam = np.where(vsol.any(axis=1), beam_irradiance(h, dates, lat), 0.0)
+
+    # night or permanent darkness has a zero sun vector, and a zero norm
+    vsol_abs = np.linalg.norm(vsol, axis=1, keepdims=True)
+    vsol = np.divide(vsol, vsol_abs, out=np.zeros_like(vsol), where=vsol_abs > 0)
+
+    # for future solar panel applications: only one side has cells
+    cos_theta = np.clip(vsol @ vnorms.T, 0, None)
+    return beam[:, np.newaxis] * cos_theta
@@ -33,9 +33,16 @@ from typing import Literal
 import numpy as np
 import pandas as pd
 
+from .daymatrix import (
+    broadcast_daily,
+    correct_daily_mean,
+    daily_range,
+    hourly_index,
+    next_day,
+    to_day_matrix,
+)
 from .melodist.melodist.util.util import (
     dewpoint_temperature,
-    distribute_equally,
     linregress,
     vapor_pressure,
 )
@@ -71,16 +78,22 @@ def disaggregate_tdew(
         method: keyword specifying the disaggregation method to be used
         temp: hourly temperature time series (necessary for some methods)
         kr: parameter for linear_dewpoint_variation method (6 or 12)
-        month_hour_precip_mean: [month, hour, precip(y/n)] categorical mean values
+        month_hour_precip_mean: (12, 24, 2) array of mean values indexed by
+            [month - 1, hour, precip(y/n)] as returned by
+            calculate_month_hour_precip_mean
         preserve_daily_mean: if True, correct the daily mean values of the disaggregated
             data with the observed daily means.
 
     Returns:
         Disaggregated hourly values of relative humidity.
     """
+    # All of the calculations are on (days, 24) matrices.
+    days = daily_range(data_daily.index)
+    if temp is not None:
+        temp = to_day_matrix(temp, days)
+
     if method == "equal":
-        hum_disagg = distribute_equally(data_daily.hum)
-        hum_disagg = hum_disagg.clip(0, 100)
+        hum_disagg = broadcast_daily(data_daily.hum, days).clip(0, 100)
         tdew_disagg = dewpoint_temperature(temp, hum_disagg)
     elif method in ("minimal", "dewpoint_regression", "linear_dewpoint_variation"):
         if method == "minimal":
@@ -90,40 +103,37 @@ def disaggregate_tdew(
         assert a0 is not None and a1 is not None, "a0 and a1 must be specified"
         tdew_daily = a0 + a1 * data_daily.tmin
 
-        tdew = distribute_equally(tdew_daily)
+        tdew = broadcast_daily(tdew_daily, days)
 
         if method == "linear_dewpoint_variation":
             assert kr is not None, "kr must be specified"
             assert kr in (6, 12), "kr must be 6 or 12"
+            hours = np.arange(24)
             tdew_delta = 0.5 * np.sin(
-                (temp.index.hour + 1) * np.pi / kr - 3.0 * np.pi / 4.0
+                (hours + 1) * np.pi / kr - 3.0 * np.pi / 4.0
             )  # eq. (21) from Debele et al. (2007)
 
-            tdew_nextday = tdew.shift(-24)
-            tdew_nextday.iloc[-24:] = tdew.iloc[-24:]  # copy the last day
-
             # eq. (20) from Debele et al. (2007):
             # (corrected - the equation is wrong both in Debele et al. (2007)
             # and Bregaglio et al. (2010) - it should be (T_dp,day)_(d+1)
             # - (T_dp,day)_d instead of the other way around)
-            tdew += temp.index.hour / 24.0 * (tdew_nextday - tdew) + tdew_delta
+            # The last day is copied as its own next day.
+            tdew += hours / 24.0 * (next_day(tdew) - tdew) + tdew_delta
 
         tdew_disagg = tdew
         if preserve_daily_mean:
             sat_vap_press_tdew = vapor_pressure(tdew, 100)
             sat_vap_press_t = vapor_pressure(temp, 100)
-            hum_disagg = pd.Series(
-                index=temp.index, data=100 * sat_vap_press_tdew / sat_vap_press_t
-            )
+            hum_disagg = 100 * sat_vap_press_tdew / sat_vap_press_t
     elif method == "min_max":
         assert "hum_min" in data_daily.columns and "hum_max" in data_daily.columns, (
             "Minimum and maximum humidity must be present in data frame"
         )
 
-        hmin = distribute_equally(data_daily.hum_min)
-        hmax = distribute_equally(data_daily.hum_max)
-        tmin = distribute_equally(data_daily.tmin)
-        tmax = distribute_equally(data_daily.tmax)
+        hmin = broadcast_daily(data_daily.hum_min, days)
+        hmax = broadcast_daily(data_daily.hum_max, days)
+        tmin = broadcast_daily(data_daily.tmin, days)
+        tmax = broadcast_daily(data_daily.tmax, days)
 
         hum_disagg = hmax + (temp - tmin) / (tmax - tmin) * (hmin - hmax)
         hum_disagg = hum_disagg.clip(0, 100)
@@ -132,28 +142,25 @@ def disaggregate_tdew(
     elif method == "month_hour_precip_mean":
         assert month_hour_precip_mean is not None
 
-        precip_equal = distribute_equally(
-            data_daily.precip
+        precip_equal = broadcast_daily(
+            data_daily.precip, days
         )  # daily precipitation equally distributed to hourly values
-        hum_disagg = pd.Series(index=precip_equal.index, dtype=float)
-        locs = list(
-            zip(hum_disagg.index.month, hum_disagg.index.hour, precip_equal > 0)
-        )
-        hum_disagg[:] = month_hour_precip_mean.loc[locs].values
+        hum_disagg = month_hour_precip_mean[
+            days.month.to_numpy()[:, np.newaxis] - 1,
+            np.arange(24)[np.newaxis, :],
+            (precip_equal > 0).astype(int),
+        ]
         hum_disagg = hum_disagg.clip(0, 100)
         tdew_disagg = dewpoint_temperature(temp, hum_disagg)
 
     if preserve_daily_mean:
-        daily_mean_df = pd.DataFrame(
-            data={"obs": data_daily.hum, "disagg": hum_disagg.resample("D").mean()}
+        hum_disagg = correct_daily_mean(
+            hum_disagg, data_daily.hum.reindex(days).to_numpy(dtype=float)
         )
-        bias = distribute_equally(daily_mean_df.disagg - daily_mean_df.obs)
-        bias = bias.fillna(0)
-        hum_disagg -= bias
         hum_disagg = hum_disagg.clip(0, 100)
         tdew_disagg = dewpoint_temperature(temp, hum_disagg)
 
-    return tdew_disagg
+    return pd.Series(tdew_disagg.ravel(), index=hourly_index(days))
 
 
 def calculate_dewpoint_regression(hourly_data_obs, return_stats=False):
@@ -167,9 +174,18 @@ def calculate_dewpoint_regression(hourly_data_obs, return_stats=False):
 
 
 def calculate_month_hour_precip_mean(hourly_data_obs):
+    """Mean humidity by month, hour, and whether the day had precipitation.
+
+    Returns a dense (12, 24, 2) array indexed by [month - 1, hour, wet] so
+    that it can be indexed directly with integer arrays.  Combinations
+    without any observations are NaN.
+    """
     daily_precip_yesno = hourly_data_obs.precip.resample("D").sum() > 0
-    daily_precip_yesno.index.name = None
     hum = hourly_data_obs.hum
-    hum.index.name = None
-    wet = daily_precip_yesno.loc[hum.index.date].values
-    return hum.groupby([hum.index.month, hum.index.hour, wet]).mean()
+    wet = daily_precip_yesno.reindex(hum.index.normalize()).to_numpy(dtype=int)
+    cell = ((hum.index.month - 1) * 24 + hum.index.hour) * 2 + wet
+    valid = hum.notna().to_numpy()
+    sums = np.bincount(cell[valid], weights=hum.to_numpy()[valid], minlength=576)
+    counts = np.bincount(cell[valid], minlength=576)
+    with np.errstate(invalid="ignore"):
+        return (sums / counts).reshape(12, 24, 2)
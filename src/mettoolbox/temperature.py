@@ -0,0 +1,252 @@
+########################################################################
+# This file is part of MELODIST - MEteoroLOgical observation time      #
+# series DISaggregation Tool a program to disaggregate daily values    #
+# of meteorological variables to hourly values                         #
+#                                                                      #
+# Copyright (C) 2016  Florian Hanzer (1, 2), Kristian Förster (1, 2),  #
+# Benjamin Winter (1, 2), Thomas Marke (1)                             #
+#                                                                      #
+# (1) Institute of Geography, University of Innsbruck, Austria         #
+# (2) alpS - Centre for Climate Change Adaptation, Innsbruck, Austria  #
+#                                                                      #
+# MELODIST is free software: you can redistribute it and/or modify     #
+# it under the terms of the GNU General Public License as published by #
+# the Free Software Foundation, either version 3 of the License, or    #
+# (at your option) any later version.                                  #
+#                                                                      #
+# MELODIST is distributed in the hope that it will be useful,          #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the         #
+# GNU General Public License for more details.                         #
+#                                                                      #
+# You should have received a copy of the GNU General Public License    #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.#
+#                                                                      #
+########################################################################
+# This was created 2026/10/18. It is a modified copy of melodist's     #
+# temperature.py code that works on a (days, slots) matrix so that the #
+# output can have any number of time slots in a day.                   #
+########################################################################
+
+
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+from .daymatrix import daily_range, next_day, slot_hours
+
+try:
+    from pydantic import validate_arguments as validate_call
+except ImportError:
+    from pydantic import validate_call
+
+HOURS_PER_DAY = 24
+
+# Hours after sun noon of the maximum for "sun_loc".
+DEFAULT_SHIFT_HOURS = 2
+
+# Days shorter than this many hours are treated as polar night.
+DAYLENGTH_THRES = 3
+
+# Hours of the minimum and maximum during polar night.
+MIN_LOC_POLAR = 6
+MAX_LOC_POLAR = 18
+
+
+def _previous_day(values):
+    """The rows of `values` shifted down one day, repeating the first day."""
+    return np.concatenate([values[:1], values[:-1]])
+
+
+def _slot_mean_course(mean_course, slots):
+    """The (hours, months) mean course at the start of each slot.
+
+    Returns a (slots, 12) array interpolated linearly around the day.
+    Months missing from `mean_course` are NaN.
+    """
+    mean_course = mean_course.reindex(columns=range(1, 13))
+    hours = mean_course.index.to_numpy(dtype=float)
+    return np.column_stack(
+        [
+            np.interp(
+                slot_hours(slots),
+                hours,
+                mean_course[month].to_numpy(dtype=float),
+                period=HOURS_PER_DAY,
+            )
+            for month in range(1, 13)
+        ]
+    )
+
+
+def _polar(temp, polars, min_loc, max_loc, tmin, tmax, slots):
+    """Linear courses between fixed minimum and maximum for polar days.
+
+    Follows melodist: polar days get the daily minimum and maximum at 6 and
+    18 hours, or the other way around if the day is colder than the day
+    before.  The first normal day after a polar period starts at its
+    minimum, the last normal day before one ends at its maximum, and the
+    values in between are linearly interpolated.
+    """
+    per_hour = slots / HOURS_PER_DAY
+    min_slot = int(round(MIN_LOC_POLAR * per_hour))
+    max_slot = int(round(MAX_LOC_POLAR * per_hour))
+
+    avg_cur = (tmin + tmax) / 2.0
+    warming = _previous_day(avg_cur) <= avg_cur
+    temp[polars] = np.nan
+    temp[polars, min_slot] = np.where(warming, tmin, tmax)[polars]
+    temp[polars, max_slot] = np.where(warming, tmax, tmin)[polars]
+
+    change = np.flatnonzero(polars[1:] != polars[:-1]) + 1
+    to_normal = change[~polars[change]]
+    to_polar = change[polars[change]] - 1
+    for day in to_normal:
+        loc = int(round(min_loc[day] * per_hour))
+        temp[day, :loc] = np.nan
+        temp[day, loc] = tmin[day]
+    for day in to_polar:
+        temp[day, int(round(max_loc[day] * per_hour)) + 1 :] = np.nan
+
+    rows = np.flatnonzero(polars)
+    rows = np.union1d(rows, np.union1d(to_normal, to_polar))
+    temp[rows] = (
+        pd.Series(temp[rows].ravel())
+        .interpolate(method="linear", limit=slots - 1)
+        .to_numpy()
+        .reshape(len(rows), slots)
+    )
+    return temp
+
+
+@validate_call(config={"arbitrary_types_allowed": True})
+def disaggregate_temperature(
+    data_daily,
+    method: Literal[
+        "sine_min_max",
+        "sine_mean",
+        "sine",
+        "mean_course_min_max",
+        "mean_course_mean",
+    ] = "sine_min_max",
+    min_max_time: Literal["fix", "sun_loc", "sun_loc_shift"] = "fix",
+    mod_nighttime: bool = False,
+    max_delta=None,
+    mean_course=None,
+    sun_times=None,
+    slots: int = 24,
+):
+    """The disaggregation function for temperature
+
+    The methods are those of melodist with the time of day of each of the
+    `slots` time slots in place of the hour.  The minimum and maximum times
+    are rounded to the nearest slot rather than the nearest hour, and the
+    mean courses are interpolated linearly between the hours.  With 24
+    slots the result is the same as melodist.
+
+    Parameters
+    ----
+    data_daily :      daily data with columns "tmin", "tmax", and "temp"
+    method :          method to disaggregate
+    min_max_time:     "fix" - min/max temperature at fixed times 7h/14h,
+                      "sun_loc" - min/max calculated by sunrise/sunnoon + 2h,
+                      "sun_loc_shift" - min/max calculated by sunrise/sunnoon + monthly mean shift,
+    max_delta:        maximum monthly temperature shift as returned by get_shift_by_data()
+    mean_course:      normalized mean daily course by month as returned by
+                      calculate_mean_daily_course_by_month()
+    sun_times:        times of sunrise/noon as returned by get_sun_times()
+    slots:            number of time slots in a day
+
+    Returns
+    -------
+    numpy.ndarray
+        A (days, slots) array of temperature for the complete range of days
+        of `data_daily`.
+    """
+    days = daily_range(data_daily.index)
+    daily = data_daily.reindex(days)
+    tmin = daily.tmin.to_numpy(dtype=float)
+    tmax = daily.tmax.to_numpy(dtype=float)
+    hours = slot_hours(slots)[np.newaxis, :]
+
+    if method in ("mean_course_min_max", "mean_course_mean"):
+        course = _slot_mean_course(mean_course, slots)
+        if method == "mean_course_mean":
+            # Shift the mean course so that the daily mean is 0.
+            course = course - course.mean(axis=0)
+        course = course[:, days.month - 1].T
+        if method == "mean_course_min_max":
+            return course * (tmax - tmin)[:, np.newaxis] + tmin[:, np.newaxis]
+        temp = daily.temp.to_numpy(dtype=float)
+        return temp[:, np.newaxis] + (tmax - tmin)[:, np.newaxis] * course
+
+    def _to_slot(hour):
+        return np.round(hour * slots / HOURS_PER_DAY) * HOURS_PER_DAY / slots
+
+    if min_max_time == "fix":
+        # take fixed location for minimum and maximum
+        min_loc = np.full(len(days), 7.0)
+        max_loc = np.full(len(days), 14.0)
+    else:
+        sun = sun_times.reindex(days)
+        sunnoon = sun.sunnoon.to_numpy(dtype=float)
+        min_loc = _to_slot(sun.sunrise.to_numpy(dtype=float))
+        if min_max_time == "sun_loc":
+            max_loc = _to_slot(sunnoon) + DEFAULT_SHIFT_HOURS
+        else:
+            max_loc = _to_slot(sunnoon + np.asarray(max_delta[days.month], dtype=float))
+            pos = min_loc > max_loc
+            max_loc[pos] = _to_slot(sunnoon[pos]) + DEFAULT_SHIFT_HOURS
+
+    min_loc_col = min_loc[:, np.newaxis]
+    max_loc_col = max_loc[:, np.newaxis]
+
+    if method == "sine_mean":
+        dtr = (tmax - tmin)[:, np.newaxis]
+        temp = daily.temp.to_numpy(dtype=float)[:, np.newaxis] + dtr / 2.0 * np.cos(
+            2 * np.pi / HOURS_PER_DAY * (hours - max_loc_col)
+        )
+    else:
+        # before the maximum of the day use the minimum of the current day,
+        # after it the minimum of the next day; before the minimum use the
+        # maximum of the day before, after it the maximum of the current day
+        min_val = np.where(
+            hours < max_loc_col, tmin[:, np.newaxis], next_day(tmin)[:, np.newaxis]
+        )
+        max_val = np.where(
+            hours < min_loc_col,
+            _previous_day(tmax)[:, np.newaxis],
+            tmax[:, np.newaxis],
+        )
+        delta_val = max_val - min_val
+        v_trans = min_val + delta_val / 2.0
+
+        if mod_nighttime:
+            night = HOURS_PER_DAY - (max_loc_col - min_loc_col)
+            temp = v_trans + delta_val / 2.0 * np.where(
+                hours >= max_loc_col,
+                np.cos(np.pi / night * (hours - max_loc_col)),
+                np.where(
+                    hours > min_loc_col,
+                    np.cos(
+                        1.25 * np.pi
+                        + 0.75
+                        * np.pi
+                        / (max_loc_col - min_loc_col)
+                        * (hours - min_loc_col)
+                    ),
+                    np.cos(np.pi / night * (HOURS_PER_DAY - max_loc_col + hours)),
+                ),
+            )
+        else:
+            temp = v_trans + delta_val / 2.0 * np.cos(
+                2 * np.pi / HOURS_PER_DAY * (hours - max_loc_col)
+            )
+
+    if min_max_time != "fix":
+        polars = (sun.daylength < DAYLENGTH_THRES).to_numpy()
+        if polars.any():
+            temp = _polar(temp, polars, min_loc, max_loc, tmin, tmax, slots)
+
+    return temp
@@ -1,12 +1,128 @@
 """Utility functions for the `mettoolbox` package."""
 
+import functools
+import os
 import warnings
+import zlib
 
 import numpy as np
 import pandas as pd
 
-from .solarpy import declination
+from .core import extraterrestrial_radiation
+from .melodist.melodist.util.util import get_sun_times
+from .meteo_utils import extraterrestrial_r_hour
 from .toolbox_utils.src.toolbox_utils import tsutils
+from .toolbox_utils.src.toolbox_utils.utils import pandas_offset_by_version
+
+# Sun times tables for each day of the year keyed by (lat, lon, tz).
+_SUN_TIMES = {}
+
+# Hourly potential radiation for a whole year keyed by (lat, lon, tz, year).
+_POT_RAD = {}
+
+# Floating point type of the data read, disaggregated, and returned.  Solar
+# geometry and other intermediates that do not come from the input data are
+# always float64.
+_DTYPES = ("float64", "float32")
+_DTYPE = [np.dtype("float64")]
+
+
+def set_dtype(dtype):
+    """Set the floating point type of the data read and returned.
+
+    The readers convert the input to `dtype`, the disaggregation engine
+    fills its output in `dtype`, and every function returns `dtype`
+    columns.  Use "float32" to halve the memory and I/O of large runs; the
+    solar geometry and the other intermediates that do not come from the
+    input data stay float64.  The default is "float64", or the value of
+    the METTOOLBOX_DTYPE environment variable, which also sets the type
+    used by the command line.
+
+    Parameters
+    ----------
+    dtype : str or numpy.dtype
+        Either "float64" or "float32".
+    """
+    dtype = np.dtype(dtype)
+    if dtype.name not in _DTYPES:
+        raise ValueError(
+            tsutils.error_wrapper(
+                f"""
+                The floating point type has to be one of {_DTYPES}.  You
+                gave {dtype.name}.
+                """
+            )
+        )
+    _DTYPE[0] = dtype
+
+
+def get_dtype():
+    """Return the floating point type set with `set_dtype`."""
+    return _DTYPE[0]
+
+
+set_dtype(os.environ.get("METTOOLBOX_DTYPE", "float64"))
+
+
+def _station_keys(stations):
+    """Stable integer keys for the stations from their full column labels.
+
+    Columns with the same label, for example from two files, are told apart
+    by their position among the columns with that label, so the key of a
+    station does not depend on the other, differently labelled, stations.
+    """
+    seen = {}
+    keys = []
+    for station in stations:
+        label = str(station)
+        keys.append((zlib.crc32(label.encode("utf-8")), seen.get(label, 0)))
+        seen[label] = seen.get(label, 0) + 1
+    return keys
+
+
+def _daily_uniforms(entropy, stations, days, shape=(), key=()):
+    """Uniform random numbers for each station and day.
+
+    Each station and calendar year has its own independent stream, spawned
+    from `entropy` with the key (station label, position among the stations
+    with that label, year, *key), and the stream always covers all 366 days
+    of the year.  The numbers for a given station and day are therefore the
+    same no matter which other stations or days are processed with it, so
+    runs can be split across workers or into chunks of stations or dates
+    and still be bit-identical to a single run.  Stations with the same
+    label have to stay in the same order.
+
+    Parameters
+    ----------
+    entropy : int
+        Root entropy, usually `numpy.random.SeedSequence(seed).entropy`.
+    stations : list
+        Column names of the stations.
+    days : pandas.DatetimeIndex
+        The days to draw numbers for.
+    shape : tuple
+        Shape of the numbers drawn for each day.
+    key : tuple
+        Additional integers to separate the streams of different uses.
+
+    Returns
+    -------
+    numpy.ndarray
+        A (stations, days, *shape) array of uniform random numbers in [0, 1).
+    """
+    shape = tuple(shape)
+    out = np.empty((len(stations), len(days)) + shape)
+    years = days.year.to_numpy()
+    doy = days.dayofyear.to_numpy() - 1
+    station_keys = _station_keys(stations)
+    for year in np.unique(years):
+        sel = years == year
+        for i, station_key in enumerate(station_keys):
+            seq = np.random.SeedSequence(
+                entropy, spawn_key=station_key + (int(year),) + tuple(key)
+            )
+            out[i, sel] = np.random.default_rng(seq).random((366,) + shape)[doy[sel]]
+    return out
 
 
 def _check_cols(*args):
@@ -21,6 +137,250 @@ def _check_cols(*args):
     return coll_cols, coll_names
 
 
+@functools.lru_cache(maxsize=None)
+def _unit_factors(source, target):
+    """Scale and offset that convert values in `source` to `target` units.
+
+    Resolved with pint, through pint_pandas like `tsutils.common_kwds`, only
+    once for each pair of unit strings.  All of the units used here are
+    linear, perhaps with an offset like degF to degC, so two points are
+    enough.
+    """
+    try:
+        zero, one = np.asarray(
+            pd.Series([0.0, 1.0], dtype=f"pint[{source}]").pint.to(target),
+            dtype=float,
+        )
+    except Exception as exc:
+        raise ValueError(
+            tsutils.error_wrapper(
+                f"""
+                No conversion between {source} and {target}.
+                """
+            )
+        ) from exc
+    return one - zero, zero
+
+
+def _convert_units(tsd, source_units, target_units):
+    """Convert the units of all of the columns of `tsd` in one pass.
+
+    Follows `tsutils.common_kwds`: the source units are the second ":"
+    delimited field of the column names or the `source_units` keyword,
+    which have to agree, and a None target leaves that column alone.  The
+    conversion factors come from `_unit_factors` and the whole table is
+    converted with one array multiply and add.
+    """
+    tsd = pd.DataFrame(tsd)
+    ncols = len(tsd.columns)
+
+    def _per_column(units):
+        units = tsutils.make_list(units)
+        if units is None:
+            return [None] * ncols
+        if len(units) == 1:
+            return units * ncols
+        if len(units) != ncols:
+            raise ValueError(
+                tsutils.error_wrapper(
+                    f"""
+                    Need a single unit or one for each of the {ncols}
+                    columns.  You gave {units}.
+                    """
+                )
+            )
+        return units
+
+    target_units = _per_column(target_units)
+    if all(target is None for target in target_units):
+        return tsd
+    source_units = _per_column(source_units)
+
+    columns = []
+    scale = np.ones(ncols)
+    offset = np.zeros(ncols)
+    for inx, (column, source, target) in enumerate(
+        zip(tsd.columns, source_units, target_units)
+    ):
+        words = str(column).split(":")
+        if len(words) >= 2 and words[1]:
+            if source is not None and source != words[1]:
+                raise ValueError(
+                    tsutils.error_wrapper(
+                        f"""
+                        The units specified by the "source_units" keyword
+                        and in the second ":" delimited field in the column
+                        name must match.  "source_units" keyword is {source}
+                        and the column name is {column}.
+                        """
+                    )
+                )
+            source = words[1]
+        if target is None:
+            columns.append(column)
+            continue
+        if source is None:
+            raise ValueError(
+                tsutils.error_wrapper(
+                    f"""
+                    To convert "{column}" to {target} the source units need
+                    to be in the second ":" delimited field of the column
+                    name or in the "source_units" keyword.
+                    """
+                )
+            )
+        if source != target:
+            scale[inx], offset[inx] = _unit_factors(source, target)
+        columns.append(":".join([words[0], target] + words[2:]))
+
+    # A copy, since for a single float block to_numpy returns a view of the
+    # caller's frame, which is read-only under copy-on-write.
+    values = tsd.to_numpy(dtype=get_dtype(), copy=True)
+    values *= scale
+    values += offset
+    return pd.DataFrame(values, index=tsd.index, columns=columns)
+
+
+def _float_frame(tsd, columns=None, dtype=None):
+    """`tsd` as a DataFrame of one `dtype` block, by default `get_dtype()`.
+
+    The data are copied only if they are not already a single block of
+    `dtype`, for example the nullable Float64 columns from
+    `tsutils.common_kwds`, otherwise the returned DataFrame is a view that
+    shares the memory of `tsd`.
+    """
+    if dtype is None:
+        dtype = get_dtype()
+    return pd.DataFrame(
+        np.asarray(tsd.to_numpy(dtype=dtype)),
+        index=tsd.index,
+        columns=tsd.columns if columns is None else list(columns),
+    )
+
+
+def _return_input(print_input, tsd, output):
+    """`tsutils.return_input` with the float columns in `get_dtype()`.
+
+    With the default float64 the frames are passed through untouched.
+    """
+    dtype = get_dtype()
+    if dtype != np.float64:
+        tsd, output = (
+            frame.astype(
+                {col: dtype for col, kind in frame.dtypes.items() if kind.kind == "f"}
+            )
+            for frame in (pd.DataFrame(tsd), pd.DataFrame(output))
+        )
+    return tsutils.return_input(print_input, tsd, output)
+
+
+def _station_values(name, values, nstations):
+    """One value of the parameter `name` for each of `nstations` stations.
+
+    `values` is a single value used for every station or a list, or comma
+    separated string, with one value for each station.
+    """
+    values = np.asarray(tsutils.make_list(values), dtype=float)
+    if len(values) == 1:
+        return np.repeat(values, nstations)
+    if len(values) != nstations:
+        raise ValueError(
+            tsutils.error_wrapper(
+                f"""
+                The "{name}" parameter needs a single value or one value for
+                each of the {nstations} stations.  You gave {len(values)}
+                values.
+                """
+            )
+        )
+    return values
+
+
+def _station_read(
+    input_ts,
+    variables,
+    source_units,
+    skiprows,
+    names,
+    index_type,
+    start_date,
+    end_date,
+    round_index,
+    dropna,
+    clean,
+):
+    """Read the columns of each variable for every station in one pass.
+
+    `variables` is a list of (name, columns, target units) where `columns`
+    has one column for each station, or a single column used for all of the
+    stations, or is None if the variable is not used.  Returns the input in
+    the target units, a dict of (times, stations) arrays, (times, 1) for a
+    single column, by name, and the station names, taken from the column
+    names of the first variable with one column for each station.
+    """
+    variables = [
+        (name, tsutils.make_list(cols), units)
+        for name, cols, units in variables
+        if cols is not None
+    ]
+    nstations = max(len(cols) for _, cols, _ in variables)
+    for name, cols, _ in variables:
+        if len(cols) not in (1, nstations):
+            raise ValueError(
+                tsutils.error_wrapper(
+                    f"""
+                    The columns for "{name}" need to be a single column or one
+                    column for each of the {nstations} stations.  You gave
+                    {cols}.
+                    """
+                )
+            )
+
+    tsd = tsutils.common_kwds(
+        input_ts,
+        skiprows=skiprows,
+        names=names,
+        index_type=index_type,
+        start_date=start_date,
+        end_date=end_date,
+        pick=[col for _, cols, _ in variables for col in cols],
+        round_index=round_index,
+        dropna=dropna,
+        clean=clean,
+    )
+    tsd = _convert_units(
+        tsd, source_units, [units for _, cols, units in variables for _ in cols]
+    )
+
+    values = tsd.to_numpy(dtype=get_dtype())
+    arrays = {}
+    stations = None
+    start = 0
+    for name, cols, _ in variables:
+        arrays[name] = values[:, start : start + len(cols)]
+        if stations is None and len(cols) == nstations:
+            stations = [
+                str(col).split(":")[0] for col in tsd.columns[start : start + len(cols)]
+            ]
+        start += len(cols)
+    return tsd, arrays, stations
+
+
+def _station_frame(name, values, index, target_units, stations=None):
+    """A (times, stations) array of evaporation in mm as a DataFrame.
+
+    With more than one station the columns are named
+    "<station>_<name>:mm" from the `stations` names.
+    """
+    if values.shape[1] == 1:
+        columns = [f"{name}:mm"]
+    else:
+        columns = [f"{station}_{name}:mm" for station in stations]
+    return _convert_units(
+        pd.DataFrame(values, index=index, columns=columns), "mm", target_units
+    )
+
+
 def _check_temperature_cols(
     temp_min_col=None,
     temp_max_col=None,
@@ -109,23 +469,135 @@ def _validate_temperatures(tsd, temp_min_col, temp_max_col):
 
 
 def radiation(tsd, lat):
-    jday = tsd.index.dayofyear.astype("i").values
+    ra = extraterrestrial_radiation(tsd.index.dayofyear.to_numpy(), lat)
+    return pd.DataFrame(ra, index=tsd.index, columns=["ra"])
+
+
+def _location_key(lat, lon, tz=None):
+    """Key of a location for the caches, estimating the time zone from `lon`."""
+    if tz is None:
+        tz = round(lon / 15.0)
+    return (float(lat), float(lon), int(tz))
 
-    lrad = lat * np.pi / 180.0
 
-    dec = [declination(i) for i in tsd.index.to_pydatetime()]
+def cached_sun_times(index, lat, lon, tz=None):
+    """Sunrise, sun noon, sunset, and day length for each day in `index`.
 
-    s = np.arccos(-np.tan(dec) * np.tan(lrad))
+    The sun times only depend on the location and the day of the year, so a
+    366 row table is calculated once for each (lat, lon, tz) with melodist's
+    `get_sun_times` and then gathered by day of year for any index.  Stations
+    at the same location share the table.
 
-    # FAO radiation calculation
-    dr = 1.0 + 0.033 * np.cos(2 * np.pi * jday / 365)
+    Parameters
+    ----------
+    index : pandas.DatetimeIndex
+        The days to return sun times for.
+    lat : float
+        Latitude in decimal degrees.
+    lon : float
+        Longitude in decimal degrees.
+    tz : int
+        Time zone as hours from UTC.  If None estimated as `round(lon / 15)`.
 
-    # FAO radiation calculation
-    ra = (
-        118.08
-        / np.pi
-        * dr
-        * (s * np.sin(lrad) * np.sin(dec) + np.cos(lrad) * np.cos(dec) * np.sin(s))
+    Returns
+    -------
+    pandas.DataFrame
+        The "sunrise", "sunnoon", "sunset", and "daylength" columns in
+        decimal hours with `index` as the index.
+    """
+    key = _location_key(lat, lon, tz)
+    if key not in _SUN_TIMES:
+        # 2000 is a leap year, so the table has a row for every day of year.
+        _SUN_TIMES[key] = get_sun_times(
+            pd.date_range("2000-01-01", "2000-12-31", freq="D"), key[1], key[0], key[2]
+        ).astype(float)
+    table = _SUN_TIMES[key]
+    return pd.DataFrame(
+        table.to_numpy()[index.dayofyear.to_numpy() - 1],
+        index=index,
+        columns=table.columns,
     )
 
-    return pd.DataFrame(ra, index=tsd.index, columns=["ra"])
+
+def load_sun_times(filename):
+    """Add the sun times tables saved with `save_sun_times` to the cache.
+
+    Missing files are ignored so the same file name can be used to both load
+    and later save the cache.
+    """
+    if not os.path.exists(filename):
+        return
+    saved = pd.read_csv(
+        filename,
+        index_col=["lat", "lon", "tz", "dayofyear"],
+        float_precision="round_trip",
+    )
+    for key, table in saved.groupby(level=["lat", "lon", "tz"]):
+        _SUN_TIMES[_location_key(*key)] = table.droplevel(["lat", "lon", "tz"]).astype(
+            float
+        )
+
+
+def save_sun_times(filename):
+    """Save all cached sun times tables to a CSV file."""
+    if not _SUN_TIMES:
+        return
+    saved = pd.concat(
+        [
+            table.set_axis(pd.RangeIndex(1, len(table) + 1, name="dayofyear"))
+            for table in _SUN_TIMES.values()
+        ],
+        keys=list(_SUN_TIMES.keys()),
+        names=["lat", "lon", "tz"],
+    )
+    saved.to_csv(filename, float_format="%.17g")
+
+
+def potential_radiation(index, lat, lon, tz=None):
+    """Hourly potential radiation for each hour in `index`.
+
+    The extraterrestrial radiation of `meteo_utils.extraterrestrial_r_hour`
+    is calculated for a whole year at a time and cached for each location
+    and year, so it can replace a potential radiation file for the
+    disaggregation of radiation.
+
+    Parameters
+    ----------
+    index : pandas.DatetimeIndex
+        Hourly index to return potential radiation for.
+    lat : float
+        Latitude in decimal degrees.
+    lon : float
+        Longitude in decimal degrees, negative to the west.
+    tz : int
+        Time zone as hours from UTC.  If None estimated as `round(lon / 15)`.
+
+    Returns
+    -------
+    pandas.Series
+        Mean potential radiation over each hour in W/m**2.
+    """
+    key = _location_key(lat, lon, tz)
+    out = np.empty(len(index))
+    years = index.year.to_numpy()
+    for year in np.unique(years):
+        start = pd.Timestamp(year=int(year), month=1, day=1)
+        if key + (int(year),) not in _POT_RAD:
+            hours = pd.date_range(
+                start=start,
+                end=start + pd.offsets.YearEnd() + pd.Timedelta(hours=23),
+                freq=pandas_offset_by_version("h"),
+            )
+            # meteo_utils uses radians, and degrees west of Greenwich for
+            # the longitudes of the site and of the time zone meridian.
+            _POT_RAD[key + (int(year),)] = (
+                extraterrestrial_r_hour(
+                    hours, np.deg2rad(key[0]), -15.0 * key[2], -key[1]
+                )
+                * 1e6
+                / 3600.0
+            )
+        sel = years == year
+        hour_of_year = (index[sel] - start) // pd.Timedelta(hours=1)
+        out[sel] = _POT_RAD[key + (int(year),)][hour_of_year]
+    return pd.Series(out, index=index)
@@ -0,0 +1,97 @@
+"""
+test_cascade
+----------------------------------
+
+Tests of the multiplicative random cascade precipitation disaggregation.
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from mettoolbox import mettoolbox as mtb
+from mettoolbox.cascade import calculate_cascade_statistics, disaggregate_cascade
+
+HOURLY = "tests/data_obs_hourly_precip_hum.csv"
+DAILY = "tests/data_daily_gainesville_precip.csv"
+
+
+class TestCascade(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        hourly = pd.read_csv(HOURLY, index_col=0, parse_dates=True)["precip"]
+        cls.stats = calculate_cascade_statistics(hourly)
+        daily = pd.read_csv(DAILY, index_col=0, parse_dates=True)
+        daily = daily.loc["2000-01-01":"2000-12-31"].astype(float)
+        cls.daily = pd.DataFrame(
+            {"a": daily.iloc[:, 0], "b": daily.iloc[:, 0].shift(3, fill_value=0.0)}
+        )
+
+    def _daily_totals(self, out, slots):
+        return out.reshape(len(self.daily), slots, *out.shape[1:]).sum(axis=1)
+
+    def test_statistics(self):
+        for key in ("p01", "p10", "pxx"):
+            self.assertEqual(self.stats[key].shape, (2, 4))
+        np.testing.assert_allclose(
+            self.stats["p01"] + self.stats["p10"] + self.stats["pxx"], 1.0
+        )
+        np.testing.assert_allclose(self.stats["wxx"].sum(axis=0), 1.0)
+        self.assertEqual(len(self.stats["threshold"]), 5)
+
+    def test_conserves_daily_totals(self):
+        out = disaggregate_cascade(self.daily, self.stats, seed=1, nmembers=3)
+        self.assertEqual(out.shape, (24 * len(self.daily), 2, 3))
+        self.assertTrue((out >= 0).all())
+        np.testing.assert_allclose(
+            self._daily_totals(out, 24),
+            np.repeat(self.daily.to_numpy()[:, :, np.newaxis], 3, axis=2),
+            atol=1e-9,
+        )
+
+    def test_seed(self):
+        first = disaggregate_cascade(self.daily, self.stats, seed=1, nmembers=2)
+        again = disaggregate_cascade(self.daily, self.stats, seed=1, nmembers=2)
+        other = disaggregate_cascade(self.daily, self.stats, seed=2, nmembers=2)
+        np.testing.assert_array_equal(first, again)
+        self.assertFalse(np.array_equal(first, other))
+        # The members of a station are different realizations.
+        self.assertFalse(np.array_equal(first[:, 0, 0], first[:, 0, 1]))
+
+    def test_date_chunks(self):
+        whole = disaggregate_cascade(self.daily, self.stats, seed=1)
+        # Chunks with one day of overlap at each end, as the docstring says.
+        chunk = disaggregate_cascade(self.daily.iloc[99:201], self.stats, seed=1)
+        np.testing.assert_array_equal(chunk[24:-24], whole[100 * 24 : 200 * 24])
+
+    def test_sub_hourly(self):
+        hourly = disaggregate_cascade(self.daily, self.stats, seed=1)
+        quarters = disaggregate_cascade(self.daily, self.stats, seed=1, slots=96)
+        self.assertEqual(quarters.shape, (96 * len(self.daily), 2, 1))
+        np.testing.assert_allclose(
+            quarters.reshape(-1, 4, 2, 1).sum(axis=1), hourly, atol=1e-9
+        )
+
+    def test_precipitation(self):
+        out = mtb.disaggregate.precipitation(
+            "cascade",
+            "mm",
+            input_ts=DAILY,
+            start_date="2000-01-01",
+            end_date="2000-03-31",
+            hourly_precip=f"{HOURLY},1",
+            nmembers=2,
+            seed=42,
+        )
+        self.assertEqual(list(out.columns), ["Daymet-prcp_1:mm:", "Daymet-prcp_2:mm:"])
+        self.assertEqual(len(out), 24 * 91)
+        daily = pd.read_csv(DAILY, index_col=0, parse_dates=True)
+        np.testing.assert_allclose(
+            out.sum().to_numpy(dtype=float),
+            daily.loc["2000-01-01":"2000-03-31"].sum().iloc[0],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+test_daymatrix
+----------------------------------
+
+Tests of the (days, slots) matrix helpers of the disaggregation.
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from mettoolbox import daymatrix
+
+
+class TestDayMatrix(unittest.TestCase):
+    def setUp(self):
+        self.days = pd.date_range("2020-02-27", periods=4, freq="D")
+        index = daymatrix.hourly_index(self.days)
+        self.hourly = pd.Series(np.arange(len(index), dtype=float), index=index)
+
+    def test_slots_per_day(self):
+        self.assertEqual(daymatrix.slots_per_day(), 24)
+        self.assertEqual(daymatrix.slots_per_day("h"), 24)
+        self.assertEqual(daymatrix.slots_per_day("15min"), 96)
+        for target_freq in ("7min", "2D", "M"):
+            with self.assertRaises(ValueError):
+                daymatrix.slots_per_day(target_freq)
+
+    def test_slot_weights(self):
+        weights = daymatrix.slot_weights(32, 24)
+        np.testing.assert_allclose(weights.sum(axis=1), 1.0)
+        # Every hour gets 4/3 of the 45 minute parts.
+        np.testing.assert_allclose(weights.sum(axis=0), 32 / 24)
+        np.testing.assert_allclose(daymatrix.slot_weights(24, 96).sum(axis=1), 1.0)
+        np.testing.assert_array_equal(daymatrix.slot_weights(24, 24), np.eye(24))
+
+    def test_round_trip(self):
+        matrix = daymatrix.to_day_matrix(self.hourly)
+        self.assertEqual(matrix.shape, (4, 24))
+        self.assertTrue(matrix.flags["C_CONTIGUOUS"])
+        out = daymatrix.to_frame(matrix, self.days, ["value"])
+        pd.testing.assert_series_equal(
+            out["value"], self.hourly, check_names=False, check_freq=False
+        )
+
+    def test_missing_slots(self):
+        matrix = daymatrix.to_day_matrix(self.hourly.drop(self.hourly.index[30]))
+        self.assertTrue(np.isnan(matrix[1, 6]))
+        self.assertEqual(np.isnan(matrix).sum(), 1)
+
+    def test_broadcast_daily(self):
+        daily = pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": [4.0, 5.0, 6.0]})
+        daily.index = self.days[[0, 1, 3]]
+        matrix = daymatrix.broadcast_daily(daily, self.days, slots=96)
+        self.assertEqual(matrix.shape, (4, 96, 2))
+        np.testing.assert_array_equal(matrix[:, 50, 1], [4.0, 5.0, np.nan, 6.0])
+
+    def test_correct_daily_mean(self):
+        matrix = daymatrix.to_day_matrix(self.hourly)
+        daily_mean = np.array([0.0, 1.0, np.nan, 2.0])
+        out = daymatrix.correct_daily_mean(matrix, daily_mean)
+        np.testing.assert_allclose(out.mean(axis=1)[[0, 1, 3]], [0.0, 1.0, 2.0])
+        np.testing.assert_array_equal(out[2], matrix[2])
+        np.testing.assert_allclose(np.ptp(out, axis=1), np.ptp(matrix, axis=1))
+
+    def test_next_day(self):
+        matrix = daymatrix.to_day_matrix(self.hourly)
+        out = daymatrix.next_day(matrix)
+        np.testing.assert_array_equal(out[:-1], matrix[1:])
+        np.testing.assert_array_equal(out[-1], matrix[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,12 +5,18 @@ test_mettoolbox
 Tests for `mettoolbox` module.
 """
 
+import os
+import tempfile
 import unittest
 
+import numpy as np
+import pandas as pd
 from pandas.testing import assert_frame_equal
 from tstoolbox import tstoolbox
 
-from mettoolbox import mettoolbox
+from mettoolbox import mettoolbox, temperature
+from mettoolbox.melodist.melodist.temperature import disaggregate_temperature
+from mettoolbox.utils import cached_sun_times
 
 
 class TestMettoolbox(unittest.TestCase):
@@ -39,5 +45,148 @@ class TestMettoolbox(unittest.TestCase):
         pass
 
 
+class TestTargetFreq(unittest.TestCase):
+    def setUp(self):
+        self.input_ts = "tests/data_temperature_gainesville.csv"
+        self.daily = pd.read_csv(self.input_ts, index_col=0, parse_dates=True).loc[
+            "2001"
+        ]
+
+    def _temperature(self, method, **kwds):
+        return mettoolbox.disaggregate.temperature(
+            method,
+            ["degC", "degC"],
+            min_max_time="sun_loc",
+            temp_min_col=1,
+            temp_max_col=2,
+            lat=29.65,
+            lon=-82.32,
+            input_ts=self.input_ts,
+            start_date="2001-01-01",
+            end_date="2001-12-31",
+            **kwds,
+        )
+
+    def test_sine_min_max_15min(self):
+        out = self._temperature("sine_min_max", target_freq="15min")
+        self.assertEqual(len(out), 96 * 365)
+        self.assertEqual(out.index.freqstr, "15min")
+        days = out.iloc[:, 0].to_numpy().reshape(365, 96)
+        tmin = self.daily.iloc[:, 0].to_numpy()
+        tmax = self.daily.iloc[:, 1].to_numpy()
+        # The course reaches the maximum and the minimum of each day in a
+        # slot, and only falls below the minimum towards a colder next day.
+        np.testing.assert_allclose(days.max(axis=1), tmax)
+        np.testing.assert_allclose(
+            np.abs(days - tmin[:, np.newaxis]).min(axis=1), 0.0, atol=1e-12
+        )
+
+    def test_sine_mean_15min(self):
+        out = self._temperature("sine_mean", target_freq="15min")
+        np.testing.assert_allclose(
+            out.iloc[:, 0].to_numpy().reshape(365, 96).mean(axis=1),
+            self.daily.mean(axis=1).to_numpy(),
+        )
+
+    def test_hourly_default(self):
+        hourly = self._temperature("sine_min_max")
+        explicit = self._temperature("sine_min_max", target_freq="h")
+        assert_frame_equal(explicit, hourly, check_freq=False)
+
+
+class TestMelodist(unittest.TestCase):
+    def setUp(self):
+        daily = pd.read_csv(
+            "tests/data_temperature_gainesville.csv", index_col=0, parse_dates=True
+        ).loc["2001"]
+        self.daily = pd.DataFrame({"tmin": daily.iloc[:, 0], "tmax": daily.iloc[:, 1]})
+        self.daily["temp"] = self.daily.mean(axis=1)
+        self.sun_times = {
+            "fix": pd.DataFrame(
+                {"sunrise": [7], "sunnoon": [12], "sunset": [19], "daylength": [12]},
+                index=[1],
+            ),
+            "sun_loc": cached_sun_times(self.daily.index, 29.65, -82.32),
+        }
+
+    def test_24_slots(self):
+        # With 24 slots the slot version is the same as melodist.
+        for method in ("sine_min_max", "sine_mean"):
+            for min_max_time, sun_times in self.sun_times.items():
+                with self.subTest(method=method, min_max_time=min_max_time):
+                    out = temperature.disaggregate_temperature(
+                        self.daily,
+                        method=method,
+                        min_max_time=min_max_time,
+                        sun_times=sun_times,
+                        slots=24,
+                    )
+                    expected = disaggregate_temperature(
+                        self.daily,
+                        method=method,
+                        min_max_time=min_max_time,
+                        sun_times=sun_times,
+                    )
+                    self.assertEqual(out.shape, (365, 24))
+                    np.testing.assert_allclose(
+                        out.reshape(-1), expected.to_numpy(), atol=1e-12
+                    )
+
+
+class TestSunLocShift(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.input_ts = os.path.join(cls.tmpdir.name, "stations.csv")
+        daily = pd.read_csv(
+            "tests/data_temperature_gainesville.csv", index_col=0, parse_dates=True
+        ).loc["2001-06-01":"2001-08-31"]
+        # The same temperatures at two stations in one time zone but with
+        # different sun noons.
+        pd.DataFrame(
+            {
+                "a_tmin": daily.iloc[:, 0],
+                "a_tmax": daily.iloc[:, 1],
+                "b_tmin": daily.iloc[:, 0],
+                "b_tmax": daily.iloc[:, 1],
+            }
+        ).to_csv(cls.input_ts, index_label="Datetime")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+    def _temperature(self, lon, temp_min_col=(1, 3), temp_max_col=(2, 4), **kwds):
+        out = mettoolbox.disaggregate.temperature(
+            "sine_min_max",
+            "degC",
+            min_max_time="sun_loc_shift",
+            temp_min_col=list(temp_min_col),
+            temp_max_col=list(temp_max_col),
+            lat=29.65,
+            lon=lon,
+            hourly="tests/data_obs_hourly_temp.csv",
+            input_ts=self.input_ts,
+            **kwds,
+        )
+        return out.to_numpy(dtype=float)
+
+    def test_hourly_location(self):
+        hourly = {"hourly_lat": 51.95, "hourly_lon": 8.86}
+        ab = self._temperature([-82.32, -75.0], **hourly)
+        ba = self._temperature([-75.0, -82.32], **hourly)
+        self.assertFalse(np.allclose(ab[:, 0], ab[:, 1]))
+        # The shift does not depend on the order of the stations.
+        np.testing.assert_allclose(ab, ba[:, ::-1])
+        one = self._temperature(-75.0, temp_min_col=[3], temp_max_col=[4], **hourly)
+        np.testing.assert_allclose(ab[:, 1], one[:, 0])
+
+    def test_hourly_location_default(self):
+        np.testing.assert_allclose(
+            self._temperature([-82.32, -75.0]),
+            self._temperature([-82.32, -75.0], hourly_lat=29.65, hourly_lon=-82.32),
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,73 @@
+"""
+test_dtype
+----------------------------------
+
+Tests for the float32 mode of `mettoolbox`.
+
+The inputs are converted to float32, which holds about seven significant
+digits, while the solar geometry stays float64, so the float32 results have
+to agree with the float64 results to a relative tolerance of 1e-5.  That is
+two orders of magnitude below the three or four significant digits of
+meteorological observations.
+"""
+
+import unittest
+
+import numpy as np
+
+import mettoolbox
+from mettoolbox import mettoolbox as mtb
+
+RTOL = 1e-5
+
+
+class TestDtype(unittest.TestCase):
+    def setUp(self):
+        self.input_ts = "tests/data_temperature_gainesville.csv"
+
+    def _compare(self, func):
+        mettoolbox.set_dtype("float64")
+        expected = func()
+        mettoolbox.set_dtype("float32")
+        out = func()
+        self.assertEqual(list(out.columns), list(expected.columns))
+        self.assertTrue(all(dtype.itemsize == 4 for dtype in out.dtypes))
+        np.testing.assert_allclose(
+            out.to_numpy(dtype=float), expected.to_numpy(dtype=float), rtol=RTOL
+        )
+
+    def test_pet_hargreaves(self):
+        self._compare(
+            lambda: mtb.pet.hargreaves(
+                29.65,
+                f"{self.input_ts},1",
+                f"{self.input_ts},2",
+                "degC",
+                print_input=True,
+            )
+        )
+
+    def test_disaggregate_temperature(self):
+        self._compare(
+            lambda: mtb.disaggregate.temperature(
+                "sine_min_max",
+                ["degC", "degC"],
+                min_max_time="sun_loc",
+                temp_min_col=1,
+                temp_max_col=2,
+                lat=29.65,
+                lon=-82.32,
+                input_ts=self.input_ts,
+            )
+        )
+
+    def test_set_dtype(self):
+        with self.assertRaises(ValueError):
+            mettoolbox.set_dtype("float16")
+
+    def tearDown(self):
+        mettoolbox.set_dtype("float64")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+"""
+test_evaplib
+----------------------------------
+
+Tests of the `evaplib` and `meteolib` functions against their docstring
+examples.
+
+The examples were calculated with a different saturation vapour pressure
+equation than the Arden-Buck equation used now, so the results only have to
+agree to a relative tolerance of 1e-3.
+"""
+
+import unittest
+
+import numpy as np
+
+from mettoolbox import evaplib, meteolib
+
+RTOL = 1e-3
+
+
+class TestMeteolib(unittest.TestCase):
+    def test_es_calc(self):
+        np.testing.assert_allclose(meteolib.es_calc(30.0), 4.245126, rtol=RTOL)
+
+    def test_ea_calc(self):
+        np.testing.assert_allclose(meteolib.ea_calc(25, 60), 1900.0946, rtol=RTOL)
+
+    def test_vpd_calc(self):
+        np.testing.assert_allclose(meteolib.vpd_calc(30, 60), 1697.0904, rtol=RTOL)
+        np.testing.assert_allclose(
+            meteolib.vpd_calc([20, 25], [50, 100]), [1168.5401, 0.0], rtol=RTOL
+        )
+
+    def test_cp_calc(self):
+        np.testing.assert_allclose(
+            meteolib.cp_calc(25, 60, 101300), 1014.0749, rtol=RTOL
+        )
+
+    def test_gamma_calc(self):
+        np.testing.assert_allclose(
+            meteolib.gamma_calc([10, 20, 30], [10, 20, 30], [100000, 101000, 102000]),
+            [65.255188, 66.656958, 68.242393],
+            rtol=RTOL,
+        )
+
+    def test_rho_calc(self):
+        np.testing.assert_allclose(
+            meteolib.rho_calc(10, 50, 101300), 1.2431927, rtol=RTOL
+        )
+
+    def test_vapour_calc(self):
+        airtemp = np.array([-5.0, 10.0, 20.0, 30.0])
+        rh = np.array([90.0, 10.0, 20.0, 30.0])
+        airpress = np.array([99000.0, 100000.0, 101000.0, 102000.0])
+        es, delta, gamma, ea, vpd = meteolib.vapour_calc(airtemp, rh, airpress)
+        np.testing.assert_allclose(es, meteolib.es_calc(airtemp))
+        np.testing.assert_allclose(delta, meteolib.Delta_calc(airtemp))
+        np.testing.assert_allclose(gamma, meteolib.gamma_calc(airtemp, rh, airpress))
+        np.testing.assert_allclose(ea, meteolib.ea_calc(airtemp, rh))
+        np.testing.assert_allclose(vpd, meteolib.vpd_calc(airtemp, rh))
+
+
+class TestEvaplib(unittest.TestCase):
+    def test_E0(self):
+        args = (20.67, 67.0, 101300.0, 22600000.0, 42000000.0, 3.2)
+        np.testing.assert_allclose(evaplib.E0(*args), 6.6029209, rtol=RTOL)
+        np.testing.assert_allclose(evaplib.E0(*args, alpha=0.18), 5.9664248, rtol=RTOL)
+        np.testing.assert_allclose(evaplib.E0(*args, Z=250.0), 6.6135588, rtol=RTOL)
+        np.testing.assert_allclose(
+            evaplib.E0(*args, 0.18, 1000.0), 6.0081476, rtol=RTOL
+        )
+
+    def test_ET0pm(self):
+        np.testing.assert_allclose(
+            evaplib.ET0pm(20.67, 67.0, 101300.0, 22600000.0, 42000000.0, 3.2),
+            4.7235350,
+            rtol=RTOL,
+        )
+
+    def test_Em(self):
+        np.testing.assert_allclose(
+            evaplib.Em(21.65, 67.0, 101300.0, 24200000.0), 4.5038305, rtol=RTOL
+        )
+
+    def test_Ept(self):
+        np.testing.assert_allclose(
+            evaplib.Ept(21.65, 67.0, 101300.0, 18200000.0, 600000.0),
+            6.3494561,
+            rtol=RTOL,
+        )
+
+    def test_Epm(self):
+        np.testing.assert_allclose(
+            evaplib.Epm(21.67, 67.0, 1013.0, 14100000.0, 500000.0, 104.0, 70.0),
+            3.2433411,
+            rtol=RTOL,
+        )
+
+
+class TestGash79(unittest.TestCase):
+    def test_saturating_storms(self):
+        # Storms larger than both the 1.85 mm that saturates the canopy and
+        # the St / pt = 10 mm that saturates the trunks.
+        for rain, tf, sf, ei in (
+            (12.4, 9.1258854, 0.048, 3.2261146),
+            (60.0, 48.6338854, 1.0, 10.3661146),
+        ):
+            out = evaplib.gash79(rain, 0.15, 1.3, 0.2, 0.2, 0.02)
+            np.testing.assert_allclose(out, (rain, tf, sf, ei))
+            self.assertAlmostEqual(out[1] + out[2] + out[3], rain)
+
+    def test_small_storms(self):
+        # 1 mm does not saturate the canopy, 5 mm saturates the canopy but
+        # not the trunks, so all of the trunk rainfall evaporates.
+        _, tf, sf, ei = evaplib.gash79(
+            np.array([0.0, 1.0, 5.0]), 0.15, 1.3, 0.2, 0.2, 0.02
+        )
+        np.testing.assert_allclose(sf, 0.0)
+        np.testing.assert_allclose(ei, [0.0, 0.8, 2.0161146])
+        np.testing.assert_allclose(tf + ei, [0.0, 1.0, 5.0])
+
+    def test_missing(self):
+        rain = np.array([[1.0, np.nan], [np.nan, 60.0]])
+        _, tf, sf, ei = evaplib.gash79(rain, [0.15, 0.12], 1.3, 0.2, 0.2, 0.02)
+        for out in (tf, sf, ei):
+            np.testing.assert_array_equal(np.isnan(out), np.isnan(rain))
+
+
+if __name__ == "__main__":
+    unittest.main()
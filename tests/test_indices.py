@@ -0,0 +1,88 @@
+"""
+test_indices
+----------------------------------
+
+Tests of the `indices` functions on the Gainesville daily precipitation and
+Hargreaves potential evaporation.
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from mettoolbox import mettoolbox as mtb
+
+INPUT_TS = "tests/combined.csv"
+
+
+class TestSpei(unittest.TestCase):
+    def test_n_jobs(self):
+        # Forty years give every day of the year enough values to fit, and the
+        # Pearson III distribution fits the negative values of P - PET.
+        kwds = {
+            "start_date": "1980-01-01",
+            "end_date": "2019-12-31",
+            "dist_type": "pe3",
+        }
+        for scale, n_jobs in ((1, 3), (3, 4)):
+            sequential = mtb.indices.spei(
+                f"{INPUT_TS},1", f"{INPUT_TS},2", ["mm", "mm"], scale=scale, **kwds
+            )
+            index = sequential.iloc[:, -1]
+            self.assertGreater(np.isfinite(index).mean(), 0.99)
+            self.assertTrue(sequential["date"].is_monotonic_increasing)
+            parallel = mtb.indices.spei(
+                f"{INPUT_TS},1",
+                f"{INPUT_TS},2",
+                ["mm", "mm"],
+                scale=scale,
+                n_jobs=n_jobs,
+                **kwds,
+            )
+            # A day of the year split across workers, or rows put back out of
+            # order, would change the fitted values or their dates.
+            pd.testing.assert_frame_equal(parallel, sequential)
+            np.testing.assert_array_equal(
+                parallel.iloc[:, -1].to_numpy()[np.isfinite(index)],
+                index.to_numpy()[np.isfinite(index)],
+            )
+
+
+class TestPe(unittest.TestCase):
+    def test_windows(self):
+        # Several integer and offset windows from one cumulative sum agree
+        # with a pandas rolling sum of each window.
+        windows = [30, "7D", 90]
+        out = mtb.indices.pe(
+            f"{INPUT_TS},1", f"{INPUT_TS},2", ["mm", "mm"], window=windows
+        )
+        self.assertEqual(len(out.columns), 3)
+        data = pd.read_csv(INPUT_TS, index_col=0, parse_dates=True)
+        pe_data = data.iloc[:, 0] - data.iloc[:, 1]
+        for column, window in zip(out.columns, windows):
+            self.assertTrue(str(column).split(":")[0].endswith(f"_{window}"))
+            expected = pe_data.rolling(window).sum().to_numpy()
+            np.testing.assert_allclose(out[column].to_numpy(), expected, atol=1e-9)
+            self.assertTrue(np.isfinite(expected).any())
+
+    def test_min_periods(self):
+        out = mtb.indices.pe(
+            f"{INPUT_TS},1",
+            f"{INPUT_TS},2",
+            ["mm", "mm"],
+            window="30,10D",
+            min_periods=5,
+            closed="both",
+        )
+        data = pd.read_csv(INPUT_TS, index_col=0, parse_dates=True)
+        pe_data = data.iloc[:, 0] - data.iloc[:, 1]
+        for column, window in zip(out.columns, [30, "10D"]):
+            expected = pe_data.rolling(window, min_periods=5, closed="both").sum()
+            np.testing.assert_allclose(
+                out[column].to_numpy(), expected.to_numpy(), atol=1e-9
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
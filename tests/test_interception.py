@@ -0,0 +1,53 @@
+"""
+test_interception
+----------------------------------
+
+Tests of the `interception gash` command.
+"""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from mettoolbox import mettoolbox as mtb
+
+
+class TestGash(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.input_ts = os.path.join(self.tmpdir.name, "rain.csv")
+        pd.DataFrame(
+            {"north": [12.4, np.nan, 0.0], "south": [60.0, 1.0, np.nan]},
+            index=pd.date_range("2020-01-01", periods=3, freq="D"),
+        ).to_csv(self.input_ts, index_label="Datetime")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_gash(self):
+        out = mtb.interception.gash(
+            0.15, 1.3, 0.2, 0.2, 0.02, "mm", input_ts=self.input_ts
+        )
+        self.assertEqual(
+            list(out.columns),
+            [
+                f"{station}_{variable}:mm:"
+                for variable in ("interception", "throughfall", "stemflow")
+                for station in ("north", "south")
+            ],
+        )
+        np.testing.assert_allclose(
+            out.iloc[0], [3.2261146, 10.3661146, 9.1258854, 48.6338854, 0.048, 1.0]
+        )
+        # Missing rainfall gives missing interception, not zero.
+        self.assertTrue(out.iloc[1, [0, 2, 4]].isna().all())
+        self.assertTrue(out.iloc[2, [1, 3, 5]].isna().all())
+        np.testing.assert_allclose(out.iloc[1, [1, 3, 5]], [0.8, 0.2, 0.0])
+        np.testing.assert_allclose(out.iloc[2, [0, 2, 4]], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+"""
+test_pet
+----------------------------------
+
+Smoke tests of the temperature based `pet` functions, and reference value
+tests of the station commands against the `evaplib` docstring examples.
+"""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from mettoolbox import evaplib, meteolib
+from mettoolbox import mettoolbox as mtb
+
+TEMPERATURE = "tests/data_temperature_gainesville.csv"
+OBSERVED = "tests/data_obs_daily.csv"
+
+
+class TestPet(unittest.TestCase):
+    def _check(self, out, column, length=14245):
+        self.assertEqual(list(out.columns), [column])
+        self.assertEqual(len(out), length)
+        values = out.to_numpy(dtype=float, na_value=np.nan)
+        self.assertTrue(np.isfinite(values).any())
+        self.assertTrue((values[np.isfinite(values)] > -1).all())
+
+    def test_hamon(self):
+        out = mtb.pet.hamon(
+            29.65,
+            "degC",
+            temp_min_col=f"{TEMPERATURE},1",
+            temp_max_col=f"{TEMPERATURE},2",
+        )
+        self._check(out, "pet_hamon:mm:")
+
+    def test_romanenko(self):
+        out = mtb.pet.romanenko(
+            "degK",
+            temp_min_col=f"{OBSERVED},2",
+            temp_max_col=f"{OBSERVED},3",
+            rh_col=f"{OBSERVED},7",
+        )
+        self._check(out, "pet_romanenko:mm:", length=92)
+
+    def test_linacre(self):
+        out = mtb.pet.linacre(
+            29.65,
+            30.0,
+            "degC",
+            temp_min_col=f"{TEMPERATURE},1",
+            temp_max_col=f"{TEMPERATURE},2",
+        )
+        self._check(out, "pet_linacre:mm:")
+
+    def test_hargreaves(self):
+        out = mtb.pet.hargreaves(29.65, f"{TEMPERATURE},1", f"{TEMPERATURE},2", "degC")
+        self._check(out, "pet_hargreaves:mm:")
+
+    def test_oudin_form(self):
+        out = mtb.pet.oudin_form(
+            29.65, f"{TEMPERATURE},1", f"{TEMPERATURE},2", source_units="degC"
+        )
+        self._check(out, "pet_oudin:mm:")
+
+    def test_allen(self):
+        out = mtb.pet.allen(29.65, f"{TEMPERATURE},1", f"{TEMPERATURE},2", "degC")
+        self._check(out, "pet_allen:mm:")
+
+
+class TestPetStations(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.input_ts = os.path.join(cls.tmpdir.name, "met.csv")
+        cls.index = pd.date_range("2020-06-20", periods=3, freq="D")
+        pd.DataFrame(
+            {
+                "north_temp": 20.67,
+                "north_srad": 22.6,
+                "south_temp": 21.65,
+                "south_srad": 24.2,
+                "rh": 67.0,
+                "press": 1013.0,
+                "wind": 3.2,
+                "net_rad": 18.2,
+                "soil_heat": 0.6,
+                "epm_temp": 21.67,
+                "epm_net_rad": 14.1,
+                "epm_soil_heat": 0.5,
+            },
+            index=cls.index,
+        ).to_csv(cls.input_ts, index_label="Datetime")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+    def test_e0(self):
+        out = mtb.pet.e0(
+            [52.1, 51.4],
+            "1,3",
+            5,
+            6,
+            "2,4",
+            7,
+            source_units=["degC", "degC", "percent", "hPa", "MJ/m^2", "MJ/m^2", "m/s"],
+            input_ts=self.input_ts,
+        )
+        self.assertEqual(
+            list(out.columns), ["north_temp_pet_e0:mm:", "south_temp_pet_e0:mm:"]
+        )
+        doy = self.index.dayofyear.to_numpy()
+        np.testing.assert_allclose(
+            out.iloc[:, 0],
+            evaplib.E0(
+                20.67, 67.0, 101300.0, 22.6e6, meteolib.sun_NR(doy, 52.1)[1], 3.2
+            ),
+            rtol=1e-6,
+        )
+        # Near the summer solstice at 52 N the extraterrestrial radiation is
+        # close to the 42 MJ/m^2 of the docstring example.
+        np.testing.assert_allclose(out.iloc[:, 0], 6.6029209, rtol=5e-3)
+
+    def test_em(self):
+        out = mtb.pet.em(
+            3,
+            5,
+            6,
+            4,
+            source_units=["degC", "percent", "hPa", "MJ/m^2"],
+            input_ts=self.input_ts,
+        )
+        self.assertEqual(list(out.columns), ["pet_em:mm:"])
+        np.testing.assert_allclose(out.iloc[:, 0], 4.5038305, rtol=1e-3)
+
+    def test_ept(self):
+        out = mtb.pet.ept(
+            3,
+            5,
+            6,
+            8,
+            soil_heat_col=9,
+            source_units=["degC", "percent", "hPa", "MJ/m^2", "MJ/m^2"],
+            input_ts=self.input_ts,
+        )
+        self.assertEqual(list(out.columns), ["pet_ept:mm:"])
+        np.testing.assert_allclose(out.iloc[:, 0], 6.3494561, rtol=1e-3)
+
+    def test_epm(self):
+        out = mtb.pet.epm(
+            10,
+            5,
+            6,
+            11,
+            104.0,
+            70.0,
+            soil_heat_col=12,
+            source_units=["degC", "percent", "hPa", "MJ/m^2", "MJ/m^2"],
+            input_ts=self.input_ts,
+        )
+        self.assertEqual(list(out.columns), ["pet_epm:mm:"])
+        np.testing.assert_allclose(out.iloc[:, 0], 3.2433411, rtol=1e-3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+test_ret
+----------------------------------
+
+Tests of `ret.asce_hourly` against the hourly worked example of FAO-56
+(Allen et al., 1998, example 19) for N'Diaye, Senegal, on 1 October, at
+16.217 N, 16.25 W, 8 m elevation, in a time zone centred on 15 W.
+
+The example uses a surface resistance of 70 s/m day and night.  The value
+with the ASCE standardized Cd coefficients is calculated with the
+intermediate values of the example.  The night hour only has to be close to
+zero, since the net longwave radiation of the example uses the Rs/Rso ratio
+of the hours before sunset, which two input hours cannot reproduce.
+"""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from mettoolbox import mettoolbox as mtb
+from mettoolbox.meteo_utils import extraterrestrial_r_hour
+
+
+class TestAsceHourly(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.input_ts = os.path.join(cls.tmpdir.name, "hourly.csv")
+        # The index is the end of the hour, so 02:00-03:00 and 14:00-15:00.
+        cls.index = pd.DatetimeIndex(["2021-10-01 03:00", "2021-10-01 15:00"])
+        pd.DataFrame(
+            {
+                "temp": [28.0, 38.0],
+                "rh": [90.0, 52.0],
+                "srad": [0.0, 2.450],
+                "wind": [1.9, 3.3],
+            },
+            index=cls.index,
+        ).to_csv(cls.input_ts, index_label="Datetime")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+    def _asce_hourly(self, **kwds):
+        return mtb.ret.asce_hourly(
+            16.217,
+            -16.25,
+            8.0,
+            1,
+            2,
+            3,
+            4,
+            source_units=["degC", "percent", "MJ/m^2/hr", "m/s"],
+            tz=-1,
+            input_ts=self.input_ts,
+            **kwds,
+        )
+
+    def test_extraterrestrial_radiation(self):
+        ra = extraterrestrial_r_hour(self.index, np.deg2rad(16.217), 15.0, 16.25)
+        np.testing.assert_allclose(ra, [0.0, 3.543], atol=1e-3)
+
+    def test_fao56_example(self):
+        out = self._asce_hourly(
+            surface_resistance_day=70.0, surface_resistance_night=70.0
+        )
+        self.assertLess(abs(out.iloc[0, 0]), 5e-3)
+        # Published as 0.63, 0.628 with the intermediate values of the example.
+        np.testing.assert_allclose(out.iloc[1, 0], 0.628, atol=1e-3)
+
+    def test_eto(self):
+        out = self._asce_hourly()
+        self.assertEqual(list(out.columns), ["ret_asce_eto:mm:"])
+        self.assertLess(abs(out.iloc[0, 0]), 5e-3)
+        np.testing.assert_allclose(out.iloc[1, 0], 0.656, atol=1e-3)
+
+
+if __name__ == "__main__":
+    unittest.main()
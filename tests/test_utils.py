@@ -0,0 +1,100 @@
+"""
+test_utils
+----------------------------------
+
+Tests for the helpers in `mettoolbox.utils`.
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from mettoolbox import utils
+
+
+class TestConvertUnits(unittest.TestCase):
+    def setUp(self):
+        self.tsd = pd.DataFrame(
+            {"a:degF": [32.0, 212.0], "b:mm": [25.4, 50.8]},
+            index=pd.date_range("2000-01-01", periods=2, freq="D"),
+        )
+
+    def test_convert(self):
+        out = utils._convert_units(self.tsd, None, ["degC", "inch"])
+        self.assertEqual(list(out.columns), ["a:degC", "b:inch"])
+        np.testing.assert_allclose(
+            out.to_numpy(), [[0.0, 1.0], [100.0, 2.0]], atol=1e-9
+        )
+
+    def test_input_unchanged(self):
+        expected = self.tsd.copy()
+        utils._convert_units(self.tsd, None, ["degC", "mm"])
+        assert_frame_equal(self.tsd, expected)
+
+    def test_copy_on_write(self):
+        with pd.option_context("mode.copy_on_write", True):
+            tsd = self.tsd.copy()
+            out = utils._convert_units(tsd, None, ["degC", "mm"])
+            np.testing.assert_allclose(out.iloc[:, 0], [0.0, 100.0], atol=1e-9)
+            self.assertEqual(tsd.iloc[0, 0], 32.0)
+
+
+class TestDailyUniforms(unittest.TestCase):
+    def setUp(self):
+        self.entropy = np.random.SeedSequence(42).entropy
+        self.days = pd.date_range("2000-12-30", periods=4, freq="D")
+
+    def _draws(self, stations):
+        return utils._daily_uniforms(self.entropy, stations, self.days, shape=(3,))
+
+    def test_same_label(self):
+        # The same column from two files gets two different streams.
+        out = self._draws(["prcp:mm", "prcp:mm"])
+        self.assertFalse(np.array_equal(out[0], out[1]))
+
+    def test_full_label(self):
+        out = self._draws(["prcp:mm", "prcp:in"])
+        self.assertFalse(np.array_equal(out[0], out[1]))
+
+    def test_station_chunks(self):
+        whole = self._draws(["a:mm", "prcp:mm", "b:mm", "prcp:mm"])
+        np.testing.assert_array_equal(self._draws(["b:mm"])[0], whole[2])
+        np.testing.assert_array_equal(
+            self._draws(["prcp:mm", "prcp:mm"]), whole[[1, 3]]
+        )
+
+    def test_date_chunks(self):
+        whole = self._draws(["a:mm"])
+        np.testing.assert_array_equal(
+            utils._daily_uniforms(self.entropy, ["a:mm"], self.days[2:], shape=(3,)),
+            whole[:, 2:],
+        )
+
+
+class TestPotentialRadiation(unittest.TestCase):
+    def test_solar_noon(self):
+        # Solar noon in local standard time from the longitude, the time zone
+        # meridian, and the seasonal correction of FAO-56 equation 32.
+        for lat, lon, tz, day in (
+            (29.65, -82.32, -5, "2001-06-15"),
+            (52.1, 5.18, 1, "2001-03-21"),
+            (-33.9, 18.4, 2, "2001-12-01"),
+            (40.0, -105.0, -7, "2001-11-03"),
+        ):
+            index = pd.date_range(f"{day} 01:00", periods=24, freq="h")
+            rad = utils.potential_radiation(index, lat, lon, tz).to_numpy()
+            b = 2 * np.pi * (index[0].dayofyear - 81) / 364
+            sc = 0.1645 * np.sin(2 * b) - 0.1255 * np.cos(b) - 0.025 * np.sin(b)
+            noon = 12 + tz - lon / 15 - sc
+
+            # The index is the end of each hour.
+            middle = np.arange(24) + 0.5
+            self.assertEqual(int(middle[rad.argmax()]), int(noon))
+            self.assertAlmostEqual((middle * rad).sum() / rad.sum(), noon, delta=1 / 60)
+            self.assertEqual(rad[0], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()